@@ -0,0 +1,113 @@
+"""Benchmark large JSON responses: response-model path vs FastJSONResponse.
+
+Usage:
+    python benchmarks/json_responses.py [--segments 10000] [--runs 30]
+
+Serves the same subtitle payload (shaped like GET /api/subtitles/{id})
+from three routes returning the same envelope:
+
+- ApiResponse through the response model, as the read endpoints used to;
+- the same with JSONResponse rendering, the path FastAPI releases before
+  0.130 take for every route (validate, jsonable_encoder, json.dumps);
+- FastJSONResponse returned directly, as the read endpoints do now.
+
+Requests go through the ASGI stack in process, without compression,
+and the median and best latency of --runs requests are reported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any
+
+import httpx
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+
+from ytb_dual_subtitles.api import responses
+from ytb_dual_subtitles.api.responses import FastJSONResponse
+from ytb_dual_subtitles.models import ApiResponse
+
+
+def make_payload(count: int) -> dict[str, Any]:
+    """Build a dual subtitle payload with ``count`` segments."""
+    return {
+        "video_id": "1",
+        "segments": [
+            {
+                "id": str(i),
+                "video_id": "1",
+                "start_time": i * 2.0,
+                "end_time": i * 2.0 + 1.9,
+                "text_english": f"auto caption line number {i} with a few more words",
+                "text_chinese": f"第 {i} 行自动字幕，再多几个字",
+                "sequence": i,
+            }
+            for i in range(1, count + 1)
+        ],
+        "language_original": "en",
+        "language_translated": "zh-CN",
+        "next_cursor": None,
+    }
+
+
+def make_app(payload: dict[str, Any]) -> FastAPI:
+    """App with one route per serialization path."""
+    app = FastAPI()
+
+    @app.get("/model", response_model=ApiResponse[dict[str, Any]])
+    async def model_path() -> ApiResponse[dict[str, Any]]:
+        return ApiResponse.success_response(data=payload)
+
+    @app.get("/encoder", response_model=ApiResponse[dict[str, Any]], response_class=JSONResponse)
+    async def encoder_path() -> ApiResponse[dict[str, Any]]:
+        return ApiResponse.success_response(data=payload)
+
+    @app.get("/fast", response_model=ApiResponse[dict[str, Any]], response_class=FastJSONResponse)
+    async def fast_path() -> FastJSONResponse:
+        return FastJSONResponse(ApiResponse.success_response(data=payload))
+
+    return app
+
+
+async def measure(client: httpx.AsyncClient, path: str, runs: int) -> tuple[float, float, int]:
+    """Request a path repeatedly; return (median seconds, best seconds, body bytes)."""
+    response = await client.get(path)  # warm-up
+    timings = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        response = await client.get(path)
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings), min(timings), len(response.content)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", type=int, default=10000, help="segments in the payload")
+    parser.add_argument("--runs", type=int, default=30, help="requests per path")
+    args = parser.parse_args()
+
+    app = make_app(make_payload(args.segments))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        bodies = [(await client.get(path)).json() for path in ("/model", "/encoder", "/fast")]
+        assert all(body == bodies[0] for body in bodies), "all paths must return the same envelope"
+
+        renderer = "orjson" if responses.orjson is not None else "json"
+        print(f"{args.segments} segments, {args.runs} requests per path")
+        paths = (
+            ("response model", "/model"),
+            ("jsonable_encoder", "/encoder"),
+            (f"fast ({renderer})", "/fast"),
+        )
+        for label, path in paths:
+            median, best, size = await measure(client, path, args.runs)
+            print(f"  {label:>16}: median {median * 1000:7.2f} ms, "
+                  f"best {best * 1000:7.2f} ms, {size / 1024:.0f} KB")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,118 @@
+"""Benchmark subtitle track storage: one row per cue vs packed columnar track.
+
+Usage:
+    python benchmarks/packed_tracks.py [--segments 12000] [--tracks 20] [--runs 5]
+
+Stores the same tracks in two fresh SQLite databases, one per format, and
+reports the database size after VACUUM plus the time to read one whole
+track back (best of --runs).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from ytb_dual_subtitles.models.video import Base, Subtitle, SubtitleSegment, Video
+from ytb_dual_subtitles.services.subtitle_data_service import SubtitleDataService
+
+WORDS = "the a we you this that is was going to really know like just think about people".split()
+
+
+def make_segments(count: int, seed: int) -> list[dict[str, object]]:
+    """Build auto-caption sized segments with varied text."""
+    rng = random.Random(seed)
+    return [
+        {
+            'sequence': i,
+            'start_time': round(i * 2.0 + rng.random() * 0.5, 3),
+            'end_time': round(i * 2.0 + 1.9, 3),
+            'text': " ".join(rng.choice(WORDS) for _ in range(rng.randint(4, 10))),
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+async def read_rows(session, subtitle_id: int) -> int:
+    """Read a row-stored track the way the dual track rebuild does."""
+    result = await session.execute(
+        select(
+            SubtitleSegment.id,
+            SubtitleSegment.sequence,
+            SubtitleSegment.start_time,
+            SubtitleSegment.end_time,
+            SubtitleSegment.text,
+        )
+        .where(SubtitleSegment.subtitle_id == subtitle_id)
+        .order_by(SubtitleSegment.sequence)
+    )
+    return len(result.all())
+
+
+async def read_packed(session, subtitle_id: int) -> int:
+    """Read a packed track into its arrays (no per-cue objects)."""
+    track = await SubtitleDataService(session).load_packed_track(subtitle_id)
+    return len(track)
+
+
+async def run(storage: str, tracks: list[list[dict[str, object]]], runs: int) -> tuple[int, float]:
+    """Store all tracks in one format; return (database bytes, best read seconds)."""
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(tmp) / "bench.db"
+        engine = create_async_engine(f"sqlite+aiosqlite:///{db_path}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as session:
+            video = Video(youtube_id="benchmark01", title="benchmark")
+            session.add(video)
+            await session.flush()
+
+            subtitle_ids = []
+            for n, segments in enumerate(tracks):
+                subtitle = Subtitle(video_id=video.id, language=f"l{n}")
+                session.add(subtitle)
+                await session.flush()
+                await SubtitleDataService(session).save_track(subtitle.id, segments, storage=storage)
+                subtitle_ids.append(subtitle.id)
+
+            read = read_packed if storage == "packed" else read_rows
+            best = float("inf")
+            for _ in range(runs):
+                started = time.perf_counter()
+                await read(session, subtitle_ids[len(subtitle_ids) // 2])
+                best = min(best, time.perf_counter() - started)
+
+        async with engine.connect() as conn:
+            await conn.execute(text("VACUUM"))
+        await engine.dispose()
+
+        return os.path.getsize(db_path), best
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", type=int, default=12000, help="cues per track")
+    parser.add_argument("--tracks", type=int, default=20, help="tracks stored")
+    parser.add_argument("--runs", type=int, default=5, help="reads per format (best is reported)")
+    args = parser.parse_args()
+
+    tracks = [make_segments(args.segments, seed) for seed in range(args.tracks)]
+    print(f"{args.tracks} tracks x {args.segments} cues")
+    for storage in ("rows", "packed"):
+        size, seconds = await run(storage, tracks, args.runs)
+        print(f"  {storage:>6}: {size / 1024 / 1024:8.2f} MB on disk, "
+              f"{seconds * 1000:8.2f} ms to read one track")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
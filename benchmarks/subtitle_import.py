@@ -0,0 +1,89 @@
+"""Benchmark subtitle segment import: per-row ORM adds vs bulk executemany.
+
+Usage:
+    python benchmarks/subtitle_import.py [--segments 12000] [--runs 3]
+
+Each run imports one subtitle track into a fresh SQLite database file and
+reports rows per second for both paths.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from ytb_dual_subtitles.models.video import Base, Subtitle, SubtitleSegment, Video
+from ytb_dual_subtitles.services.subtitle_data_service import SubtitleDataService
+
+
+def make_segments(count: int) -> list[dict[str, object]]:
+    """Build auto-caption sized segments (about two seconds each)."""
+    return [
+        {
+            'sequence': i,
+            'start_time': i * 2.0,
+            'end_time': i * 2.0 + 1.9,
+            'text': f"auto caption line number {i} with a few more words",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+async def import_orm(session, subtitle_id: int, segments: list[dict[str, object]]) -> None:
+    """Previous import path: one ORM object and session.add per cue."""
+    batch_size = 100
+    for i in range(0, len(segments), batch_size):
+        for seg in segments[i:i + batch_size]:
+            session.add(SubtitleSegment(subtitle_id=subtitle_id, **seg))
+    await session.commit()
+
+
+async def import_bulk(session, subtitle_id: int, segments: list[dict[str, object]]) -> None:
+    """Bulk import path used by DownloadManager._import_subtitles."""
+    await SubtitleDataService(session).batch_insert_subtitle_segments(subtitle_id, segments)
+
+
+async def run_once(import_func, segments: list[dict[str, object]]) -> float:
+    """Import one track into a fresh database and return rows per second."""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_async_engine(f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}")
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as session:
+            video = Video(youtube_id="benchmark01", title="benchmark")
+            session.add(video)
+            await session.flush()
+            subtitle = Subtitle(video_id=video.id, language="en")
+            session.add(subtitle)
+            await session.commit()
+
+            started = time.perf_counter()
+            await import_func(session, subtitle.id, segments)
+            elapsed = time.perf_counter() - started
+
+        await engine.dispose()
+
+    return len(segments) / elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", type=int, default=12000, help="cues per track")
+    parser.add_argument("--runs", type=int, default=3, help="runs per path (best is reported)")
+    args = parser.parse_args()
+
+    segments = make_segments(args.segments)
+    for name, import_func in (("orm add", import_orm), ("bulk insert", import_bulk)):
+        rates = [await run_once(import_func, segments) for _ in range(args.runs)]
+        print(f"{name:>12}: {max(rates):>10,.0f} rows/s  ({args.segments} segments, best of {args.runs})")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,88 @@
+"""Benchmark bilingual timeline alignment: per-cue scan vs linear sweep.
+
+Usage:
+    python benchmarks/timeline_alignment.py [--cues 10000]
+
+Builds an English and a Chinese track with slightly shifted timings and
+times SubtitleGenerator.generate_bilingual_subtitles against the previous
+matcher, which scanned the whole Chinese track once per English cue.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Any
+
+from ytb_dual_subtitles.core.subtitle_generator import SubtitleGenerator
+
+
+def make_tracks(count: int) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Build two tracks of about 2.5 second cues with jittered timings."""
+    rng = random.Random(42)
+    english, chinese = [], []
+    for i in range(count):
+        start = i * 2.5
+        english.append({
+            'sequence': i + 1,
+            'start_time': start,
+            'end_time': start + 2.3,
+            'text': f"english line {i}",
+        })
+        shift = rng.uniform(-0.4, 0.4)
+        chinese.append({
+            'sequence': i + 1,
+            'start_time': start + shift,
+            'end_time': start + 2.3 + shift,
+            'text': f"中文 {i}",
+        })
+    return english, chinese
+
+
+async def legacy_match(
+    generator: SubtitleGenerator,
+    english: list[dict[str, Any]],
+    chinese: list[dict[str, Any]]
+) -> list[str]:
+    """Previous matcher: first overlapping cue, then sequence, one await per cue."""
+    tolerance = generator.sync_tolerance
+
+    async def find(en_segment: dict[str, Any]) -> str:
+        en_start, en_end = en_segment['start_time'], en_segment['end_time']
+        for zh_segment in chinese:
+            if (en_start - tolerance <= zh_segment['end_time']
+                    and zh_segment['start_time'] - tolerance <= en_end):
+                return zh_segment['text']
+        for zh_segment in chinese:
+            if zh_segment['sequence'] == en_segment['sequence']:
+                return zh_segment['text']
+        return en_segment['text']
+
+    return [await find(en_segment) for en_segment in english]
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cues", type=int, default=10000, help="cues per track")
+    args = parser.parse_args()
+
+    english, chinese = make_tracks(args.cues)
+    generator = SubtitleGenerator()
+
+    started = time.perf_counter()
+    await legacy_match(generator, english, chinese)
+    legacy_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    await generator.generate_bilingual_subtitles(english, chinese)
+    sweep_seconds = time.perf_counter() - started
+
+    print(f"{args.cues} cues per track")
+    print(f"  per-cue scan: {legacy_seconds:8.3f} s")
+    print(f"  linear sweep: {sweep_seconds:8.3f} s  (includes building bilingual segments)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
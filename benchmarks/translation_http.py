@@ -0,0 +1,100 @@
+"""Benchmark translation API calls: session per call vs shared pooled session.
+
+Usage:
+    python benchmarks/translation_http.py [--calls 300] [--latency 0.0]
+
+Starts a local stand-in for the Baidu translate endpoint and sends the
+same sequential one-line requests two ways: opening a new aiohttp session
+per call, as BaiduTranslationService used to, and through the shared
+keep-alive session it uses now. Reports the mean and median latency per
+call. The stub is plain HTTP on localhost, so the saving shown is the TCP
+connection and session setup only; against the real HTTPS endpoint each
+reused connection also skips a TLS handshake and a network round trip.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import aiohttp
+from aiohttp import web
+
+from ytb_dual_subtitles.services.translation_http import close_translation_session
+from ytb_dual_subtitles.services.translation_service import BaiduTranslationService
+
+
+async def start_stub(latency: float) -> tuple[web.AppRunner, str]:
+    """Start a local endpoint answering like the Baidu translate API."""
+    async def translate(request: web.Request) -> web.Response:
+        form = await request.post()
+        if latency:
+            await asyncio.sleep(latency)
+        return web.json_response({
+            'from': form['from'],
+            'to': form['to'],
+            'trans_result': [{'src': line, 'dst': line} for line in form['q'].split('\n')],
+        })
+
+    app = web.Application()
+    app.router.add_post('/translate', translate)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, f"http://127.0.0.1:{port}/translate"
+
+
+async def call_new_session(service: BaiduTranslationService, text: str) -> None:
+    """Previous request path: a new ClientSession for every call."""
+    data = {'q': text, 'from': 'en', 'to': 'zh', 'appid': 'bench', 'salt': '1', 'sign': 'x'}
+    async with aiohttp.ClientSession() as session:
+        async with session.post(service.api_url, data=data, timeout=10) as response:
+            await response.json()
+
+
+async def call_shared_session(service: BaiduTranslationService, text: str) -> None:
+    """Current request path: the shared pooled session."""
+    await service._call_baidu_api(text, 'en', 'zh-CN')
+
+
+async def measure(call, service: BaiduTranslationService, calls: int) -> list[float]:
+    """Time sequential calls; return per-call seconds."""
+    await call(service, "warm up")
+    timings = []
+    for i in range(calls):
+        started = time.perf_counter()
+        await call(service, f"benchmark line {i}")
+        timings.append(time.perf_counter() - started)
+    return timings
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=300, help="sequential calls per path")
+    parser.add_argument("--latency", type=float, default=0.0, help="stub response delay in seconds")
+    args = parser.parse_args()
+
+    runner, url = await start_stub(args.latency)
+    service = BaiduTranslationService(app_id="bench", secret_key="bench", qps=None)
+    service.api_url = url
+    try:
+        print(f"{args.calls} sequential calls, stub latency {args.latency * 1000:.0f} ms")
+        results = {}
+        for label, call in (("new session", call_new_session), ("shared session", call_shared_session)):
+            timings = await measure(call, service, args.calls)
+            results[label] = statistics.mean(timings)
+            print(f"  {label:>14}: mean {results[label] * 1000:6.3f} ms, "
+                  f"median {statistics.median(timings) * 1000:6.3f} ms")
+        saved = results["new session"] - results["shared session"]
+        print(f"  saved per call: {saved * 1000:.3f} ms")
+    finally:
+        await close_translation_session()
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
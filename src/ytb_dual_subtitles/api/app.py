@@ -12,20 +12,32 @@ from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from ytb_dual_subtitles.api.compression import CompressionMiddleware
 from ytb_dual_subtitles.api.routes import downloads, files, player, categories
 from ytb_dual_subtitles.core.database import init_database
 from ytb_dual_subtitles.core.settings import get_settings
+from ytb_dual_subtitles.database.models import get_database_manager
 from ytb_dual_subtitles.models import ApiResponse, ErrorCodes
+from ytb_dual_subtitles.services.translation_http import close_translation_session
+from ytb_dual_subtitles.utils.subtitle_parser import shutdown_parser_pool
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager for startup and shutdown."""
-    # Startup: Initialize database
+    # Startup: Initialize database. The task store creates its tables first so
+    # download_tasks gets its schema rather than the legacy ORM DownloadTask one
+    get_database_manager()
     await init_database()
     print("✅ 数据库初始化完成")
+    download_manager = downloads.get_download_manager()
+    await download_manager.start()
     yield
-    # Shutdown: Cleanup if needed
+    # Shutdown: Persist pending progress and close pooled connections
+    await download_manager.stop()
+    await close_translation_session()
+    shutdown_parser_pool()
+    get_database_manager().close()
     print("🔄 应用关闭")
 
 # Get settings
@@ -56,6 +68,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress JSON and subtitle responses (Brotli if installed, gzip otherwise)
+app.add_middleware(CompressionMiddleware)
+
 # Global exception handlers
 @app.exception_handler(HTTPException)
 async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
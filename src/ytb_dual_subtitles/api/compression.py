@@ -0,0 +1,213 @@
+"""Response compression tuned for JSON payloads.
+
+Subtitle and video list responses are large, repetitive JSON that shrinks
+to a fraction of its size. Clients that accept Brotli get it when the
+optional ``brotli`` package is installed (``pip install .[compression]``);
+everyone else gets gzip. Levels are chosen for dynamic content: gzip 6 and
+Brotli 5 keep most of the size reduction of the maximum levels at a small
+fraction of their CPU cost, and bodies under a kilobyte (errors, small
+envelopes) are sent as is. Media types that are already compressed
+(video, images) and partial content (206 range responses used for video
+seeking) are left alone.
+
+The middleware is self-contained rather than built on starlette's
+``GZipMiddleware``, whose responder internals differ between the starlette
+versions this package supports.
+"""
+
+from __future__ import annotations
+
+import zlib
+from typing import Callable
+
+import anyio.to_thread
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # Optional dependency: fall back to gzip only
+    brotli = None
+
+# Smallest body worth compressing, in bytes
+COMPRESSION_MINIMUM_SIZE = 1024
+
+# zlib level for gzip responses
+GZIP_LEVEL = 6
+
+# Brotli quality for responses (0-11; 11 is meant for static assets)
+BROTLI_QUALITY = 5
+
+# Bodies at least this large are compressed in a worker thread
+THREAD_MINIMUM_SIZE = 128 * 1024
+
+# Content types that are already compressed or must be streamed unbuffered
+EXCLUDED_CONTENT_TYPES = (
+    "video/",
+    "audio/",
+    "image/",
+    "font/woff",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/octet-stream",
+    "text/event-stream",
+)
+
+# Response statuses never compressed (206: byte ranges refer to the identity body)
+EXCLUDED_STATUS_CODES = frozenset({204, 206, 304})
+
+
+def accepts_encoding(accept_encoding: str, encoding: str) -> bool:
+    """Check whether an Accept-Encoding header allows an encoding.
+
+    Args:
+        accept_encoding: Value of the Accept-Encoding header
+        encoding: Content coding, e.g. "br"
+
+    Returns:
+        True if the coding is listed without q=0
+    """
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        if coding.strip().lower() != encoding:
+            continue
+        quality = params.strip().removeprefix("q=")
+        try:
+            return not params or float(quality) > 0
+        except ValueError:
+            return True
+    return False
+
+
+class _Encoder:
+    """Incremental gzip or Brotli encoder for one response body."""
+
+    def __init__(self, encoding: str, compresslevel: int, brotli_quality: int) -> None:
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(mode=brotli.MODE_TEXT, quality=brotli_quality)
+        else:
+            # wbits 31: zlib stream with gzip header and trailer
+            self._compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, 31)
+
+    def encode(self, body: bytes, more_body: bool) -> bytes:
+        """Compress a body chunk; the stream is finished when more_body is False."""
+        if self.encoding == "br":
+            data = self._compressor.process(body)
+            return data + (self._compressor.flush() if more_body else self._compressor.finish())
+        data = self._compressor.compress(body)
+        return data + self._compressor.flush(zlib.Z_SYNC_FLUSH if more_body else zlib.Z_FINISH)
+
+
+class _CompressionResponder:
+    """Compresses one response, streaming bodies included."""
+
+    def __init__(self, app: ASGIApp, minimum_size: int, make_encoder: Callable[[], _Encoder]) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.make_encoder = make_encoder
+        self.send: Send | None = None
+        self.initial_message: Message = {}
+        self.encoder: _Encoder | None = None
+        self.passthrough = False
+        self.started = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        self.send = send
+        await self.app(scope, receive, self.send_with_compression)
+
+    async def send_with_compression(self, message: Message) -> None:
+        message_type = message["type"]
+        if message_type == "http.response.start":
+            # Hold the start message until the first body chunk decides the headers
+            self.initial_message = message
+            headers = Headers(raw=message["headers"])
+            self.passthrough = (
+                message["status"] in EXCLUDED_STATUS_CODES
+                or "content-encoding" in headers
+                or "content-range" in headers
+                or headers.get("content-type", "").startswith(EXCLUDED_CONTENT_TYPES)
+            )
+            return
+
+        if message_type != "http.response.body":
+            # e.g. http.response.pathsend: never compressed
+            await self._start()
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if not self.started:
+            if self.passthrough or (len(body) < self.minimum_size and not more_body):
+                await self._start()
+                await self.send(message)
+                return
+
+            self.encoder = self.make_encoder()
+            headers = MutableHeaders(raw=self.initial_message["headers"])
+            headers.add_vary_header("Accept-Encoding")
+            headers["Content-Encoding"] = self.encoder.encoding
+            if more_body:
+                del headers["Content-Length"]
+            message["body"] = await self._encode(body, more_body)
+            if not more_body:
+                headers["Content-Length"] = str(len(message["body"]))
+            await self._start()
+            await self.send(message)
+            return
+
+        if self.encoder is not None:
+            message["body"] = await self._encode(body, more_body)
+        await self.send(message)
+
+    async def _start(self) -> None:
+        """Send the held start message once."""
+        if not self.started:
+            self.started = True
+            await self.send(self.initial_message)
+
+    async def _encode(self, body: bytes, more_body: bool) -> bytes:
+        if len(body) >= THREAD_MINIMUM_SIZE:
+            # Compressing large bodies inline would block the event loop
+            return await anyio.to_thread.run_sync(self.encoder.encode, body, more_body)
+        return self.encoder.encode(body, more_body)
+
+
+class CompressionMiddleware:
+    """Brotli when the client and the installation support it, gzip otherwise."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = COMPRESSION_MINIMUM_SIZE,
+        compresslevel: int = GZIP_LEVEL,
+        brotli_quality: int = BROTLI_QUALITY,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+        self.brotli_quality = brotli_quality
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        accept_encoding = Headers(scope=scope).get("Accept-Encoding", "")
+        if brotli is not None and accepts_encoding(accept_encoding, "br"):
+            encoding = "br"
+        elif accepts_encoding(accept_encoding, "gzip"):
+            encoding = "gzip"
+        else:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(
+            self.app,
+            self.minimum_size,
+            lambda: _Encoder(encoding, self.compresslevel, self.brotli_quality),
+        )
+        await responder(scope, receive, send)
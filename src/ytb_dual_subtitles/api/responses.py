@@ -0,0 +1,48 @@
+"""Fast JSON responses for large read endpoints.
+
+Routes normally return ``ApiResponse`` and let FastAPI validate the value
+against the response model and serialize it. For payloads of thousands of
+plain dicts (subtitle segments, video lists) that pass is most of the
+request time, and it re-checks data the route has just built itself.
+``FastJSONResponse`` renders the same ``ApiResponse`` envelope directly,
+with orjson when it is installed (``pip install .[speedups]``) and the
+standard library otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # Optional dependency: fall back to the json module
+    orjson = None
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response that serializes its content without revalidation.
+
+    Returned directly from a route, it bypasses the response model. Content
+    is an ``ApiResponse`` (or any pydantic model, rendered field by field
+    without dumping the data it holds) or plain JSON-compatible data.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            # Shallow: top-level fields only, the payload is serialized as is
+            content = dict(content)
+
+        if orjson is not None:
+            return orjson.dumps(content, default=jsonable_encoder)
+        return json.dumps(
+            content,
+            ensure_ascii=False,
+            allow_nan=False,
+            separators=(",", ":"),
+            default=jsonable_encoder,
+        ).encode("utf-8")
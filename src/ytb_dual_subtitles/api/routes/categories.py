@@ -7,6 +7,7 @@ from sqlalchemy import select, delete, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ytb_dual_subtitles.core.database import get_db
+from ytb_dual_subtitles.core.http_cache import BUMP_VERSION_SQL, LIBRARY_VERSION
 from ytb_dual_subtitles.models import ApiResponse, ErrorCodes
 from ytb_dual_subtitles.models.video import Video
 from pydantic import BaseModel
@@ -202,8 +203,10 @@ async def update_category(
             params.append(category.name)
 
             # Update videos that use this category
-            cursor.execute("UPDATE videos SET category = ? WHERE category = ?",
-                          (category.name, old_name))
+            cursor.execute("UPDATE videos SET category = ?, updated_at = CURRENT_TIMESTAMP "
+                          "WHERE category = ?", (category.name, old_name))
+            if cursor.rowcount:
+                cursor.execute(BUMP_VERSION_SQL, {"name": LIBRARY_VERSION})
 
         if category.description is not None:
             updates.append("description = ?")
@@ -294,9 +297,11 @@ async def delete_category(
             )
 
         # Move videos to the target category
-        cursor.execute("UPDATE videos SET category = ? WHERE category = ?",
-                      (move_to_category, category_name))
+        cursor.execute("UPDATE videos SET category = ?, updated_at = CURRENT_TIMESTAMP "
+                      "WHERE category = ?", (move_to_category, category_name))
         moved_count = cursor.rowcount
+        if moved_count:
+            cursor.execute(BUMP_VERSION_SQL, {"name": LIBRARY_VERSION})
 
         # Delete the category
         cursor.execute("DELETE FROM categories WHERE id = ?", (category_id,))
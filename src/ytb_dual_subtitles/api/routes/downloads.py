@@ -28,6 +28,28 @@ class CreateDownloadRequest(BaseModel):
     """Request model for creating download task."""
 
     url: str = Field(..., description="YouTube video URL to download")
+    priority: int = Field(default=0, description="Queue priority (higher runs first)")
+
+
+class BulkDownloadRequest(BaseModel):
+    """Request model for queueing many downloads at once."""
+
+    urls: list[str] = Field(
+        ...,
+        min_length=1,
+        description="YouTube video, playlist or channel URLs to download"
+    )
+    priority: int = Field(default=0, description="Queue priority (higher runs first)")
+
+
+class BulkDownloadData(BaseModel):
+    """Bulk download result data model."""
+
+    queued: int = 0
+    skipped: int = 0
+    task_ids: list[str] = Field(default_factory=list)
+    invalid_urls: list[str] = Field(default_factory=list)
+    failed_urls: list[str] = Field(default_factory=list)
 
 
 class DownloadTaskData(BaseModel):
@@ -108,9 +130,9 @@ async def create_download_task(
 
     try:
         # Create download task
-        task = await download_manager.create_task(request.url)
+        task = await download_manager.create_task(request.url, priority=request.priority)
 
-        # Only start the task if it's in pending status
+        # Only queue the task if it's in pending status
         if task.status.value == 'pending':
             await download_manager.start_task(task.task_id)
 
@@ -134,6 +156,65 @@ async def create_download_task(
         )
 
 
+@router.post("/downloads/bulk", status_code=status.HTTP_202_ACCEPTED, response_model=ApiResponse[BulkDownloadData])
+async def create_bulk_download_tasks(
+    request: BulkDownloadRequest,
+    download_manager: DownloadManager = Depends(get_download_manager)
+) -> ApiResponse[BulkDownloadData]:
+    """Queue downloads for a list of video URLs and/or playlists and channels.
+
+    Playlists and channels are expanded with one flat extraction each. Videos
+    that are already downloaded or queued are skipped, the rest are queued in
+    one transaction and picked up by the download dispatcher.
+
+    Args:
+        request: Bulk download request
+        download_manager: Download manager instance
+
+    Returns:
+        Unified API response with the number of queued and skipped videos
+    """
+    settings = get_settings()
+    youtube_service = YouTubeService(
+        browser_for_cookies=settings.browser_name,
+        browser_profile=settings.browser_profile
+    )
+
+    result = BulkDownloadData()
+    video_ids: list[str] = []
+    for url in request.urls:
+        if youtube_service.is_collection_url(url):
+            try:
+                video_ids.extend(await youtube_service.extract_collection_video_ids(url))
+            except Exception:
+                result.failed_urls.append(url)
+        elif youtube_service.validate_youtube_url(url):
+            video_ids.append(youtube_service.extract_video_id(url))
+        else:
+            result.invalid_urls.append(url)
+
+    if not video_ids:
+        return ApiResponse.error_response(
+            error_code=ErrorCodes.INVALID_URL,
+            error_msg="No downloadable YouTube videos found",
+            data=result
+        )
+
+    try:
+        queued = await download_manager.enqueue_videos(video_ids, priority=request.priority)
+    except Exception as e:
+        return ApiResponse.error_response(
+            error_code=ErrorCodes.DOWNLOAD_FAILED,
+            error_msg=f"Failed to queue download tasks: {str(e)}"
+        )
+
+    result.queued = len(queued)
+    result.skipped = len(set(video_ids)) - len(queued)
+    result.task_ids = [row['task_id'] for row in queued]
+
+    return ApiResponse.success_response(data=result)
+
+
 @router.get("/downloads/{task_id}", response_model=ApiResponse[DownloadTaskData])
 async def get_download_task_status(
     task_id: str,
@@ -148,7 +229,7 @@ async def get_download_task_status(
     Returns:
         Unified API response with task status information
     """
-    task_status = download_manager.get_task_status(task_id)
+    task_status = await download_manager.get_task_status(task_id)
 
     if task_status is None:
         return ApiResponse.error_response(
@@ -181,7 +262,7 @@ async def list_download_tasks(
     Returns:
         Unified API response with list of recent tasks, including download times
     """
-    tasks = download_manager.list_tasks()
+    tasks = await download_manager.list_tasks()
 
     # Sort by created_at in descending order (newest first)
     tasks.sort(key=lambda x: x.get('created_at') or '', reverse=True)
@@ -229,7 +310,7 @@ async def get_all_tasks_status(
     Returns:
         Unified API response with list of all task statuses
     """
-    tasks = download_manager.list_tasks()
+    tasks = await download_manager.list_tasks()
     return ApiResponse.success_response(data=tasks)
 
 
@@ -247,7 +328,7 @@ async def get_task_status_polling(
     Returns:
         Unified API response with detailed task status
     """
-    task_status = download_manager.get_task_status(task_id)
+    task_status = await download_manager.get_task_status(task_id)
 
     if task_status is None:
         return ApiResponse.error_response(
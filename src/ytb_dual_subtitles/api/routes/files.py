@@ -6,30 +6,68 @@ This module provides endpoints for video list, search, deletion and file operati
 from __future__ import annotations
 
 import os
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
+from urllib.parse import quote
 
-from fastapi import APIRouter, Depends, HTTPException, Path as PathParam, Query, Response
-from fastapi.responses import FileResponse, RedirectResponse
+from fastapi import APIRouter, Depends, HTTPException, Path as PathParam, Query, Request, Response
+from fastapi.responses import FileResponse, RedirectResponse, StreamingResponse
 from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
-from ytb_dual_subtitles.core.database import get_db
+from ytb_dual_subtitles.api.responses import FastJSONResponse
+from ytb_dual_subtitles.core.database import get_db, get_session_factory
+from ytb_dual_subtitles.core.http_cache import (
+    LIBRARY_VERSION,
+    etag_matches,
+    get_content_version,
+    make_etag,
+    not_modified,
+    set_etag,
+    subtitles_version_key,
+)
 from ytb_dual_subtitles.core.settings import get_settings
 from ytb_dual_subtitles.models import (
     ApiResponse,
     ErrorCodes,
 )
-from ytb_dual_subtitles.models.video import Video, VideoStatus, Subtitle
+from ytb_dual_subtitles.models.video import (
+    DualSubtitleSegment,
+    Subtitle,
+    SubtitleSegment,
+    Video,
+    VideoStatus,
+)
 from ytb_dual_subtitles.services.file_service import FileService
+from ytb_dual_subtitles.services.subtitle_data_service import (
+    SubtitleDataService,
+    dual_vtt_etag,
+    dual_vtt_path,
+)
+from ytb_dual_subtitles.services.subtitle_index_cache import get_subtitle_index_cache
+from ytb_dual_subtitles.utils.packed_track import PackedTrack
+from ytb_dual_subtitles.utils.subtitle_utils import SubtitleUtils
 
 
 router = APIRouter(tags=["files"])
 
+# Largest page size for windowed subtitle requests
+SUBTITLE_PAGE_MAX = 2000
+
+# Cues fetched from the database per chunk of a streamed subtitle export
+EXPORT_FETCH_SIZE = 1000
 
-@router.get("/videos", response_model=ApiResponse[dict[str, Any]])
+EXPORT_MEDIA_TYPES = {
+    "srt": "application/x-subrip; charset=utf-8",
+    "vtt": "text/vtt; charset=utf-8",
+}
+
+
+@router.get("/videos", response_model=ApiResponse[dict[str, Any]], response_class=FastJSONResponse)
 async def get_videos(
+    request: Request,
     search: str | None = Query(None, description="Search query for video titles"),
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
@@ -39,14 +77,18 @@ async def get_videos(
     category: str | None = Query(None, description="Filter by category"),
     group_by_category: bool = Query(False, description="Group videos by category"),
     db: AsyncSession = Depends(get_db)
-) -> ApiResponse[dict[str, Any]]:
+) -> ApiResponse[dict[str, Any]] | Response:
     """Get paginated list of videos with search and filtering.
 
+    The ETag combines the library version, the query string and the file
+    state (size, dual subtitles version) of the videos on the page, which
+    no database write tracks. Only the page's IDs and file paths are read
+    before an unchanged page is answered with 304.
+
     Returns:
         Dictionary containing videos list and pagination information
     """
-    # Build base query with eager loading of subtitles
-    query = select(Video).options(selectinload(Video.subtitles))
+    version = await get_content_version(db, LIBRARY_VERSION)
 
     # Apply filters
     conditions = []
@@ -67,29 +109,36 @@ async def get_videos(
     if category:
         conditions.append(Video.category == category)
 
-    if conditions:
-        query = query.where(and_(*conditions))
-
     # Apply sorting
     sort_column = getattr(Video, sort_by, Video.created_at)
-    if sort_order == "desc":
-        query = query.order_by(sort_column.desc())
-    else:
-        query = query.order_by(sort_column.asc())
+    order = sort_column.desc() if sort_order == "desc" else sort_column.asc()
+
+    def page_query(*columns: Any) -> Any:
+        """Select columns of the filtered, sorted page of videos."""
+        query = select(*columns)
+        if conditions:
+            query = query.where(and_(*conditions))
+        # Apply pagination
+        return query.order_by(order).offset((page - 1) * per_page).limit(per_page)
+
+    # File state of the page's videos, in page order
+    page_files = await db.execute(page_query(Video.id, Video.file_path))
+    file_states = {
+        video_id: _video_file_state(file_path) for video_id, file_path in page_files
+    }
 
-    # Get total count
-    count_query = select(func.count()).select_from(
-        query.subquery()
-    )
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    etag = make_etag(version, request.url.query, list(file_states.items()))
+    if etag_matches(request, etag):
+        return not_modified(etag)
 
-    # Apply pagination
-    offset = (page - 1) * per_page
-    query = query.offset(offset).limit(per_page)
+    # Get total count
+    count_query = select(func.count(Video.id))
+    if conditions:
+        count_query = count_query.where(and_(*conditions))
+    total = await db.scalar(count_query) or 0
 
-    # Execute query
-    result = await db.execute(query)
+    # Execute query with eager loading of subtitles
+    result = await db.execute(page_query(Video).options(selectinload(Video.subtitles)))
     videos = result.scalars().all()
 
     # Calculate pagination info
@@ -98,20 +147,9 @@ async def get_videos(
     # Format response
     video_list = []
     for video in videos:
-        # Get file size
-        file_size = 0
-        if video.file_path and Path(video.file_path).exists():
-            try:
-                file_size = Path(video.file_path).stat().st_size
-            except Exception:
-                file_size = 0
-
-        # Check if dual subtitles version exists
-        has_dual_subs = False
-        if video.file_path:
-            original_path = Path(video.file_path)
-            dual_subs_path = original_path.parent / f"{original_path.stem}_with_subs{original_path.suffix}"
-            has_dual_subs = dual_subs_path.exists()
+        file_size, has_dual_subs = (
+            file_states.get(video.id) or _video_file_state(video.file_path)
+        )
 
         video_data = {
             "id": video.id,
@@ -160,7 +198,27 @@ async def get_videos(
             }
         }
 
-    return ApiResponse.success_response(data=data)
+    # Rendered directly: the payload is built here and needs no revalidation
+    response = FastJSONResponse(ApiResponse.success_response(data=data))
+    set_etag(response, etag)
+    return response
+
+
+def _video_file_state(file_path: str | None) -> tuple[int, bool]:
+    """Get a video's file size and whether its dual subtitles version exists."""
+    if not file_path:
+        return 0, False
+
+    # Get file size
+    original_path = Path(file_path)
+    try:
+        file_size = original_path.stat().st_size
+    except OSError:
+        file_size = 0
+
+    # Check if dual subtitles version exists
+    dual_subs_path = original_path.parent / f"{original_path.stem}_with_subs{original_path.suffix}"
+    return file_size, dual_subs_path.exists()
 
 
 @router.get("/videos/categories", response_model=ApiResponse[dict[str, Any]])
@@ -205,16 +263,31 @@ async def get_categories(
 @router.get("/videos/{video_id}", response_model=ApiResponse[dict[str, Any]])
 async def get_video(
     video_id: int,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db)
-) -> ApiResponse[dict[str, Any]]:
+) -> ApiResponse[dict[str, Any]] | Response:
     """Get a single video by ID.
 
+    The ETag combines the library version with the state of the video
+    file, and an unchanged video is answered with 304.
+
     Args:
         video_id: ID of video to retrieve
+        request: Incoming request (for If-None-Match)
+        response: Outgoing response (for the ETag header)
 
     Returns:
         Unified API response with video data
     """
+    version = await get_content_version(db, LIBRARY_VERSION)
+    file_path = await db.scalar(select(Video.file_path).where(Video.id == video_id))
+    file_size, has_dual_subs = _video_file_state(file_path)
+
+    etag = make_etag(version, video_id, file_size, has_dual_subs)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
     # Find video with subtitles
     query = select(Video).options(selectinload(Video.subtitles)).where(Video.id == video_id)
     result = await db.execute(query)
@@ -226,21 +299,6 @@ async def get_video(
             error_msg="Video not found"
         )
 
-    # Get file size
-    file_size = 0
-    if video.file_path and Path(video.file_path).exists():
-        try:
-            file_size = Path(video.file_path).stat().st_size
-        except Exception:
-            file_size = 0
-
-    # Check if dual subtitles version exists
-    has_dual_subs = False
-    if video.file_path:
-        original_path = Path(video.file_path)
-        dual_subs_path = original_path.parent / f"{original_path.stem}_with_subs{original_path.suffix}"
-        has_dual_subs = dual_subs_path.exists()
-
     video_data = {
         "id": video.id,
         "youtube_id": video.youtube_id,
@@ -264,6 +322,7 @@ async def get_video(
             for sub in video.subtitles
         ] if video.subtitles else []
     }
+    set_etag(response, etag)
     return ApiResponse.success_response(data=video_data)
 
 
@@ -346,6 +405,7 @@ async def delete_video(
         # Delete from database
         await db.delete(video)
         await db.commit()
+        get_subtitle_index_cache().invalidate(video.id, video.youtube_id)
 
         data = {
             "message": "Video deleted successfully",
@@ -406,98 +466,183 @@ async def stream_video(
     )
 
 
-@router.get("/subtitles/{video_id}", response_model=ApiResponse[dict[str, Any]])
+@router.get("/subtitles/{video_id}", response_model=ApiResponse[dict[str, Any]], response_class=FastJSONResponse)
 async def get_subtitles(
     video_id: int,
+    request: Request,
+    from_time: float | None = Query(None, alias="from", ge=0, description="Window start in seconds"),
+    to_time: float | None = Query(None, alias="to", ge=0, description="Window end in seconds"),
+    limit: int | None = Query(None, ge=1, le=SUBTITLE_PAGE_MAX, description="Maximum segments per page"),
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
     db: AsyncSession = Depends(get_db)
-) -> ApiResponse[dict[str, Any]]:
+) -> ApiResponse[dict[str, Any]] | Response:
     """Get subtitle segments for a video with dual language support.
 
+    Segments come from the dual track aligned at import time; videos
+    imported before it existed get their dual track built on first access.
+    Without parameters every segment is returned. ``from``/``to`` restrict
+    the result to segments overlapping that time window, and ``limit`` with
+    ``cursor`` pages through it in start-time order.
+
+    The ETag combines the version of the video's dual track with the query
+    string; it changes whenever the track is rebuilt, and an unchanged
+    response is answered with 304 before the segments are read.
+
     Args:
         video_id: ID of video
+        request: Incoming request (for If-None-Match)
+        from_time: Window start in seconds
+        to_time: Window end in seconds
+        limit: Maximum number of segments to return
+        cursor: Cursor returned as next_cursor by the previous page
 
     Returns:
         Unified API response with subtitle segments
     """
-    # Find video with subtitles
-    query = select(Video).options(selectinload(Video.subtitles)).where(Video.id == video_id)
-    result = await db.execute(query)
-    video = result.scalar_one_or_none()
-
-    if not video:
+    if from_time is not None and to_time is not None and to_time < from_time:
         return ApiResponse.error_response(
-            error_code=ErrorCodes.NOT_FOUND,
-            error_msg="Video not found"
+            error_code=ErrorCodes.VALIDATION_ERROR,
+            error_msg="'to' must not be earlier than 'from'"
         )
 
-    if not video.subtitles:
-        return ApiResponse.success_response(data={
-            "video_id": str(video_id),
-            "segments": [],
-            "language_original": "en",
-        })
-
-    # Find English and Chinese subtitles
-    english_sub = None
-    chinese_sub = None
-
-    for sub in video.subtitles:
-        if sub.language == 'en':
-            english_sub = sub
-        elif sub.language in ['zh-CN', 'zh-Hans', 'zh']:
-            chinese_sub = sub
-
-    # Get English subtitle segments
-    english_segments = []
-    if english_sub:
-        from ytb_dual_subtitles.models.video import SubtitleSegment
-        segments_query = select(SubtitleSegment).where(
-            SubtitleSegment.subtitle_id == english_sub.id
-        ).order_by(SubtitleSegment.sequence)
-
-        segments_result = await db.execute(segments_query)
-        english_segments = segments_result.scalars().all()
-
-    # Get Chinese subtitle segments
-    chinese_segments_dict = {}
-    if chinese_sub:
-        from ytb_dual_subtitles.models.video import SubtitleSegment
-        segments_query = select(SubtitleSegment).where(
-            SubtitleSegment.subtitle_id == chinese_sub.id
-        ).order_by(SubtitleSegment.sequence)
-
-        segments_result = await db.execute(segments_query)
-        chinese_segments = segments_result.scalars().all()
-
-        # Create lookup dict by sequence for matching
-        for seg in chinese_segments:
-            chinese_segments_dict[seg.sequence] = seg
-
-    # Combine segments
-    combined_segments = []
-    for seg in english_segments:
-        chinese_text = None
-        if seg.sequence in chinese_segments_dict:
-            chinese_text = chinese_segments_dict[seg.sequence].text
-
-        combined_segments.append({
-            "id": str(seg.id),
-            "video_id": str(video_id),
-            "start_time": seg.start_time,
-            "end_time": seg.end_time,
-            "text_english": seg.text,
-            "text_chinese": chinese_text,
-            "sequence": seg.sequence,
-        })
+    after = None
+    if cursor is not None:
+        after = _decode_subtitle_cursor(cursor)
+        if after is None:
+            return ApiResponse.error_response(
+                error_code=ErrorCodes.VALIDATION_ERROR,
+                error_msg="Invalid cursor"
+            )
+
+    version_key = subtitles_version_key(video_id)
+    etag = make_etag(await get_content_version(db, version_key), request.url.query)
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    rows = await _fetch_dual_segments(db, video_id, from_time, to_time, after, limit)
+
+    if not rows and not await _has_dual_segments(db, video_id):
+        video_exists = await db.scalar(select(Video.id).where(Video.id == video_id))
+        if video_exists is None:
+            return ApiResponse.error_response(
+                error_code=ErrorCodes.NOT_FOUND,
+                error_msg="Video not found"
+            )
+
+        # A no-op (no writes, same version) for videos without an English track
+        if await SubtitleDataService(db).rebuild_dual_segments(video_id):
+            rows = await _fetch_dual_segments(db, video_id, from_time, to_time, after, limit)
+            etag = make_etag(await get_content_version(db, version_key), request.url.query)
+
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = f"{rows[-1].start_time!r}:{rows[-1].sequence}"
+
+    video_id_str = str(video_id)
+    combined_segments = [
+        {
+            # Packed tracks have no segment rows: fall back to a per-video cue key
+            "id": str(row.segment_id) if row.segment_id is not None else f"{video_id_str}:{row.sequence}",
+            "video_id": video_id_str,
+            "start_time": row.start_time,
+            "end_time": row.end_time,
+            "text_english": row.text_english,
+            "text_chinese": row.text_chinese,
+            "sequence": row.sequence,
+        }
+        for row in rows
+    ]
+    has_chinese = any(row.text_chinese is not None for row in rows)
 
     subtitle_data = {
-        "video_id": str(video_id),
+        "video_id": video_id_str,
         "segments": combined_segments,
         "language_original": "en",
-        "language_translated": "zh-CN" if chinese_sub else None,
+        "language_translated": "zh-CN" if has_chinese else None,
+        "next_cursor": next_cursor,
     }
 
-    return ApiResponse.success_response(data=subtitle_data)
+    # Rendered directly: the payload is built here and needs no revalidation
+    response = FastJSONResponse(ApiResponse.success_response(data=subtitle_data))
+    set_etag(response, etag)
+    return response
+
+
+def _decode_subtitle_cursor(cursor: str) -> tuple[float, int] | None:
+    """Parse a "start_time:sequence" page cursor."""
+    start, _, sequence = cursor.rpartition(":")
+    try:
+        return float(start), int(sequence)
+    except ValueError:
+        return None
+
+
+async def _has_dual_segments(db: AsyncSession, video_id: int) -> bool:
+    """Check whether a video's dual track has been built."""
+    result = await db.execute(
+        select(DualSubtitleSegment.id).where(DualSubtitleSegment.video_id == video_id).limit(1)
+    )
+    return result.first() is not None
+
+
+async def _fetch_dual_segments(
+    db: AsyncSession,
+    video_id: int,
+    from_time: float | None = None,
+    to_time: float | None = None,
+    after: tuple[float, int] | None = None,
+    limit: int | None = None
+) -> list[Any]:
+    """Read part of a video's dual track, projecting only needed columns.
+
+    The window is a range seek on (video_id, start_time). Its lower bound is
+    the start of the last segment beginning at or before ``from_time``, so
+    the segment still on screen at ``from_time`` is included.
+
+    Returns:
+        Rows ordered by start time; one more than ``limit`` if more remain
+    """
+    query = select(
+        DualSubtitleSegment.segment_id,
+        DualSubtitleSegment.sequence,
+        DualSubtitleSegment.start_time,
+        DualSubtitleSegment.end_time,
+        DualSubtitleSegment.text_english,
+        DualSubtitleSegment.text_chinese,
+    ).where(DualSubtitleSegment.video_id == video_id)
+
+    if from_time is not None:
+        window_start = (
+            select(func.max(DualSubtitleSegment.start_time))
+            .where(
+                DualSubtitleSegment.video_id == video_id,
+                DualSubtitleSegment.start_time <= from_time
+            )
+            .scalar_subquery()
+        )
+        query = query.where(
+            DualSubtitleSegment.start_time >= func.coalesce(window_start, from_time),
+            DualSubtitleSegment.end_time >= from_time
+        )
+    if to_time is not None:
+        query = query.where(DualSubtitleSegment.start_time <= to_time)
+    if after is not None:
+        after_start, after_sequence = after
+        query = query.where(or_(
+            DualSubtitleSegment.start_time > after_start,
+            and_(
+                DualSubtitleSegment.start_time == after_start,
+                DualSubtitleSegment.sequence > after_sequence
+            )
+        ))
+
+    query = query.order_by(DualSubtitleSegment.start_time, DualSubtitleSegment.sequence)
+    if limit is not None:
+        query = query.limit(limit + 1)
+
+    result = await db.execute(query)
+    return result.all()
 
 
 @router.get("/videos/{video_id}/thumbnail/{size}", response_class=Response)
@@ -560,12 +705,18 @@ async def get_thumbnail(
 @router.get("/subtitles/{video_id}/dual.vtt")
 async def get_dual_subtitle_vtt(
     video_id: int,
+    request: Request,
     db: AsyncSession = Depends(get_db)
-) -> FileResponse:
+) -> Response:
     """Get dual subtitle VTT file for web player.
 
+    The file is generated whenever the video's subtitles change and is
+    served as is, with a content-hash ETag so unchanged files revalidate
+    with a 304.
+
     Args:
         video_id: ID of video
+        request: Incoming request (for If-None-Match)
 
     Returns:
         WebVTT subtitle file with dual language (Chinese + English)
@@ -573,31 +724,31 @@ async def get_dual_subtitle_vtt(
     Raises:
         HTTPException: If video or subtitle file not found
     """
-    # Find video
-    query = select(Video).where(Video.id == video_id)
-    result = await db.execute(query)
-    video = result.scalar_one_or_none()
-
-    if not video:
+    youtube_id = await db.scalar(select(Video.youtube_id).where(Video.id == video_id))
+    if youtube_id is None:
         raise HTTPException(status_code=404, detail="Video not found")
 
-    # Construct VTT path
-    settings = get_settings()
-    vtt_path = settings.subtitle_path / str(video_id) / f"{video.youtube_id}_dual.vtt"
-
-    if not vtt_path.exists():
-        # Try to find any dual vtt file
-        dual_vtt_files = list((settings.subtitle_path / str(video_id)).glob("*_dual.vtt"))
-        if dual_vtt_files:
-            vtt_path = dual_vtt_files[0]
-        else:
+    vtt_path = dual_vtt_path(video_id, youtube_id)
+    etag = dual_vtt_etag(vtt_path)
+
+    if etag is None:
+        # Imported before dual VTT files were generated: build it once now.
+        # Without an English track the rebuild writes nothing and returns 0.
+        if await SubtitleDataService(db).rebuild_dual_segments(video_id):
+            etag = dual_vtt_etag(vtt_path)
+        if etag is None:
             raise HTTPException(status_code=404, detail="Dual subtitle file not found")
 
-    return FileResponse(
+    if etag_matches(request, etag):
+        return not_modified(etag)
+
+    response = FileResponse(
         path=str(vtt_path),
         media_type="text/vtt",
-        filename=f"{video.youtube_id}_dual.vtt"
+        filename=f"{youtube_id}_dual.vtt"
     )
+    set_etag(response, etag)
+    return response
 
 
 @router.get("/videos/{video_id}/subtitles/{language}/export")
@@ -606,16 +757,21 @@ async def export_subtitles(
     language: str,
     format: str = Query("srt", pattern="^(srt|vtt)$"),
     db: AsyncSession = Depends(get_db)
-) -> Response:
+) -> StreamingResponse:
     """Export video subtitles in specified format.
 
+    ``language`` selects a single track (e.g. "en" for English-only or
+    "zh-CN" for Chinese-only); "bilingual" exports the aligned dual track
+    with the English and Chinese lines of each cue. The file is streamed
+    from a database cursor, so large tracks are never held in memory.
+
     Args:
         video_id: ID of video
-        language: Subtitle language code
+        language: Subtitle language code, or "bilingual"
         format: Export format (srt/vtt)
 
     Returns:
-        Subtitle file content
+        Streamed subtitle file
 
     Raises:
         HTTPException: If video or subtitles not found
@@ -628,55 +784,101 @@ async def export_subtitles(
     if not video:
         raise HTTPException(status_code=404, detail="Video not found")
 
-    # Find subtitles
-    subtitle_query = select(Subtitle).where(
-        and_(
-            Subtitle.video_id == video_id,
-            Subtitle.language == language
+    if language == "bilingual":
+        # Build missing dual rows once; a no-op for videos without an English track
+        if (
+            not await _has_dual_segments(db, video_id)
+            and not await SubtitleDataService(db).rebuild_dual_segments(video_id)
+        ):
+            raise HTTPException(status_code=404, detail=f"Subtitles not found for language: {language}")
+
+        mode = "bilingual"
+        segments_query = (
+            select(
+                DualSubtitleSegment.start_time,
+                DualSubtitleSegment.end_time,
+                DualSubtitleSegment.text_english.label("english"),
+                DualSubtitleSegment.text_chinese.label("chinese"),
+            )
+            .where(DualSubtitleSegment.video_id == video_id)
+            .order_by(DualSubtitleSegment.sequence)
         )
-    )
-    subtitle_result = await db.execute(subtitle_query)
-    subtitle = subtitle_result.scalar_one_or_none()
-
-    if not subtitle:
-        raise HTTPException(
-            status_code=404,
-            detail=f"Subtitles not found for language: {language}"
+    else:
+        # Find subtitles
+        subtitle_id = await db.scalar(
+            select(Subtitle.id).where(
+                and_(
+                    Subtitle.video_id == video_id,
+                    Subtitle.language == language
+                )
+            )
         )
 
-    # Generate subtitle content
-    subtitle_content = await generate_srt_content(subtitle, db)
+        if subtitle_id is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Subtitles not found for language: {language}"
+            )
+
+        mode = "chinese" if language.startswith("zh") else "english"
+        packed = await SubtitleDataService(db).load_packed_track(subtitle_id)
+        segments_query = packed or (
+            select(SubtitleSegment.start_time, SubtitleSegment.end_time, SubtitleSegment.text)
+            .where(SubtitleSegment.subtitle_id == subtitle_id)
+            .order_by(SubtitleSegment.sequence)
+        )
 
     # Prepare response
     filename = f"{video.title}_{language}.{format}"
+    ascii_filename = filename.encode("ascii", "replace").decode("ascii").replace('"', "_")
 
-    return Response(
-        content=subtitle_content,
-        media_type="text/plain",
+    return StreamingResponse(
+        _stream_subtitle_export(segments_query, format, mode),
+        media_type=EXPORT_MEDIA_TYPES[format],
         headers={
-            "Content-Disposition": f"attachment; filename=\"{filename}\""
+            "Content-Disposition": (
+                f"attachment; filename=\"{ascii_filename}\"; "
+                f"filename*=UTF-8''{quote(filename)}"
+            )
         }
     )
 
 
-async def generate_srt_content(subtitle: Subtitle, db: AsyncSession) -> str:
-    """Generate SRT format content from subtitle segments.
+async def _stream_subtitle_export(
+    segments_query: Any | PackedTrack,
+    format: str,
+    mode: str
+) -> AsyncIterator[bytes]:
+    """Yield an SRT/VTT file in chunks of EXPORT_FETCH_SIZE cues.
 
-    Args:
-        subtitle: Subtitle instance
-        db: Database session
-
-    Returns:
-        SRT formatted string
+    Packed tracks are already in memory; row tracks are read through a
+    cursor in their own session, because the response body is produced after
+    the request's session dependency may already be closed.
     """
-    # This is a placeholder implementation
-    # In a real implementation, you would fetch subtitle segments
-    # and format them according to SRT specification
-
-    content = []
-    content.append("1")
-    content.append("00:00:01,000 --> 00:00:05,000")
-    content.append("Sample subtitle content")
-    content.append("")
-
-    return "\n".join(content)
\ No newline at end of file
+    if format == "vtt":
+        yield b"WEBVTT\n\n"
+
+    if isinstance(segments_query, PackedTrack):
+        track = segments_query
+        for chunk_start in range(0, len(track), EXPORT_FETCH_SIZE):
+            chunk = []
+            for i in range(chunk_start, min(chunk_start + EXPORT_FETCH_SIZE, len(track))):
+                segment = {"start_time": track.start(i), "end_time": track.end(i), "text": track.text(i)}
+                chunk.append(SubtitleUtils.format_subtitle_block(i + 1, segment, mode, format))
+                chunk.append("\n")
+            yield "".join(chunk).encode("utf-8")
+        return
+
+    index = 0
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        result = await session.stream(
+            segments_query.execution_options(yield_per=EXPORT_FETCH_SIZE)
+        )
+        async for rows in result.mappings().partitions(EXPORT_FETCH_SIZE):
+            chunk = []
+            for row in rows:
+                index += 1
+                chunk.append(SubtitleUtils.format_subtitle_block(index, row, mode, format))
+                chunk.append("\n")
+            yield "".join(chunk).encode("utf-8")
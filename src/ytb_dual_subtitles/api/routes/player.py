@@ -12,13 +12,14 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field, validator
 
 from ytb_dual_subtitles.models import (
     ApiResponse,
     ErrorCodes,
 )
+from ytb_dual_subtitles.services.subtitle_index_cache import get_subtitle_index_cache
 
 # Initialize router
 router = APIRouter(tags=["player"])
@@ -179,23 +180,6 @@ class MockVideoService:
         return None
 
 
-class MockSubtitleService:
-    """Mock subtitle service for testing."""
-
-    @staticmethod
-    def get_subtitles_at_time(video_id: str, time: float) -> List[Dict[str, Any]]:
-        """Get subtitles at specific time."""
-        return [
-            {
-                "id": 1,
-                "start_time": 0.0,
-                "end_time": 2.5,
-                "text": "Hello world",
-                "language": "en"
-            }
-        ]
-
-
 class MockPlaybackService:
     """Mock playback service for testing."""
 
@@ -285,14 +269,27 @@ async def get_video_subtitles_at_time(
 ) -> SubtitleResponse:
     """Get subtitles active at specific playback time.
 
+    The video's subtitle time index is built on first access and cached,
+    so later lookups do not touch the database.
+
     Args:
-        video_id: Unique video identifier
+        video_id: Video database ID or YouTube ID
         time: Playback time in seconds
 
     Returns:
         Subtitle segments active at the specified time
+
+    Raises:
+        HTTPException: 404 if video not found
     """
-    subtitles = MockSubtitleService.get_subtitles_at_time(video_id, time)
+    index = await get_subtitle_index_cache().get(video_id)
+    if index is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Video with ID '{video_id}' not found"
+        )
+
+    subtitles = index.subtitles_at(time, tolerance=_player_config.sync_tolerance)
 
     return SubtitleResponse(
         subtitles=subtitles,
@@ -10,6 +10,7 @@ import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
+from sqlalchemy.engine import Connection
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
@@ -17,6 +18,8 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+# Imported for its session hook that bumps content versions on ORM writes
+from ytb_dual_subtitles.core import http_cache  # noqa: F401
 from ytb_dual_subtitles.core.settings import Settings, get_settings
 from ytb_dual_subtitles.models import Base
 
@@ -78,13 +81,35 @@ async def init_database(settings: Settings | None = None) -> None:
     _engine = create_engine(settings)
     _async_session_factory = create_session_factory(_engine)
 
-    # Create all tables
+    # Create all tables, then any indexes added to tables that already existed
     async with _engine.begin() as conn:
+        await conn.run_sync(_drop_outdated_dual_segments)
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
 
     logger.info("Database initialized successfully")
 
 
+def _drop_outdated_dual_segments(connection: Connection) -> None:
+    """Drop a dual_subtitle_segments table whose segment_id is still NOT NULL.
+
+    The table only holds derived data (rebuilt on demand by the subtitle
+    routes), and SQLite cannot relax a column constraint in place, so it is
+    recreated by create_all instead.
+    """
+    columns = connection.exec_driver_sql("PRAGMA table_info(dual_subtitle_segments)").all()
+    if any(column[1] == "segment_id" and column[3] for column in columns):
+        connection.exec_driver_sql("DROP TABLE dual_subtitle_segments")
+        logger.info("Dropped dual_subtitle_segments to make segment_id nullable")
+
+
+def _create_missing_indexes(connection: Connection) -> None:
+    """Create model indexes that create_all skips on existing tables."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
 async def close_database() -> None:
     """Close database connections and clean up resources."""
     global _engine
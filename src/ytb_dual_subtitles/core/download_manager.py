@@ -3,12 +3,17 @@
 Subtask 2.1: 创建 DownloadManager 类，实现任务队列
 Subtask 2.2: 实现并发控制（最多3个并行任务）
 Subtask 2.3: 实现下载状态管理和状态转换
+
+Pending tasks live in the download_tasks table, which is the queue: a
+dispatcher loop claims them by priority and creation order whenever a
+download slot is free, so tasks queued before a restart are picked up again.
 """
 
 from __future__ import annotations
 
 import asyncio
 import uuid
+from collections.abc import Callable
 from datetime import datetime
 from typing import Any
 
@@ -17,22 +22,39 @@ from ytb_dual_subtitles.exceptions.download_errors import (
 )
 from ytb_dual_subtitles.models.video import DownloadTaskStatus
 from ytb_dual_subtitles.services.youtube_service import YouTubeService
-from ytb_dual_subtitles.database.models import DatabaseManager
+from ytb_dual_subtitles.database.models import get_database_manager
 from ytb_dual_subtitles.database.task_dao import TaskDAO
-from ytb_dual_subtitles.core.settings import get_settings
+from ytb_dual_subtitles.core.progress_tracker import ProgressTracker
+from ytb_dual_subtitles.utils.subtitle_parser import (
+    collapse_rolling_duplicates,
+    is_auto_caption_track,
+    parse_subtitle_file_async,
+)
+
+# Seconds between batched writes of live download progress
+PROGRESS_FLUSH_INTERVAL = 1.0
+
+# Task progress range covered by the video download step
+DOWNLOAD_PROGRESS_START = 10
+DOWNLOAD_PROGRESS_END = 50
+
+# Seconds the dispatcher waits between queue checks when nothing wakes it
+QUEUE_POLL_INTERVAL = 5.0
 
 
 class DownloadTask:
     """Represents a single download task."""
 
-    def __init__(self, url: str) -> None:
+    def __init__(self, url: str, priority: int = 0) -> None:
         """Initialize download task.
 
         Args:
             url: YouTube video URL to download
+            priority: Queue priority (higher runs first)
         """
         self.task_id = str(uuid.uuid4())
         self.url = url
+        self.priority = priority
         self.status = DownloadTaskStatus.PENDING
         self.progress = 0
         self.error_message: str | None = None
@@ -99,27 +121,51 @@ class DownloadManager:
         self.max_concurrent = max_concurrent
         self.max_retries = max_retries
 
-        # Database setup
-        settings = get_settings()
-        self._db_manager = DatabaseManager(settings.database_path)
+        # Database setup (shared connection pool)
+        self._db_manager = get_database_manager()
         self._task_dao = TaskDAO(self._db_manager)
 
-        # Concurrency control
-        self._semaphore = asyncio.Semaphore(max_concurrent)
+        # Concurrency control: the dispatcher keeps at most max_concurrent running
         self._running_tasks: dict[str, asyncio.Task[None]] = {}
+        self._queue_event = asyncio.Event()
+        self._dispatcher_task: asyncio.Task[None] | None = None
+
+        # Live download progress, persisted in batches by the flush loop
+        self._progress = ProgressTracker()
+        self._progress_flush_task: asyncio.Task[None] | None = None
 
-        # Load active tasks from database on startup
-        self._restore_active_tasks()
+    async def start(self) -> None:
+        """Restore interrupted tasks and start draining the queue."""
+        await self._restore_active_tasks()
+        if self._dispatcher_task is None or self._dispatcher_task.done():
+            self._dispatcher_task = asyncio.create_task(self._dispatch_loop())
+        self._wake_dispatcher()
 
-    def _restore_active_tasks(self) -> None:
+    async def stop(self) -> None:
+        """Stop dispatching and persist pending progress on shutdown.
+
+        Running downloads stay in downloading status and are requeued by
+        the next start.
+        """
+        if self._dispatcher_task is not None:
+            self._dispatcher_task.cancel()
+            try:
+                await self._dispatcher_task
+            except asyncio.CancelledError:
+                pass
+            self._dispatcher_task = None
+        if self._progress_flush_task is not None:
+            self._progress_flush_task.cancel()
+            try:
+                await self._progress_flush_task
+            except asyncio.CancelledError:
+                pass
+        await self._flush_progress()
+
+    async def _restore_active_tasks(self) -> None:
         """Restore active tasks from database on startup."""
         # Mark any hanging 'downloading' tasks as pending to retry
-        pending_tasks = self._task_dao.get_tasks_by_status('downloading')
-        for task_data in pending_tasks:
-            self._task_dao.update_task(task_data['task_id'], {
-                'status': 'pending',
-                'status_message': 'Restored after service restart'
-            })
+        await self._task_dao.requeue_interrupted_tasks('Restored after service restart')
 
     def _task_data_to_download_task(self, task_data: dict[str, Any]) -> DownloadTask:
         """Convert database task data to DownloadTask object.
@@ -130,7 +176,7 @@ class DownloadManager:
         Returns:
             DownloadTask object
         """
-        task = DownloadTask(task_data['url'])
+        task = DownloadTask(task_data['url'], priority=task_data.get('priority') or 0)
         task.task_id = task_data['task_id']
         task.status = DownloadTaskStatus(task_data['status'])
         task.progress = task_data['progress']
@@ -165,15 +211,22 @@ class DownloadManager:
         Returns:
             Dictionary for database storage
         """
+        try:
+            video_id = self._youtube_service.extract_video_id(task.url)
+        except ValueError:
+            video_id = None
+
         return {
             'task_id': task.task_id,
             'url': task.url,
+            'video_id': video_id,
             'title': getattr(task, 'title', None),
             'status': task.status.value,
             'progress': task.progress,
             'error_message': task.error_message,
             'status_message': task.status_message,
             'retry_count': task.retry_count,
+            'priority': task.priority,
             'downloaded_bytes': task.downloaded_bytes,
             'total_bytes': task.total_bytes,
             'download_speed': task.download_speed,
@@ -184,11 +237,12 @@ class DownloadManager:
             'last_updated': task.last_updated.isoformat() if task.last_updated else None,
         }
 
-    async def create_task(self, url: str) -> DownloadTask:
+    async def create_task(self, url: str, priority: int = 0) -> DownloadTask:
         """Create a new download task with duplicate check.
 
         Args:
             url: YouTube video URL
+            priority: Queue priority (higher runs first)
 
         Returns:
             Created download task or existing active task for same URL
@@ -198,7 +252,7 @@ class DownloadManager:
         """
         # Check if there's already an active task for this URL in database
         normalized_url = url.strip()
-        existing_task_data = self._task_dao.get_active_task_by_url(normalized_url)
+        existing_task_data = await self._task_dao.get_active_task_by_url(normalized_url)
         if existing_task_data:
             return self._task_data_to_download_task(existing_task_data)
 
@@ -213,12 +267,12 @@ class DownloadManager:
             task.set_error(f"Failed to get video info: {e}")
             # Save to database
             task_data = self._download_task_to_data(task)
-            self._task_dao.create_task(task_data)
+            await self._task_dao.create_task(task_data)
             return task
 
         # Check if video with same title already exists (deduplication by title)
         if video_title:
-            existing_task_by_title = self._task_dao.get_completed_task_by_title(video_title)
+            existing_task_by_title = await self._task_dao.get_completed_task_by_title(video_title)
             if existing_task_by_title:
                 # Video with same title already downloaded
                 existing_task = self._task_data_to_download_task(existing_task_by_title)
@@ -234,7 +288,7 @@ class DownloadManager:
             task.set_error(f"Invalid URL: {e}")
             # Save to database
             task_data = self._download_task_to_data(task)
-            self._task_dao.create_task(task_data)
+            await self._task_dao.create_task(task_data)
             return task
 
         # Check if file already exists
@@ -252,20 +306,46 @@ class DownloadManager:
             setattr(task, 'title', video_title)
             # Save to database
             task_data = self._download_task_to_data(task)
-            self._task_dao.create_task(task_data)
+            await self._task_dao.create_task(task_data)
             return task
 
         # File doesn't exist, create normal pending task
-        task = DownloadTask(url=url)
+        task = DownloadTask(url=url, priority=priority)
         # Store video title in task for later use
         setattr(task, 'title', video_title)
         # Save to database
         task_data = self._download_task_to_data(task)
-        self._task_dao.create_task(task_data)
+        await self._task_dao.create_task(task_data)
         return task
 
+    async def enqueue_videos(self, video_ids: list[str], priority: int = 0) -> list[dict[str, Any]]:
+        """Queue download tasks for many videos at once.
+
+        Unlike create_task this does not probe the videos; titles are
+        fetched when each download starts. Videos that are already
+        downloaded or queued are skipped.
+
+        Args:
+            video_ids: YouTube video IDs in queue order
+            priority: Queue priority (higher runs first)
+
+        Returns:
+            task_id, video_id and url of the queued tasks
+        """
+        videos = [
+            (video_id, f"https://www.youtube.com/watch?v={video_id}")
+            for video_id in dict.fromkeys(video_ids)
+        ]
+        queued = await self._task_dao.enqueue_videos(videos, priority, 'Queued')
+        if queued:
+            self._wake_dispatcher()
+        return queued
+
     async def start_task(self, task_id: str) -> None:
-        """Start a download task.
+        """Queue a pending download task for the dispatcher.
+
+        The task starts as soon as a download slot is free, in priority
+        and creation order with the other pending tasks.
 
         Args:
             task_id: ID of the task to start
@@ -274,27 +354,107 @@ class DownloadManager:
             ValueError: If task is not found
         """
         # Find task in database
-        task_data = self._task_dao.get_task(task_id)
+        task_data = await self._task_dao.get_task(task_id)
         if not task_data:
             raise ValueError("Task not found")
 
         if task_data['status'] not in ['pending']:
             raise ValueError(f"Task {task_id} is not in pending status")
 
-        # Update status to downloading
-        self._task_dao.update_task(task_id, {
-            'status': 'downloading',
-            'started_at': datetime.now().isoformat()
-        })
+        self._wake_dispatcher()
+
+    def _wake_dispatcher(self) -> None:
+        """Ask the dispatcher to look for pending tasks now."""
+        self._queue_event.set()
+
+    async def _dispatch_loop(self) -> None:
+        """Claim pending tasks from the database whenever a slot is free.
+
+        The loop wakes up when a task is queued or finishes, and polls every
+        QUEUE_POLL_INTERVAL seconds so rows queued by other writers are
+        picked up as well.
+        """
+        while True:
+            try:
+                await asyncio.wait_for(self._queue_event.wait(), QUEUE_POLL_INTERVAL)
+            except asyncio.TimeoutError:
+                pass
+            self._queue_event.clear()
+
+            try:
+                await self._dispatch_pending()
+            except Exception as e:
+                print(f"Failed to dispatch queued downloads: {e}")
+
+    async def _dispatch_pending(self) -> None:
+        """Start as many queued tasks as there are free download slots."""
+        free_slots = self.max_concurrent - len(self._running_tasks)
+        if free_slots <= 0:
+            return
+
+        claimed = await self._task_dao.claim_pending_tasks(free_slots)
+        for task_data in claimed:
+            task = self._task_data_to_download_task(task_data)
+            self._running_tasks[task.task_id] = asyncio.create_task(self._download_task(task))
+
+        if claimed:
+            self._ensure_progress_flusher()
+
+    def _ensure_progress_flusher(self) -> None:
+        """Start the progress flush loop if it is not running."""
+        if self._progress_flush_task is None or self._progress_flush_task.done():
+            self._progress_flush_task = asyncio.create_task(self._flush_progress_loop())
+
+    async def _flush_progress_loop(self) -> None:
+        """Persist live progress once per interval while downloads are running."""
+        try:
+            while True:
+                await asyncio.sleep(PROGRESS_FLUSH_INTERVAL)
+                await self._flush_progress()
+                if not self._running_tasks and not self._progress.has_pending():
+                    break
+        finally:
+            self._progress_flush_task = None
+
+    async def _flush_progress(self) -> None:
+        """Write all changed progress entries in one batched update."""
+        rows = self._progress.drain_dirty()
+        if not rows:
+            return
+        try:
+            await self._task_dao.bulk_update_progress(rows)
+        except Exception as e:
+            print(f"Failed to persist download progress: {e}")
+
+    def _make_progress_callback(self, task_id: str) -> Callable[[dict[str, Any]], None]:
+        """Create a progress callback feeding the in-memory progress table.
+
+        The callback runs on the yt-dlp worker thread and only touches the
+        tracker; the flush loop does the database write.
 
-        # Convert to DownloadTask object for processing
-        task = self._task_data_to_download_task(task_data)
-        task.status = DownloadTaskStatus.DOWNLOADING
-        task.started_at = datetime.now()
+        Args:
+            task_id: ID of the task being downloaded
 
-        # Start download in background
-        download_coro = self._download_task(task)
-        self._running_tasks[task_id] = asyncio.create_task(download_coro)
+        Returns:
+            Callback for YouTubeService.download_video
+        """
+        span = DOWNLOAD_PROGRESS_END - DOWNLOAD_PROGRESS_START
+
+        def on_progress(info: dict[str, Any]) -> None:
+            data = info.get('progress')
+            if not data:
+                return
+            percentage = min(max(data.get('percentage') or 0.0, 0.0), 100.0)
+            self._progress.update(
+                task_id,
+                progress=DOWNLOAD_PROGRESS_START + int(percentage * span / 100),
+                downloaded_bytes=int(data.get('downloaded') or 0),
+                total_bytes=int(data.get('total') or 0),
+                download_speed=float(data.get('speed') or 0.0),
+                eta_seconds=int(data.get('eta') or 0),
+            )
+
+        return on_progress
 
     async def _download_task(self, task: DownloadTask) -> None:
         """Execute the download for a task with retry mechanism.
@@ -310,154 +470,157 @@ class DownloadManager:
             task: Download task to execute
         """
         try:
-            async with self._semaphore:
-                # Fetch video info first to get title
+            # Fetch video info first to get title
+            try:
+                video_id = self._youtube_service.extract_video_id(task.url)
+                video_info = await self._youtube_service.get_video_info(video_id)
+                title = video_info.get("title", "未知标题")
+
+                # Update task with title immediately
+                await self._task_dao.update_task(task.task_id, {
+                    'title': title,
+                    'status_message': f'正在准备下载: {title}',
+                    'progress': 0
+                })
+            except Exception as e:
+                print(f"Failed to get video info: {e}")
+                task.set_error(f"Failed to get video info: {e}")
+                await self._complete_task(task, success=False)
+                return
+
+            # Retry loop
+            while task.retry_count <= self.max_retries:
+                video_downloaded = False
+                subtitles_imported = False
+                file_path = None
+
                 try:
-                    video_id = self._youtube_service.extract_video_id(task.url)
-                    video_info = await self._youtube_service.get_video_info(video_id)
-                    title = video_info.get("title", "未知标题")
-
-                    # Update task with title immediately
-                    self._task_dao.update_task(task.task_id, {
-                        'title': title,
-                        'status_message': f'正在准备下载: {title}',
-                        'progress': 0
+                    # Step 1: Download video (0-50% progress)
+                    filename = self._youtube_service.generate_filename_from_url(task.url)
+                    file_path = self._storage_service.generate_file_path_from_url(filename)
+
+                    await self._task_dao.update_task(task.task_id, {
+                        'status_message': f'下载视频中: {title} (尝试 {task.retry_count + 1}/{self.max_retries + 1})',
+                        'progress': DOWNLOAD_PROGRESS_START
                     })
-                except Exception as e:
-                    print(f"Failed to get video info: {e}")
-                    task.set_error(f"Failed to get video info: {e}")
-                    await self._complete_task(task, success=False)
-                    return
 
-                # Retry loop
-                while task.retry_count <= self.max_retries:
-                    video_downloaded = False
-                    subtitles_imported = False
-                    file_path = None
+                    downloaded_path = await self._youtube_service.download_video(
+                        task.url, task.task_id, str(file_path),
+                        progress_callback=self._make_progress_callback(task.task_id)
+                    )
+                    # Drop unflushed hook progress so it cannot overwrite the next step
+                    self._progress.discard(task.task_id)
 
-                    try:
-                        # Step 1: Download video (0-50% progress)
-                        filename = self._youtube_service.generate_filename_from_url(task.url)
-                        file_path = self._storage_service.generate_file_path_from_url(filename)
+                    # Verify video file exists
+                    from pathlib import Path
+                    if not Path(downloaded_path).exists():
+                        raise Exception(f"Video file not found after download: {downloaded_path}")
 
-                        self._task_dao.update_task(task.task_id, {
-                            'status_message': f'下载视频中: {title} (尝试 {task.retry_count + 1}/{self.max_retries + 1})',
-                            'progress': 10
-                        })
+                    video_downloaded = True
+                    print(f"✓ Video downloaded successfully: {downloaded_path}")
 
-                        downloaded_path = await self._youtube_service.download_video(
-                            task.url, task.task_id, str(file_path)
-                        )
+                    # Update progress
+                    await self._task_dao.update_task(task.task_id, {
+                        'status_message': f'视频下载完成，导入字幕中...',
+                        'progress': DOWNLOAD_PROGRESS_END
+                    })
 
-                        # Verify video file exists
-                        from pathlib import Path
-                        if not Path(downloaded_path).exists():
-                            raise Exception(f"Video file not found after download: {downloaded_path}")
+                    # Step 2: Create video record and import subtitles (50-100% progress)
+                    video_db_id = await self._create_video_record(task)
 
-                        video_downloaded = True
-                        print(f"✓ Video downloaded successfully: {downloaded_path}")
+                    if video_db_id:
+                        # Verify subtitles were imported
+                        from ytb_dual_subtitles.core.database import get_db_session
+                        from ytb_dual_subtitles.models.video import Subtitle
+                        from sqlalchemy import select, func
 
-                        # Update progress
-                        self._task_dao.update_task(task.task_id, {
-                            'status_message': f'视频下载完成，导入字幕中...',
-                            'progress': 50
+                        async with get_db_session() as session:
+                            subtitle_count_query = select(func.count()).select_from(Subtitle).where(
+                                Subtitle.video_id == video_db_id
+                            )
+                            result = await session.execute(subtitle_count_query)
+                            subtitle_count = result.scalar()
+
+                            if subtitle_count > 0:
+                                subtitles_imported = True
+                                print(f"✅ Subtitles imported successfully: {subtitle_count} subtitle tracks")
+                            else:
+                                # No subtitles found - this might indicate cookie/authentication issues
+                                print("=" * 80)
+                                print(f"⚠️  WARNING: No subtitles found/imported for video {video_db_id}")
+                                print("=" * 80)
+                                print("Possible causes:")
+                                print("1. The video may not have subtitles available")
+                                print("2. Cookie authentication may have failed (check logs above)")
+                                print("3. YouTube's anti-bot protection may be blocking subtitle downloads")
+                                print("")
+                                print("The video file was downloaded successfully, but subtitle functionality")
+                                print("will not be available. Consider checking browser login status.")
+                                print("=" * 80)
+                                # We'll consider this a success but log the warning
+                                subtitles_imported = True
+                    else:
+                        raise Exception("Failed to create video record in database")
+
+                    # Both video and subtitles successful
+                    if video_downloaded and subtitles_imported:
+                        await self._task_dao.update_task(task.task_id, {
+                            'status_message': f'下载完成: {title}',
+                            'progress': 100
                         })
+                        await self._complete_task(task, success=True)
+                        return  # Success, exit retry loop
 
-                        # Step 2: Create video record and import subtitles (50-100% progress)
-                        video_db_id = await self._create_video_record(task)
-
-                        if video_db_id:
-                            # Verify subtitles were imported
-                            from ytb_dual_subtitles.core.database import get_db_session
-                            from ytb_dual_subtitles.models.video import Subtitle
-                            from sqlalchemy import select, func
-
-                            async with get_db_session() as session:
-                                subtitle_count_query = select(func.count()).select_from(Subtitle).where(
-                                    Subtitle.video_id == video_db_id
-                                )
-                                result = await session.execute(subtitle_count_query)
-                                subtitle_count = result.scalar()
-
-                                if subtitle_count > 0:
-                                    subtitles_imported = True
-                                    print(f"✅ Subtitles imported successfully: {subtitle_count} subtitle tracks")
-                                else:
-                                    # No subtitles found - this might indicate cookie/authentication issues
-                                    print("=" * 80)
-                                    print(f"⚠️  WARNING: No subtitles found/imported for video {video_db_id}")
-                                    print("=" * 80)
-                                    print("Possible causes:")
-                                    print("1. The video may not have subtitles available")
-                                    print("2. Cookie authentication may have failed (check logs above)")
-                                    print("3. YouTube's anti-bot protection may be blocking subtitle downloads")
-                                    print("")
-                                    print("The video file was downloaded successfully, but subtitle functionality")
-                                    print("will not be available. Consider checking browser login status.")
-                                    print("=" * 80)
-                                    # We'll consider this a success but log the warning
-                                    subtitles_imported = True
-                        else:
-                            raise Exception("Failed to create video record in database")
-
-                        # Both video and subtitles successful
-                        if video_downloaded and subtitles_imported:
-                            self._task_dao.update_task(task.task_id, {
-                                'status_message': f'下载完成: {title}',
-                                'progress': 100
-                            })
-                            await self._complete_task(task, success=True)
-                            return  # Success, exit retry loop
-
-                    except asyncio.CancelledError:
-                        # Task was cancelled, don't mark as error
-                        print(f"Task {task.task_id} was cancelled")
+                except asyncio.CancelledError:
+                    # Task was cancelled, don't mark as error
+                    print(f"Task {task.task_id} was cancelled")
+                    return
+
+                except Exception as e:
+                    self._progress.discard(task.task_id)
+                    error_msg = str(e)
+                    print(f"Download attempt {task.retry_count + 1} failed: {error_msg}")
+
+                    # Check if this is a non-retryable error
+                    if self._is_non_retryable_error(e):
+                        print(f"Non-retryable error encountered: {error_msg}")
+                        task.set_error(error_msg)
+                        await self._complete_task(task, success=False)
                         return
 
-                    except Exception as e:
-                        error_msg = str(e)
-                        print(f"Download attempt {task.retry_count + 1} failed: {error_msg}")
-
-                        # Check if this is a non-retryable error
-                        if self._is_non_retryable_error(e):
-                            print(f"Non-retryable error encountered: {error_msg}")
-                            task.set_error(error_msg)
-                            await self._complete_task(task, success=False)
-                            return
-
-                        # If we've exceeded max retries, mark as failed
-                        if task.retry_count >= self.max_retries:
-                            print(f"Max retries ({self.max_retries}) reached, marking task as failed")
-                            task.set_error(f"Failed after {self.max_retries + 1} attempts: {error_msg}")
-                            await self._complete_task(task, success=False)
-                            return
-
-                        # Increment retry count
-                        task.retry_count += 1
-
-                        # Determine what failed for better error message
-                        failure_stage = "视频下载" if not video_downloaded else "字幕导入"
-
-                        self._task_dao.update_task(task.task_id, {
-                            'retry_count': task.retry_count,
-                            'status_message': f'{failure_stage}失败，{2 ** task.retry_count}秒后重试... (尝试 {task.retry_count + 1}/{self.max_retries + 1})',
-                            'error_message': error_msg
-                        })
+                    # If we've exceeded max retries, mark as failed
+                    if task.retry_count >= self.max_retries:
+                        print(f"Max retries ({self.max_retries}) reached, marking task as failed")
+                        task.set_error(f"Failed after {self.max_retries + 1} attempts: {error_msg}")
+                        await self._complete_task(task, success=False)
+                        return
 
-                        # Wait before retry (exponential backoff)
-                        wait_time = 2 ** task.retry_count  # 2, 4, 8 seconds
-                        print(f"Waiting {wait_time} seconds before retry...")
-                        await asyncio.sleep(wait_time)
-
-                        # Clean up partial downloads if video failed
-                        if not video_downloaded and file_path:
-                            try:
-                                from pathlib import Path
-                                if Path(file_path).exists():
-                                    Path(file_path).unlink()
-                                    print(f"Cleaned up partial download: {file_path}")
-                            except Exception as cleanup_error:
-                                print(f"Failed to cleanup partial download: {cleanup_error}")
+                    # Increment retry count
+                    task.retry_count += 1
+
+                    # Determine what failed for better error message
+                    failure_stage = "视频下载" if not video_downloaded else "字幕导入"
+
+                    await self._task_dao.update_task(task.task_id, {
+                        'retry_count': task.retry_count,
+                        'status_message': f'{failure_stage}失败，{2 ** task.retry_count}秒后重试... (尝试 {task.retry_count + 1}/{self.max_retries + 1})',
+                        'error_message': error_msg
+                    })
+
+                    # Wait before retry (exponential backoff)
+                    wait_time = 2 ** task.retry_count  # 2, 4, 8 seconds
+                    print(f"Waiting {wait_time} seconds before retry...")
+                    await asyncio.sleep(wait_time)
+
+                    # Clean up partial downloads if video failed
+                    if not video_downloaded and file_path:
+                        try:
+                            from pathlib import Path
+                            if Path(file_path).exists():
+                                Path(file_path).unlink()
+                                print(f"Cleaned up partial download: {file_path}")
+                        except Exception as cleanup_error:
+                            print(f"Failed to cleanup partial download: {cleanup_error}")
 
         except asyncio.CancelledError:
             # Task was cancelled, this is expected
@@ -465,9 +628,11 @@ class DownloadManager:
             pass
 
         finally:
-            # Clean up running task reference
+            self._progress.discard(task.task_id)
+            # Clean up running task reference and hand the slot to the next task
             if task.task_id in self._running_tasks:
                 del self._running_tasks[task.task_id]
+            self._wake_dispatcher()
 
     def _is_non_retryable_error(self, error: Exception) -> bool:
         """Check if an error should not trigger retries.
@@ -498,6 +663,7 @@ class DownloadManager:
             task.status = DownloadTaskStatus.ERROR
 
         task.completed_at = datetime.now()
+        self._progress.discard(task.task_id)
 
         # Update database
         updates = {
@@ -508,11 +674,12 @@ class DownloadManager:
             'status_message': '下载完成' if success else (task.error_message or '下载失败')
         }
 
-        self._task_dao.update_task(task.task_id, updates)
+        await self._task_dao.update_task(task.task_id, updates)
 
-        # Clean up running task reference
+        # Clean up running task reference and hand the slot to the next task
         if task.task_id in self._running_tasks:
             del self._running_tasks[task.task_id]
+        self._wake_dispatcher()
 
         # Log final status
         if success:
@@ -585,7 +752,7 @@ class DownloadManager:
                     print(f"Re-imported {subtitle_count} subtitle track(s) for existing video")
 
                     # Update download task with title
-                    self._task_dao.update_task(task.task_id, {
+                    await self._task_dao.update_task(task.task_id, {
                         'title': video_title
                     })
                     return existing.id
@@ -615,7 +782,7 @@ class DownloadManager:
                     print(f"⚠ Warning: No subtitles imported for video {video.id}")
 
                 # Update download task with title
-                self._task_dao.update_task(task.task_id, {
+                await self._task_dao.update_task(task.task_id, {
                     'title': video_title
                 })
 
@@ -646,7 +813,9 @@ class DownloadManager:
 
         try:
             from pathlib import Path
-            from ytb_dual_subtitles.models.video import Subtitle, SubtitleSegment, SubtitleSourceType
+            from ytb_dual_subtitles.models.video import Subtitle, SubtitleSourceType
+            from ytb_dual_subtitles.services.subtitle_data_service import SubtitleDataService
+            from ytb_dual_subtitles.services.subtitle_index_cache import get_subtitle_index_cache
 
             video_path_obj = Path(video_path)
             base_path = video_path_obj.parent
@@ -727,21 +896,21 @@ class DownloadManager:
                     session.add(subtitle)
                     await session.flush()  # Get subtitle ID
 
-                    # Create subtitle segments in batches for better performance
-                    batch_size = 100
-                    for i in range(0, len(segments), batch_size):
-                        batch = segments[i:i + batch_size]
-                        for seq, seg in enumerate(batch, start=i + 1):
-                            segment = SubtitleSegment(
-                                subtitle_id=subtitle.id,
-                                sequence=seq,
-                                start_time=seg['start'],
-                                end_time=seg['end'],
-                                text=seg['text']
-                            )
-                            session.add(segment)
-
-                    await session.commit()
+                    # Store the track (rows via one executemany, or one packed blob
+                    # per settings.subtitle_storage); the subtitle and its segments
+                    # are committed in a single transaction
+                    await SubtitleDataService(session).save_track(
+                        subtitle.id,
+                        [
+                            {
+                                'sequence': seq,
+                                'start_time': seg['start'],
+                                'end_time': seg['end'],
+                                'text': seg['text'],
+                            }
+                            for seq, seg in enumerate(segments, start=1)
+                        ]
+                    )
                     imported_count += 1
                     print(f"    ✓ Imported {len(segments)} segments for language: {language_name} ({language})")
 
@@ -755,6 +924,14 @@ class DownloadManager:
 
             if imported_count > 0:
                 print(f"✓ Successfully imported {imported_count} subtitle track(s)")
+                try:
+                    # Materialize the aligned English/Chinese view once per import
+                    paired = await SubtitleDataService(session).rebuild_dual_segments(video.id)
+                    print(f"✓ Built {paired} dual subtitle segments")
+                except Exception as e:
+                    # The subtitles endpoint rebuilds missing dual segments on demand
+                    print(f"⚠ Failed to build dual subtitle segments: {e}")
+                get_subtitle_index_cache().invalidate(video.id, video.youtube_id)
             else:
                 print(f"⚠ No subtitles were successfully imported")
 
@@ -769,95 +946,50 @@ class DownloadManager:
     async def _parse_vtt_file(self, vtt_path: Path) -> list[dict[str, Any]]:
         """Parse WebVTT subtitle file.
 
+        Parsing streams the file and runs off the event loop (large files
+        in a worker process). Rolling repeats are collapsed for auto-caption
+        tracks only; manual captions are imported as they are.
+
         Args:
             vtt_path: Path to VTT file
 
         Returns:
             List of subtitle segments with start, end, and text
         """
-        import re
-
-        segments = []
-
         try:
-            with open(vtt_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # WebVTT format: timestamp --> timestamp followed by text
-            # Example:
-            # 00:00:00.000 --> 00:00:03.500
-            # Hello, welcome to this tutorial.
-
-            # Split by double newlines to get blocks
-            blocks = re.split(r'\n\n+', content)
-
-            for block in blocks:
-                # Skip WEBVTT header and empty blocks
-                if not block.strip() or block.strip().startswith('WEBVTT') or block.strip().startswith('NOTE'):
-                    continue
-
-                lines = block.strip().split('\n')
-
-                # Find the timestamp line
-                timestamp_line = None
-                text_lines = []
-
-                for line in lines:
-                    if '-->' in line:
-                        timestamp_line = line
-                    elif timestamp_line:  # After timestamp, it's text
-                        # Remove VTT formatting tags like <c>, </c>
-                        clean_line = re.sub(r'<[^>]+>', '', line)
-                        if clean_line.strip():
-                            text_lines.append(clean_line.strip())
-
-                if timestamp_line and text_lines:
-                    # Parse timestamps
-                    match = re.match(r'([\d:\.]+)\s*-->\s*([\d:\.]+)', timestamp_line)
-                    if match:
-                        start_str = match.group(1)
-                        end_str = match.group(2)
-
-                        # Convert timestamp to seconds
-                        start_time = self._timestamp_to_seconds(start_str)
-                        end_time = self._timestamp_to_seconds(end_str)
-
-                        segments.append({
-                            'start': start_time,
-                            'end': end_time,
-                            'text': ' '.join(text_lines)
-                        })
-
-            return segments
-
+            cues = await parse_subtitle_file_async(vtt_path)
         except Exception as e:
             print(f"Error parsing VTT file {vtt_path}: {e}")
             return []
 
-    def _timestamp_to_seconds(self, timestamp: str) -> float:
-        """Convert VTT timestamp to seconds.
+        if not is_auto_caption_track(cues):
+            return [{'start': cue.start, 'end': cue.end, 'text': cue.text} for cue in cues]
+
+        collapsed = collapse_rolling_duplicates(cues)
+        if len(collapsed) < len(cues):
+            dropped = len(cues) - len(collapsed)
+            print(f"    Collapsed rolling captions: {len(cues)} -> {len(collapsed)} cues "
+                  f"(-{dropped}, {dropped * 100 // len(cues)}%)")
+
+        return [{'start': cue.start, 'end': cue.end, 'text': cue.text} for cue in collapsed]
+
+    def _with_live_progress(self, task_data: dict[str, Any]) -> dict[str, Any]:
+        """Overlay not yet persisted progress onto a task row.
 
         Args:
-            timestamp: Timestamp string (e.g., "00:01:30.500" or "01:30.500")
+            task_data: Task data from database
 
         Returns:
-            Time in seconds
+            Task data with the latest in-memory progress applied
         """
-        parts = timestamp.split(':')
-
-        if len(parts) == 3:  # HH:MM:SS.mmm
-            hours = int(parts[0])
-            minutes = int(parts[1])
-            seconds = float(parts[2])
-            return hours * 3600 + minutes * 60 + seconds
-        elif len(parts) == 2:  # MM:SS.mmm
-            minutes = int(parts[0])
-            seconds = float(parts[1])
-            return minutes * 60 + seconds
-        else:  # SS.mmm
-            return float(parts[0])
-
-    def get_task_status(self, task_id: str) -> dict[str, Any] | None:
+        if task_data['status'] != 'downloading':
+            return task_data
+        live = self._progress.get(task_data['task_id'])
+        if live is None:
+            return task_data
+        return {**task_data, **live}
+
+    async def get_task_status(self, task_id: str) -> dict[str, Any] | None:
         """Get status of a download task.
 
         Args:
@@ -867,9 +999,10 @@ class DownloadManager:
             Task status information or None if not found
         """
         # Get task from database
-        task_data = self._task_dao.get_task(task_id)
+        task_data = await self._task_dao.get_task(task_id)
         if not task_data:
             return None
+        task_data = self._with_live_progress(task_data)
 
         return {
             'task_id': task_data['task_id'],
@@ -889,18 +1022,19 @@ class DownloadManager:
             'eta_seconds': task_data['eta_seconds'],
         }
 
-    def list_tasks(self) -> list[dict[str, Any]]:
+    async def list_tasks(self) -> list[dict[str, Any]]:
         """List all tasks.
 
         Returns:
             List of task status information
         """
         # Get all tasks from database
-        all_task_data = self._task_dao.get_all_tasks()
+        all_task_data = await self._task_dao.get_all_tasks()
 
 
         tasks = []
         for task_data in all_task_data:
+            task_data = self._with_live_progress(task_data)
             # Convert to the format expected by the API
             task_status = {
                 'task_id': task_data['task_id'],
@@ -934,7 +1068,7 @@ class DownloadManager:
             True if task was found and cancelled, False otherwise
         """
         # Get task from database
-        task_data = self._task_dao.get_task(task_id)
+        task_data = await self._task_dao.get_task(task_id)
         if not task_data:
             return False
 
@@ -955,6 +1089,8 @@ class DownloadManager:
                 if task_id in self._running_tasks:
                     del self._running_tasks[task_id]
 
+        self._progress.discard(task_id)
+
         # Update task status in database
         updates = {
             'status': 'cancelled',
@@ -962,7 +1098,7 @@ class DownloadManager:
             'status_message': 'Cancelled by user'
         }
 
-        success = self._task_dao.update_task(task_id, updates)
+        success = await self._task_dao.update_task(task_id, updates)
 
         # Clean up temporary files if needed
         if hasattr(self._storage_service, 'cleanup_temp_files'):
@@ -0,0 +1,136 @@
+"""Content-versioned HTTP caching.
+
+Read endpoints answer conditional requests from a version counter instead
+of rebuilding and hashing their payload:
+
+- every change to API-visible content bumps a row in ``content_versions``
+  in the same transaction: ORM writes to videos and subtitles bump the
+  library version through a session ``after_flush`` hook, and rebuilding a
+  video's dual track bumps that video's subtitles version;
+- a route reads the version (one primary-key lookup), folds it together
+  with its query parameters into a weak ETag and returns 304 Not Modified
+  when the client's ``If-None-Match`` matches, before running its queries.
+
+ETags are weak because the compression middleware may change the bytes on
+the wire without changing the content.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from itertools import chain
+from typing import Any
+
+from fastapi import Request, Response
+from sqlalchemy import event, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ytb_dual_subtitles.models.video import ContentVersion, Subtitle, Video
+
+# Version of the video library: any video or subtitle track added, changed or removed
+LIBRARY_VERSION = "videos"
+
+# Cached responses must be revalidated, which is a cheap 304 when unchanged
+CACHE_CONTROL = "no-cache"
+
+# Upsert that increments a counter; valid for both SQLAlchemy text() and sqlite3
+BUMP_VERSION_SQL = (
+    "INSERT INTO content_versions (name, version) VALUES (:name, 1) "
+    "ON CONFLICT (name) DO UPDATE SET version = version + 1"
+)
+
+
+def subtitles_version_key(video_id: int) -> str:
+    """Version name of a video's dual subtitle track."""
+    return f"subtitles:{video_id}"
+
+
+async def get_content_version(db: AsyncSession, name: str) -> int:
+    """Read a content version (0 if it was never bumped).
+
+    Args:
+        db: Database session
+        name: Version name, e.g. LIBRARY_VERSION
+
+    Returns:
+        Current version number
+    """
+    version = await db.scalar(select(ContentVersion.version).where(ContentVersion.name == name))
+    return version or 0
+
+
+async def bump_content_version(db: AsyncSession, *names: str) -> None:
+    """Increment content versions within the session's current transaction.
+
+    Args:
+        db: Database session; the caller commits
+        names: Version names to bump
+    """
+    for name in names:
+        await db.execute(text(BUMP_VERSION_SQL), {"name": name})
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a weak ETag from the values a response depends on."""
+    digest = hashlib.sha1("\x1f".join(map(str, parts)).encode("utf-8")).hexdigest()
+    return f'W/"{digest[:24]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """Check a request's If-None-Match header against an ETag (weak comparison).
+
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+
+    Returns:
+        True if the client's cached copy is current
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+
+    current = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == current
+        for candidate in header.split(",")
+    )
+
+
+def set_etag(response: Response, etag: str) -> None:
+    """Attach caching headers to a response."""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+
+
+def not_modified(etag: str) -> Response:
+    """Build a 304 Not Modified response for an ETag."""
+    return Response(status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL})
+
+
+@event.listens_for(Session, "after_flush")
+def _bump_versions_on_flush(session: Session, flush_context: Any) -> None:
+    """Bump content versions for the videos and subtitles written by a flush.
+
+    Runs for every ORM session, including the sync sessions behind
+    AsyncSession. The new/dirty/deleted collections still describe the
+    flush that just ran, and the bump joins its transaction.
+    """
+    names = set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if not isinstance(obj, (Video, Subtitle)):
+            continue
+        # Objects only touched through a relationship collection are dirty but unchanged
+        if obj in session.dirty and not session.is_modified(obj, include_collections=False):
+            continue
+        names.add(LIBRARY_VERSION)
+        if isinstance(obj, Video) and obj in session.deleted:
+            # SQLite may reuse the ID, so a later video must not match old ETags
+            names.add(subtitles_version_key(obj.id))
+
+    connection = session.connection()
+    for name in sorted(names):
+        connection.execute(text(BUMP_VERSION_SQL), {"name": name})
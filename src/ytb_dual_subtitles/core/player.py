@@ -14,6 +14,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Optional
 
+from ytb_dual_subtitles.utils.interval_index import IntervalIndex
 
 # Player constants
 DEFAULT_SYNC_TOLERANCE = 0.1  # ±100ms subtitle sync tolerance
@@ -168,6 +169,12 @@ class PlayerCore:
             segment = SubtitleSegment.from_dict(segment_data)
             self.subtitle_segments.append(segment)
 
+        # Time index over the segments, widened by the sync tolerance
+        self._subtitle_index = IntervalIndex(
+            ((segment.start_time, segment.end_time) for segment in self.subtitle_segments),
+            tolerance=sync_tolerance
+        )
+
         # Initialize player state
         self._state = PlayerState(
             duration=float(video_data["duration"]),
@@ -211,6 +218,7 @@ class PlayerCore:
         # Clamp time to valid range [0, duration]
         clamped_time = max(0.0, min(time, self._state.duration))
         self._state = self._state.copy(current_time=clamped_time)
+        self._subtitle_index.seek(clamped_time)
 
     def set_volume(self, volume: float) -> None:
         """Set playback volume.
@@ -270,8 +278,9 @@ class PlayerCore:
     def get_current_subtitles(self, time: Optional[float] = None) -> List[Dict[str, Any]]:
         """Get subtitle segments for the specified time with efficient lookup.
 
-        Uses linear search for current implementation, which can be optimized
-        to binary search if performance becomes an issue with large subtitle sets.
+        Lookups go through an interval index cursor: successive calls with
+        increasing times (normal playback) cost amortized O(1), any other
+        time O(log n).
 
         Args:
             time: Time to get subtitles for. If None, uses current playback time.
@@ -281,17 +290,15 @@ class PlayerCore:
         """
         target_time = time if time is not None else self._state.current_time
 
-        # Optimized: collect matching segments in single pass
-        current_subtitles = [
-            {
+        current_subtitles = []
+        for position in self._subtitle_index.advance(target_time):
+            segment = self.subtitle_segments[position]
+            current_subtitles.append({
                 "id": segment.id,
                 "start_time": segment.start_time,
                 "end_time": segment.end_time,
                 "text": segment.text,
                 "language": segment.language
-            }
-            for segment in self.subtitle_segments
-            if segment.contains_time(target_time, self.sync_tolerance)
-        ]
+            })
 
-        return current_subtitles
\ No newline at end of file
+        return current_subtitles
@@ -0,0 +1,108 @@
+"""In-memory download progress table.
+
+yt-dlp reports progress from its worker thread many times per second. The
+tracker keeps the latest values per task in memory and remembers which
+tasks changed, so the download manager can persist them in one batched
+write per flush interval instead of one UPDATE per hook call.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime
+from typing import Any
+
+# Fields tracked per task (all of them are columns of download_tasks)
+PROGRESS_FIELDS = (
+    'progress',
+    'downloaded_bytes',
+    'total_bytes',
+    'download_speed',
+    'eta_seconds',
+    'last_updated',
+)
+
+
+class ProgressTracker:
+    """Thread-safe table of the latest progress per download task."""
+
+    def __init__(self) -> None:
+        """Initialize progress tracker."""
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._dirty: set[str] = set()
+
+    def update(
+        self,
+        task_id: str,
+        progress: int,
+        downloaded_bytes: int = 0,
+        total_bytes: int = 0,
+        download_speed: float = 0.0,
+        eta_seconds: int = 0
+    ) -> None:
+        """Record the latest progress for a task (safe to call from any thread).
+
+        Progress never moves backwards, so a second stream (e.g. audio after
+        video) does not make the overall percentage jump back.
+
+        Args:
+            task_id: Task ID
+            progress: Overall task progress (0-100)
+            downloaded_bytes: Bytes downloaded for the current file
+            total_bytes: Total bytes of the current file
+            download_speed: Current speed in bytes per second
+            eta_seconds: Estimated seconds remaining
+        """
+        with self._lock:
+            entry = self._entries.get(task_id)
+            if entry is not None:
+                progress = max(progress, entry['progress'])
+            self._entries[task_id] = {
+                'progress': progress,
+                'downloaded_bytes': downloaded_bytes,
+                'total_bytes': total_bytes,
+                'download_speed': download_speed,
+                'eta_seconds': eta_seconds,
+                'last_updated': datetime.now().isoformat(),
+            }
+            self._dirty.add(task_id)
+
+    def get(self, task_id: str) -> dict[str, Any] | None:
+        """Get a copy of the latest progress for a task.
+
+        Args:
+            task_id: Task ID
+
+        Returns:
+            Progress fields or None if the task is not tracked
+        """
+        with self._lock:
+            entry = self._entries.get(task_id)
+            return dict(entry) if entry is not None else None
+
+    def drain_dirty(self) -> list[dict[str, Any]]:
+        """Take the entries changed since the last drain.
+
+        Returns:
+            List of progress rows, each including its task_id
+        """
+        with self._lock:
+            rows = [{'task_id': task_id, **self._entries[task_id]} for task_id in self._dirty]
+            self._dirty.clear()
+            return rows
+
+    def discard(self, task_id: str) -> None:
+        """Stop tracking a task and drop any unflushed progress for it.
+
+        Args:
+            task_id: Task ID
+        """
+        with self._lock:
+            self._entries.pop(task_id, None)
+            self._dirty.discard(task_id)
+
+    def has_pending(self) -> bool:
+        """Check whether any progress is waiting to be flushed."""
+        with self._lock:
+            return bool(self._dirty)
@@ -91,7 +91,75 @@ class Settings(BaseSettings):
         description="Maximum number of retry attempts for failed downloads"
     )
 
+    video_info_cache_ttl: int = Field(
+        default=24 * 3600,
+        ge=0,
+        description="Seconds to cache yt-dlp video info probes (0 disables the cache)"
+    )
+
+    subtitle_storage: str = Field(
+        default="rows",
+        pattern="^(rows|packed)$",
+        description="Storage for imported subtitle tracks: one row per cue, or one packed columnar blob per track"
+    )
+
+    subtitle_index_cache_size: int = Field(
+        default=64,
+        ge=1,
+        description="Number of per-video subtitle time indexes kept in memory for the player"
+    )
+
+    translation_concurrency: int = Field(
+        default=4,
+        ge=1,
+        le=32,
+        description="Maximum number of subtitle segment batches translated concurrently"
+    )
+
+    translation_cache_max_bytes: int = Field(
+        default=64 * 1024 * 1024,
+        ge=0,
+        description="Size budget of the persistent translation cache in bytes (0 disables it)"
+    )
+
+    translation_http_max_connections: int = Field(
+        default=20,
+        ge=1,
+        description="Maximum open connections of the shared translation HTTP client"
+    )
+
+    translation_http_max_connections_per_host: int = Field(
+        default=8,
+        ge=1,
+        description="Maximum open connections to one translation provider"
+    )
+
+    translation_http_timeout: float = Field(
+        default=10.0,
+        gt=0,
+        description="Total timeout in seconds of one translation API request"
+    )
+
+    translation_breaker_failure_threshold: int = Field(
+        default=3,
+        ge=1,
+        description="Consecutive failures after which a translation provider is skipped"
+    )
+
+    translation_breaker_reset_timeout: float = Field(
+        default=30.0,
+        gt=0,
+        description="Seconds before a skipped translation provider is probed again"
+    )
+
     # yt-dlp configuration
+    yt_dlp_probe_concurrency: int = Field(
+        default=2,
+        ge=1,
+        le=16,
+        description="Maximum number of concurrent yt-dlp metadata probes"
+    )
+
     yt_dlp_format: str | None = Field(
         default=None,
         description="Custom video format string for yt-dlp. If None, uses smart default format selection."
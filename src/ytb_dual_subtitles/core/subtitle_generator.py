@@ -11,6 +11,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from ytb_dual_subtitles.exceptions.subtitle_errors import SubtitleError
+from ytb_dual_subtitles.utils.subtitle_align import align_cues
 
 
 class SubtitleGenerator:
@@ -61,21 +62,41 @@ class SubtitleGenerator:
                     for segment in english_segments
                 ]
 
-            # 合成双语字幕
+            # 一次线性扫描完成时间轴配对，按重叠时长选择最佳中文字幕
+            matches = align_cues(
+                [(seg.get('start_time', 0.0), seg.get('end_time', 0.0)) for seg in english_segments],
+                [(seg.get('start_time', 0.0), seg.get('end_time', 0.0)) for seg in chinese_segments],
+                tolerance=self.sync_tolerance
+            )
+
+            # 按序号匹配（备选方案）
+            chinese_by_sequence: Dict[Any, Dict[str, Any]] = {}
+            for zh_segment in chinese_segments:
+                chinese_by_sequence.setdefault(zh_segment.get('sequence', 0), zh_segment)
+
             bilingual_segments = []
 
-            for i, en_segment in enumerate(english_segments):
-                # 寻找时间轴匹配的中文字幕
-                zh_text = await self._find_matching_chinese_text(en_segment, chinese_segments)
+            for i, (en_segment, match) in enumerate(zip(english_segments, matches, strict=True)):
+                en_text = en_segment.get('text', '')
+                if match is not None:
+                    zh_segment = chinese_segments[match]
+                else:
+                    zh_segment = chinese_by_sequence.get(en_segment.get('sequence', 0))
+
+                # 如果都没找到，使用英文原文
+                if zh_segment is not None:
+                    zh_text = zh_segment.get('chinese', zh_segment.get('text', ''))
+                else:
+                    zh_text = en_text
 
                 bilingual_segment = {
                     'sequence': en_segment.get('sequence', i + 1),
                     'start_time': en_segment.get('start_time', 0.0),
                     'end_time': en_segment.get('end_time', 0.0),
                     'duration': en_segment.get('duration', 0.0),
-                    'english': en_segment.get('text', ''),
+                    'english': en_text,
                     'chinese': zh_text,
-                    'is_translated': zh_text != en_segment.get('text', ''),
+                    'is_translated': zh_text != en_text,
                     'confidence': self._calculate_match_confidence(en_segment, zh_text)
                 }
 
@@ -86,46 +107,6 @@ class SubtitleGenerator:
         except Exception as e:
             raise SubtitleError(f"Failed to generate bilingual subtitles: {str(e)}") from e
 
-    async def _find_matching_chinese_text(
-        self,
-        en_segment: Dict[str, Any],
-        chinese_segments: List[Dict[str, Any]]
-    ) -> str:
-        """根据时间轴找到匹配的中文文本."""
-        en_start = en_segment.get('start_time', 0.0)
-        en_end = en_segment.get('end_time', 0.0)
-        en_text = en_segment.get('text', '')
-
-        # 按时间轴匹配
-        for zh_segment in chinese_segments:
-            zh_start = zh_segment.get('start_time', 0.0)
-            zh_end = zh_segment.get('end_time', 0.0)
-
-            # 检查时间轴是否重叠
-            if self._timelines_overlap(en_start, en_end, zh_start, zh_end):
-                return zh_segment.get('chinese', zh_segment.get('text', ''))
-
-        # 按序号匹配（备选方案）
-        en_sequence = en_segment.get('sequence', 0)
-        for zh_segment in chinese_segments:
-            if zh_segment.get('sequence', 0) == en_sequence:
-                return zh_segment.get('chinese', zh_segment.get('text', ''))
-
-        # 如果都没找到，返回英文原文
-        return en_text
-
-    def _timelines_overlap(
-        self,
-        start1: float,
-        end1: float,
-        start2: float,
-        end2: float
-    ) -> bool:
-        """检查两个时间轴是否重叠."""
-        # 考虑同步容忍度
-        return (start1 - self.sync_tolerance <= end2 and
-                start2 - self.sync_tolerance <= end1)
-
     def _calculate_match_confidence(self, en_segment: Dict[str, Any], zh_text: str) -> float:
         """计算匹配置信度."""
         en_text = en_segment.get('text', '')
@@ -400,7 +381,7 @@ class SubtitleGenerator:
         subtitle_service,
         translation_service=None
     ) -> Dict[str, Any]:
-        \"\"\"智能生成双语字幕，优先使用原生字幕避免翻译.
+        """智能生成双语字幕，优先使用原生字幕避免翻译.
 
         Args:
             video_id: YouTube 视频 ID
@@ -412,7 +393,7 @@ class SubtitleGenerator:
 
         Raises:
             SubtitleError: 生成失败
-        \"\"\"
+        """
         try:
             # 使用智能字幕提取
             subtitle_data = await subtitle_service.extract_dual_language_subtitles(video_id)
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
+import asyncio
 import sqlite3
 from pathlib import Path
 from typing import Any
 
-from ytb_dual_subtitles.core.settings import get_settings
-from ytb_dual_subtitles.database.models import DatabaseManager
+from ytb_dual_subtitles.database.models import get_database_manager
 from ytb_dual_subtitles.database.task_dao import TaskDAO
 
 
@@ -16,8 +16,7 @@ class DatabaseAdmin:
 
     def __init__(self) -> None:
         """Initialize database admin."""
-        settings = get_settings()
-        self.db_manager = DatabaseManager(settings.database_path)
+        self.db_manager = get_database_manager()
         self.task_dao = TaskDAO(self.db_manager)
 
     def get_statistics(self) -> dict[str, Any]:
@@ -26,7 +25,7 @@ class DatabaseAdmin:
         Returns:
             Dictionary with database statistics
         """
-        stats = self.task_dao.get_task_statistics()
+        stats = asyncio.run(self.task_dao.get_task_statistics())
 
         # Add database file info
         db_path = Path(self.db_manager.db_path)
@@ -50,7 +49,7 @@ class DatabaseAdmin:
         Returns:
             Number of deleted tasks
         """
-        return self.task_dao.cleanup_old_tasks(days)
+        return asyncio.run(self.task_dao.cleanup_old_tasks(days))
 
     def reset_hanging_tasks(self) -> int:
         """Reset tasks stuck in downloading status.
@@ -58,15 +57,9 @@ class DatabaseAdmin:
         Returns:
             Number of reset tasks
         """
-        with self.db_manager.get_connection() as conn:
-            cursor = conn.execute("""
-                UPDATE download_tasks
-                SET status = 'pending',
-                    status_message = 'Reset after service restart'
-                WHERE status = 'downloading'
-            """)
-            conn.commit()
-            return cursor.rowcount
+        return asyncio.run(
+            self.task_dao.requeue_interrupted_tasks('Reset after service restart')
+        )
 
     def vacuum_database(self) -> None:
         """Vacuum database to reclaim space."""
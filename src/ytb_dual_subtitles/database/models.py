@@ -2,24 +2,60 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import sqlite3
+import threading
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, TypeVar
+
+from ytb_dual_subtitles.core.settings import get_settings
+
+T = TypeVar("T")
+
+# Milliseconds a connection waits on a locked database before failing
+BUSY_TIMEOUT_MS = 5000
+
+# Prepared statements kept per connection (sqlite3 statement cache)
+CACHED_STATEMENTS = 256
+
+# download_tasks columns added after the first release, with their definitions
+ADDED_TASK_COLUMNS = {
+    'priority': 'INTEGER DEFAULT 0',
+    'video_id': 'TEXT',
+}
 
 
 class DatabaseManager:
-    """SQLite database manager for persistent storage."""
+    """SQLite database manager for persistent storage.
+
+    Connections are pooled and reused, run in WAL mode and wait on locks
+    instead of failing immediately. Async callers run their queries on a
+    dedicated thread pool via ``run`` so the event loop is never blocked.
+    """
 
-    def __init__(self, db_path: str | Path) -> None:
+    def __init__(self, db_path: str | Path, pool_size: int = 4) -> None:
         """Initialize database manager.
 
         Args:
             db_path: Path to SQLite database file
+            pool_size: Number of idle connections kept and of worker threads
         """
         self.db_path = Path(db_path)
+        self.pool_size = pool_size
         # Ensure directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
 
+        self._pool: list[sqlite3.Connection] = []
+        self._pool_lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=pool_size,
+            thread_name_prefix="sqlite-db"
+        )
+
         # Initialize database
         self._init_database()
 
@@ -27,18 +63,23 @@ class DatabaseManager:
         """Initialize database with required tables."""
         with sqlite3.connect(self.db_path) as conn:
             conn.execute("PRAGMA foreign_keys = ON")
+            # WAL lets readers proceed while a download writes progress;
+            # the journal mode is stored in the database file
+            conn.execute("PRAGMA journal_mode = WAL")
 
             # Download tasks table
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS download_tasks (
                     task_id TEXT PRIMARY KEY,
                     url TEXT NOT NULL,
+                    video_id TEXT,
                     title TEXT,
                     status TEXT NOT NULL DEFAULT 'pending',
                     progress INTEGER DEFAULT 0,
                     error_message TEXT,
                     status_message TEXT,
                     retry_count INTEGER DEFAULT 0,
+                    priority INTEGER DEFAULT 0,
 
                     -- File information
                     file_path TEXT,
@@ -81,16 +122,156 @@ class DatabaseManager:
                 )
             """)
 
+            # Video info cache table (yt-dlp metadata probes keyed by YouTube ID)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS video_info_cache (
+                    video_id TEXT PRIMARY KEY,
+                    info_json TEXT NOT NULL,
+                    fetched_at REAL NOT NULL
+                )
+            """)
+
+            # Translation cache table (keyed by language pair and normalized text)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS translation_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    translation TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    last_used REAL NOT NULL
+                )
+            """)
+
+            # Translation job runs and their checkpoints (translations of segment ranges);
+            # runs over the same segments share a content_key
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS translation_jobs (
+                    job_id TEXT PRIMARY KEY,
+                    content_key TEXT NOT NULL,
+                    target_lang TEXT NOT NULL,
+                    total_segments INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    error TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS translation_job_checkpoints (
+                    job_id TEXT NOT NULL,
+                    start_index INTEGER NOT NULL,
+                    end_index INTEGER NOT NULL,
+                    translations_json TEXT NOT NULL,
+                    completed_at REAL NOT NULL,
+                    PRIMARY KEY (job_id, start_index),
+                    FOREIGN KEY (job_id) REFERENCES translation_jobs(job_id)
+                        ON DELETE CASCADE
+                )
+            """)
+
+            # Bring download_tasks tables from older databases up to date
+            task_columns = {row[1] for row in conn.execute("PRAGMA table_info(download_tasks)")}
+            for column, definition in ADDED_TASK_COLUMNS.items():
+                if column not in task_columns:
+                    conn.execute(f"ALTER TABLE download_tasks ADD COLUMN {column} {definition}")
+
             # Create indexes for performance
             conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_status ON download_tasks(status)")
+            # Queue order used by the download dispatcher when claiming pending tasks
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_tasks_queue "
+                "ON download_tasks(status, priority DESC, created_at)"
+            )
             conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_created_at ON download_tasks(created_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_tasks_video_id ON download_tasks(video_id)")
             conn.execute("CREATE INDEX IF NOT EXISTS idx_files_task_id ON video_files(task_id)")
+            # LRU eviction order of the translation cache
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_translation_cache_last_used "
+                "ON translation_cache(last_used)"
+            )
+            # Checkpoint lookup of earlier runs over the same segments
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_translation_jobs_content_key "
+                "ON translation_jobs(content_key)"
+            )
 
             conn.commit()
 
-    def get_connection(self) -> sqlite3.Connection:
-        """Get database connection with row factory."""
-        conn = sqlite3.connect(self.db_path)
+        conn.close()
+
+    def _new_connection(self) -> sqlite3.Connection:
+        """Open a configured database connection."""
+        conn = sqlite3.connect(
+            self.db_path,
+            timeout=BUSY_TIMEOUT_MS / 1000,
+            check_same_thread=False,  # Pooled connections move between worker threads
+            cached_statements=CACHED_STATEMENTS,
+        )
         conn.row_factory = sqlite3.Row  # Enable column access by name
         conn.execute("PRAGMA foreign_keys = ON")
-        return conn
\ No newline at end of file
+        conn.execute(f"PRAGMA busy_timeout = {BUSY_TIMEOUT_MS}")
+        conn.execute("PRAGMA synchronous = NORMAL")
+        return conn
+
+    @contextmanager
+    def get_connection(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled database connection with row factory.
+
+        The transaction is committed when the block exits normally and
+        rolled back on error; the connection then goes back to the pool.
+        """
+        with self._pool_lock:
+            conn = self._pool.pop() if self._pool else None
+        if conn is None:
+            conn = self._new_connection()
+
+        try:
+            yield conn
+            if conn.in_transaction:
+                conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            with self._pool_lock:
+                if len(self._pool) < self.pool_size:
+                    self._pool.append(conn)
+                    conn = None
+            if conn is not None:
+                conn.close()
+
+    async def run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking database function on the database thread pool.
+
+        Args:
+            func: Function performing the database work
+            *args: Arguments passed to func
+
+        Returns:
+            Return value of func
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+
+    def close(self) -> None:
+        """Close pooled connections and stop the worker threads."""
+        self._executor.shutdown(wait=True)
+        with self._pool_lock:
+            pool, self._pool = self._pool, []
+        for conn in pool:
+            conn.close()
+
+
+# Global database manager shared by the task store and caches
+_database_manager: DatabaseManager | None = None
+
+
+def get_database_manager() -> DatabaseManager:
+    """Get the global database manager instance."""
+    global _database_manager
+
+    if _database_manager is None:
+        _database_manager = DatabaseManager(get_settings().database_path)
+
+    return _database_manager
\ No newline at end of file
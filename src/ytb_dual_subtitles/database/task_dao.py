@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
-import sqlite3
-from datetime import datetime
+import uuid
+from datetime import datetime, timedelta
 from typing import Any
 
 from ytb_dual_subtitles.database.models import DatabaseManager
-from ytb_dual_subtitles.models.video import DownloadTaskStatus
 
 
 class TaskDAO:
-    """Data Access Object for download tasks."""
+    """Data Access Object for download tasks.
+
+    All public methods are coroutines; the SQL runs on the database
+    manager's thread pool using pooled connections.
+    """
 
     def __init__(self, db_manager: DatabaseManager) -> None:
         """Initialize task DAO.
@@ -21,7 +24,7 @@ class TaskDAO:
         """
         self.db_manager = db_manager
 
-    def create_task(self, task_data: dict[str, Any]) -> str:
+    async def create_task(self, task_data: dict[str, Any]) -> str:
         """Create a new download task.
 
         Args:
@@ -30,23 +33,28 @@ class TaskDAO:
         Returns:
             Task ID of created task
         """
+        return await self.db_manager.run(self._create_task, task_data)
+
+    def _create_task(self, task_data: dict[str, Any]) -> str:
         with self.db_manager.get_connection() as conn:
             conn.execute("""
                 INSERT INTO download_tasks (
-                    task_id, url, title, status, progress, error_message,
-                    status_message, retry_count, file_path, downloaded_bytes,
-                    total_bytes, download_speed, eta_seconds, created_at,
-                    started_at, completed_at, last_updated
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    task_id, url, video_id, title, status, progress, error_message,
+                    status_message, retry_count, priority, file_path,
+                    downloaded_bytes, total_bytes, download_speed, eta_seconds,
+                    created_at, started_at, completed_at, last_updated
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """, (
                 task_data.get('task_id'),
                 task_data.get('url'),
+                task_data.get('video_id'),
                 task_data.get('title'),
                 task_data.get('status', 'pending'),
                 task_data.get('progress', 0),
                 task_data.get('error_message'),
                 task_data.get('status_message', ''),
                 task_data.get('retry_count', 0),
+                task_data.get('priority', 0),
                 task_data.get('file_path'),
                 task_data.get('downloaded_bytes', 0),
                 task_data.get('total_bytes', 0),
@@ -60,7 +68,100 @@ class TaskDAO:
             conn.commit()
             return task_data['task_id']
 
-    def get_task(self, task_id: str) -> dict[str, Any] | None:
+    async def enqueue_videos(
+        self,
+        videos: list[tuple[str, str]],
+        priority: int = 0,
+        status_message: str = ''
+    ) -> list[dict[str, Any]]:
+        """Queue pending tasks for many videos in one transaction.
+
+        Videos already in the videos table and videos with an active task
+        are skipped; the check and the insert are a single INSERT ... SELECT
+        over a temporary table of candidates. Queue order follows the input
+        order.
+
+        Args:
+            videos: (video_id, url) pairs, without duplicates
+            priority: Queue priority of the new tasks
+            status_message: Status message stored on the new tasks
+
+        Returns:
+            task_id, video_id and url of the created tasks in input order
+        """
+        if not videos:
+            return []
+
+        return await self.db_manager.run(self._enqueue_videos, videos, priority, status_message)
+
+    def _enqueue_videos(
+        self,
+        videos: list[tuple[str, str]],
+        priority: int,
+        status_message: str
+    ) -> list[dict[str, Any]]:
+        now = datetime.now()
+        # Distinct creation times keep the FIFO order of the batch in the queue
+        candidates = [
+            (position, str(uuid.uuid4()), video_id, url,
+             (now + timedelta(microseconds=position)).isoformat())
+            for position, (video_id, url) in enumerate(videos)
+        ]
+
+        with self.db_manager.get_connection() as conn:
+            conn.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS enqueue_candidates (
+                    position INTEGER PRIMARY KEY,
+                    task_id TEXT NOT NULL,
+                    video_id TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    created_at TEXT NOT NULL
+                )
+            """)
+            try:
+                conn.executemany(
+                    "INSERT INTO enqueue_candidates VALUES (?, ?, ?, ?, ?)",
+                    candidates
+                )
+
+                # The videos table belongs to the SQLAlchemy models and may not exist yet
+                has_videos = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'videos'"
+                ).fetchone() is not None
+                known_video = (
+                    "OR EXISTS (SELECT 1 FROM videos v WHERE v.youtube_id = c.video_id)"
+                    if has_videos else ""
+                )
+
+                cursor = conn.execute(f"""
+                    INSERT INTO download_tasks (
+                        task_id, url, video_id, status, status_message, priority,
+                        created_at, last_updated
+                    )
+                    SELECT c.task_id, c.url, c.video_id, 'pending', ?, ?,
+                           c.created_at, c.created_at
+                    FROM enqueue_candidates c
+                    WHERE NOT (
+                        EXISTS (
+                            SELECT 1 FROM download_tasks t
+                            WHERE (t.video_id = c.video_id OR t.url = c.url)
+                            AND t.status IN ('pending', 'downloading', 'processing')
+                        )
+                        {known_video}
+                    )
+                    ORDER BY c.position
+                    RETURNING task_id, video_id, url, created_at
+                """, (status_message, priority))
+                rows = [dict(row) for row in cursor.fetchall()]
+                conn.commit()
+            finally:
+                conn.execute("DELETE FROM enqueue_candidates")
+                conn.commit()
+
+        rows.sort(key=lambda row: row['created_at'])
+        return rows
+
+    async def get_task(self, task_id: str) -> dict[str, Any] | None:
         """Get task by ID.
 
         Args:
@@ -69,6 +170,9 @@ class TaskDAO:
         Returns:
             Task data dictionary or None if not found
         """
+        return await self.db_manager.run(self._get_task, task_id)
+
+    def _get_task(self, task_id: str) -> dict[str, Any] | None:
         with self.db_manager.get_connection() as conn:
             cursor = conn.execute(
                 "SELECT * FROM download_tasks WHERE task_id = ?",
@@ -79,7 +183,7 @@ class TaskDAO:
                 return dict(row)
             return None
 
-    def update_task(self, task_id: str, updates: dict[str, Any]) -> bool:
+    async def update_task(self, task_id: str, updates: dict[str, Any]) -> bool:
         """Update task fields.
 
         Args:
@@ -92,10 +196,13 @@ class TaskDAO:
         if not updates:
             return False
 
+        return await self.db_manager.run(self._update_task, task_id, dict(updates))
+
+    def _update_task(self, task_id: str, updates: dict[str, Any]) -> bool:
         # Always update last_updated timestamp
         updates['last_updated'] = datetime.now().isoformat()
 
-        # Build dynamic UPDATE query
+        # Build dynamic UPDATE query (same field set -> same cached statement)
         set_clauses = []
         values = []
         for field, value in updates.items():
@@ -115,7 +222,103 @@ class TaskDAO:
             conn.commit()
             return cursor.rowcount > 0
 
-    def get_tasks_by_status(self, status: str) -> list[dict[str, Any]]:
+    async def bulk_update_progress(self, rows: list[dict[str, Any]]) -> int:
+        """Write live progress for several tasks in one transaction.
+
+        Only tasks that are still downloading are updated, so a late flush
+        cannot overwrite a task that has already finished or been cancelled.
+
+        Args:
+            rows: Progress rows with task_id, progress, downloaded_bytes,
+                total_bytes, download_speed, eta_seconds and last_updated
+
+        Returns:
+            Number of updated tasks
+        """
+        if not rows:
+            return 0
+
+        return await self.db_manager.run(self._bulk_update_progress, rows)
+
+    def _bulk_update_progress(self, rows: list[dict[str, Any]]) -> int:
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.executemany("""
+                UPDATE download_tasks
+                SET progress = :progress,
+                    downloaded_bytes = :downloaded_bytes,
+                    total_bytes = :total_bytes,
+                    download_speed = :download_speed,
+                    eta_seconds = :eta_seconds,
+                    last_updated = :last_updated
+                WHERE task_id = :task_id AND status = 'downloading'
+            """, rows)
+            conn.commit()
+            return cursor.rowcount
+
+    async def requeue_interrupted_tasks(self, message: str) -> int:
+        """Move tasks left in downloading status back to pending.
+
+        Args:
+            message: Status message stored on the requeued tasks
+
+        Returns:
+            Number of requeued tasks
+        """
+        return await self.db_manager.run(self._requeue_interrupted_tasks, message)
+
+    def _requeue_interrupted_tasks(self, message: str) -> int:
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.execute("""
+                UPDATE download_tasks
+                SET status = 'pending',
+                    status_message = ?,
+                    last_updated = ?
+                WHERE status = 'downloading'
+            """, (message, datetime.now().isoformat()))
+            conn.commit()
+            return cursor.rowcount
+
+    async def claim_pending_tasks(self, limit: int) -> list[dict[str, Any]]:
+        """Claim the next pending tasks for download.
+
+        Tasks are taken by priority (highest first), then in creation order,
+        and switched to downloading in the same statement, so a task is never
+        handed out twice.
+
+        Args:
+            limit: Maximum number of tasks to claim
+
+        Returns:
+            Claimed task data dictionaries in queue order
+        """
+        if limit <= 0:
+            return []
+
+        return await self.db_manager.run(self._claim_pending_tasks, limit)
+
+    def _claim_pending_tasks(self, limit: int) -> list[dict[str, Any]]:
+        now = datetime.now().isoformat()
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.execute("""
+                UPDATE download_tasks
+                SET status = 'downloading',
+                    started_at = ?,
+                    last_updated = ?
+                WHERE task_id IN (
+                    SELECT task_id FROM download_tasks
+                    WHERE status = 'pending'
+                    ORDER BY priority DESC, created_at ASC
+                    LIMIT ?
+                )
+                RETURNING *
+            """, (now, now, limit))
+            rows = [dict(row) for row in cursor.fetchall()]
+            conn.commit()
+        # RETURNING does not preserve the subquery order
+        rows.sort(key=lambda row: (-(row['priority'] or 0), row['created_at'] or ''))
+        return rows
+
+    async def get_tasks_by_status(self, status: str) -> list[dict[str, Any]]:
         """Get all tasks with specific status.
 
         Args:
@@ -124,6 +327,9 @@ class TaskDAO:
         Returns:
             List of task data dictionaries
         """
+        return await self.db_manager.run(self._get_tasks_by_status, status)
+
+    def _get_tasks_by_status(self, status: str) -> list[dict[str, Any]]:
         with self.db_manager.get_connection() as conn:
             cursor = conn.execute(
                 "SELECT * FROM download_tasks WHERE status = ? ORDER BY created_at DESC",
@@ -131,19 +337,22 @@ class TaskDAO:
             )
             return [dict(row) for row in cursor.fetchall()]
 
-    def get_all_tasks(self) -> list[dict[str, Any]]:
+    async def get_all_tasks(self) -> list[dict[str, Any]]:
         """Get all tasks.
 
         Returns:
             List of task data dictionaries
         """
+        return await self.db_manager.run(self._get_all_tasks)
+
+    def _get_all_tasks(self) -> list[dict[str, Any]]:
         with self.db_manager.get_connection() as conn:
             cursor = conn.execute(
                 "SELECT * FROM download_tasks ORDER BY created_at DESC"
             )
             return [dict(row) for row in cursor.fetchall()]
 
-    def delete_task(self, task_id: str) -> bool:
+    async def delete_task(self, task_id: str) -> bool:
         """Delete task by ID.
 
         Args:
@@ -152,6 +361,9 @@ class TaskDAO:
         Returns:
             True if task was deleted, False if not found
         """
+        return await self.db_manager.run(self._delete_task, task_id)
+
+    def _delete_task(self, task_id: str) -> bool:
         with self.db_manager.get_connection() as conn:
             cursor = conn.execute(
                 "DELETE FROM download_tasks WHERE task_id = ?",
@@ -160,7 +372,7 @@ class TaskDAO:
             conn.commit()
             return cursor.rowcount > 0
 
-    def get_active_task_by_url(self, url: str) -> dict[str, Any] | None:
+    async def get_active_task_by_url(self, url: str) -> dict[str, Any] | None:
         """Get active task (pending or downloading) by URL.
 
         Args:
@@ -169,6 +381,9 @@ class TaskDAO:
         Returns:
             Task data dictionary or None if not found
         """
+        return await self.db_manager.run(self._get_active_task_by_url, url)
+
+    def _get_active_task_by_url(self, url: str) -> dict[str, Any] | None:
         with self.db_manager.get_connection() as conn:
             cursor = conn.execute("""
                 SELECT * FROM download_tasks
@@ -181,7 +396,7 @@ class TaskDAO:
                 return dict(row)
             return None
 
-    def get_completed_task_by_title(self, title: str) -> dict[str, Any] | None:
+    async def get_completed_task_by_title(self, title: str) -> dict[str, Any] | None:
         """Get completed task by video title.
 
         Args:
@@ -193,6 +408,9 @@ class TaskDAO:
         if not title:
             return None
 
+        return await self.db_manager.run(self._get_completed_task_by_title, title)
+
+    def _get_completed_task_by_title(self, title: str) -> dict[str, Any] | None:
         with self.db_manager.get_connection() as conn:
             cursor = conn.execute("""
                 SELECT * FROM download_tasks
@@ -205,7 +423,7 @@ class TaskDAO:
                 return dict(row)
             return None
 
-    def cleanup_old_tasks(self, days: int = 30) -> int:
+    async def cleanup_old_tasks(self, days: int = 30) -> int:
         """Clean up old completed/failed tasks.
 
         Args:
@@ -214,6 +432,9 @@ class TaskDAO:
         Returns:
             Number of deleted tasks
         """
+        return await self.db_manager.run(self._cleanup_old_tasks, days)
+
+    def _cleanup_old_tasks(self, days: int) -> int:
         with self.db_manager.get_connection() as conn:
             cursor = conn.execute("""
                 DELETE FROM download_tasks
@@ -223,12 +444,15 @@ class TaskDAO:
             conn.commit()
             return cursor.rowcount
 
-    def get_task_statistics(self) -> dict[str, Any]:
+    async def get_task_statistics(self) -> dict[str, Any]:
         """Get task statistics.
 
         Returns:
             Dictionary with task count by status
         """
+        return await self.db_manager.run(self._get_task_statistics)
+
+    def _get_task_statistics(self) -> dict[str, Any]:
         with self.db_manager.get_connection() as conn:
             cursor = conn.execute("""
                 SELECT status, COUNT(*) as count
@@ -243,4 +467,4 @@ class TaskDAO:
             cursor = conn.execute("SELECT COUNT(*) as total FROM download_tasks")
             stats['total'] = cursor.fetchone()['total']
 
-            return stats
\ No newline at end of file
+            return stats
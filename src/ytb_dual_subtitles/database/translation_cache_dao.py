@@ -0,0 +1,113 @@
+"""Data Access Object for cached translations."""
+
+from __future__ import annotations
+
+import time
+
+from ytb_dual_subtitles.database.models import DatabaseManager
+
+# Keys per SELECT ... IN query (well under SQLite's bound parameter limit)
+LOOKUP_CHUNK_SIZE = 500
+
+
+class TranslationCacheDAO:
+    """Data Access Object for the translation_cache table."""
+
+    def __init__(self, db_manager: DatabaseManager) -> None:
+        """Initialize translation cache DAO.
+
+        Args:
+            db_manager: Database manager instance
+        """
+        self.db_manager = db_manager
+
+    def get_many(self, cache_keys: list[str]) -> dict[str, str]:
+        """Get cached translations and mark them as recently used.
+
+        Args:
+            cache_keys: Cache keys to look up
+
+        Returns:
+            Mapping of found cache keys to translations
+        """
+        found: dict[str, str] = {}
+        with self.db_manager.get_connection() as conn:
+            for i in range(0, len(cache_keys), LOOKUP_CHUNK_SIZE):
+                chunk = cache_keys[i:i + LOOKUP_CHUNK_SIZE]
+                cursor = conn.execute(
+                    "SELECT cache_key, translation FROM translation_cache "
+                    f"WHERE cache_key IN ({', '.join('?' * len(chunk))})",
+                    chunk
+                )
+                found.update((row['cache_key'], row['translation']) for row in cursor)
+
+            if found:
+                now = time.time()
+                conn.executemany(
+                    "UPDATE translation_cache SET last_used = ? WHERE cache_key = ?",
+                    [(now, key) for key in found]
+                )
+        return found
+
+    def save_many(self, entries: list[tuple[str, str, int]]) -> None:
+        """Insert or replace cached translations.
+
+        Args:
+            entries: (cache_key, translation, size in bytes) of each entry
+        """
+        now = time.time()
+        with self.db_manager.get_connection() as conn:
+            conn.executemany(
+                "INSERT INTO translation_cache (cache_key, translation, size, last_used) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (cache_key) DO UPDATE SET "
+                "translation = excluded.translation, size = excluded.size, "
+                "last_used = excluded.last_used",
+                [(key, translation, size, now) for key, translation, size in entries]
+            )
+
+    def total_size(self) -> int:
+        """Get the total size of all entries in bytes."""
+        with self.db_manager.get_connection() as conn:
+            row = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) AS total FROM translation_cache"
+            ).fetchone()
+            return row['total']
+
+    def evict_to(self, max_bytes: int) -> tuple[int, int]:
+        """Delete least recently used entries until the total fits max_bytes.
+
+        Args:
+            max_bytes: Size the cache must shrink to
+
+        Returns:
+            Tuple of (deleted entries, remaining total bytes)
+        """
+        with self.db_manager.get_connection() as conn:
+            total = conn.execute(
+                "SELECT COALESCE(SUM(size), 0) AS total FROM translation_cache"
+            ).fetchone()['total']
+
+            victims = []
+            cursor = conn.execute(
+                "SELECT cache_key, size FROM translation_cache ORDER BY last_used"
+            )
+            for row in cursor:
+                if total <= max_bytes:
+                    break
+                victims.append((row['cache_key'],))
+                total -= row['size']
+            cursor.close()
+
+            conn.executemany("DELETE FROM translation_cache WHERE cache_key = ?", victims)
+            return len(victims), total
+
+    def clear(self) -> int:
+        """Delete all cached translations.
+
+        Returns:
+            Number of deleted entries
+        """
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.execute("DELETE FROM translation_cache")
+            return cursor.rowcount
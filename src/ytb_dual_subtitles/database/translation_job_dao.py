@@ -0,0 +1,141 @@
+"""Data Access Object for resumable translation jobs."""
+
+from __future__ import annotations
+
+import json
+import time
+
+from ytb_dual_subtitles.database.models import DatabaseManager
+
+
+class TranslationJobDAO:
+    """Data Access Object for the translation_jobs and translation_job_checkpoints tables."""
+
+    def __init__(self, db_manager: DatabaseManager) -> None:
+        """Initialize translation job DAO.
+
+        Args:
+            db_manager: Database manager instance
+        """
+        self.db_manager = db_manager
+
+    def start_job(self, job_id: str, content_key: str, target_lang: str, total_segments: int) -> int:
+        """Create the job row of a new run.
+
+        Args:
+            job_id: Job ID of the run
+            content_key: Key of the translated segments and target language
+            target_lang: Target language
+            total_segments: Number of segments of the job
+
+        Returns:
+            Number of runs over the same content, this one included
+        """
+        now = time.time()
+        with self.db_manager.get_connection() as conn:
+            row = conn.execute(
+                "SELECT COUNT(*) AS runs FROM translation_jobs WHERE content_key = ?",
+                (content_key,)
+            ).fetchone()
+            attempts = row['runs'] + 1
+            conn.execute(
+                "INSERT INTO translation_jobs "
+                "(job_id, content_key, target_lang, total_segments, status, attempts, "
+                "created_at, updated_at) "
+                "VALUES (?, ?, ?, ?, 'running', ?, ?, ?)",
+                (job_id, content_key, target_lang, total_segments, attempts, now, now)
+            )
+            return attempts
+
+    def get_checkpoints(self, content_key: str) -> list[tuple[int, list[str | None]]]:
+        """Get the translated segment ranges of all runs over the same content.
+
+        Ranges of concurrent or earlier runs may overlap.
+
+        Args:
+            content_key: Key of the translated segments and target language
+
+        Returns:
+            (range start index, per-segment translations) pairs ordered by start index
+        """
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.execute(
+                "SELECT c.start_index, c.translations_json FROM translation_job_checkpoints c "
+                "JOIN translation_jobs j ON j.job_id = c.job_id "
+                "WHERE j.content_key = ? ORDER BY c.start_index, c.completed_at",
+                (content_key,)
+            )
+            return [(row['start_index'], json.loads(row['translations_json'])) for row in cursor]
+
+    def save_checkpoint(self, job_id: str, start_index: int, translations: list[str | None]) -> None:
+        """Store the translations of a segment range.
+
+        Args:
+            job_id: Job ID
+            start_index: Index of the first segment of the range
+            translations: Translation of each segment of the range, None for blank segments
+        """
+        now = time.time()
+        with self.db_manager.get_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO translation_job_checkpoints "
+                "(job_id, start_index, end_index, translations_json, completed_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job_id, start_index, start_index + len(translations),
+                 json.dumps(translations, ensure_ascii=False), now)
+            )
+            conn.execute(
+                "UPDATE translation_jobs SET updated_at = ? WHERE job_id = ?",
+                (now, job_id)
+            )
+
+    def fail_job(self, job_id: str, error: str) -> None:
+        """Mark a job as failed; its checkpoints are kept for the next attempt.
+
+        Args:
+            job_id: Job ID
+            error: Error message
+        """
+        with self.db_manager.get_connection() as conn:
+            conn.execute(
+                "UPDATE translation_jobs SET status = 'failed', error = ?, updated_at = ? "
+                "WHERE job_id = ?",
+                (error, time.time(), job_id)
+            )
+
+    def complete_job(self, job_id: str, content_key: str) -> int:
+        """Delete a finished run and the failed runs over the same content.
+
+        Runs still marked as running are kept: they may belong to a
+        concurrent attempt whose checkpoints are still in use.
+
+        Args:
+            job_id: Job ID of the finished run
+            content_key: Key of the translated segments and target language
+
+        Returns:
+            Number of deleted jobs
+        """
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM translation_jobs "
+                "WHERE job_id = ? OR (content_key = ? AND status = 'failed')",
+                (job_id, content_key)
+            )
+            return cursor.rowcount
+
+    def purge_stale(self, max_age: float) -> int:
+        """Delete jobs not updated for max_age seconds.
+
+        Args:
+            max_age: Maximum job age in seconds
+
+        Returns:
+            Number of deleted jobs
+        """
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM translation_jobs WHERE updated_at < ?",
+                (time.time() - max_age,)
+            )
+            return cursor.rowcount
@@ -0,0 +1,92 @@
+"""Data Access Object for cached video information."""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Any
+
+from ytb_dual_subtitles.database.models import DatabaseManager
+
+
+class VideoInfoDAO:
+    """Data Access Object for the video_info_cache table."""
+
+    def __init__(self, db_manager: DatabaseManager) -> None:
+        """Initialize video info DAO.
+
+        Args:
+            db_manager: Database manager instance
+        """
+        self.db_manager = db_manager
+
+    def get_info(self, video_id: str, max_age: float) -> tuple[float, dict[str, Any]] | None:
+        """Get cached video info if it is younger than max_age.
+
+        Args:
+            video_id: YouTube video ID
+            max_age: Maximum entry age in seconds
+
+        Returns:
+            Tuple of (fetched_at, info) or None if missing or expired
+        """
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.execute(
+                "SELECT info_json, fetched_at FROM video_info_cache "
+                "WHERE video_id = ? AND fetched_at >= ?",
+                (video_id, time.time() - max_age)
+            )
+            row = cursor.fetchone()
+            if row:
+                return row['fetched_at'], json.loads(row['info_json'])
+            return None
+
+    def save_info(self, video_id: str, info: dict[str, Any], fetched_at: float) -> None:
+        """Insert or replace cached video info.
+
+        Args:
+            video_id: YouTube video ID
+            info: Video info dictionary
+            fetched_at: Unix timestamp of the probe
+        """
+        with self.db_manager.get_connection() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO video_info_cache (video_id, info_json, fetched_at) "
+                "VALUES (?, ?, ?)",
+                (video_id, json.dumps(info, ensure_ascii=False), fetched_at)
+            )
+            conn.commit()
+
+    def delete_info(self, video_id: str) -> bool:
+        """Delete cached video info.
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            True if an entry was deleted
+        """
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM video_info_cache WHERE video_id = ?",
+                (video_id,)
+            )
+            conn.commit()
+            return cursor.rowcount > 0
+
+    def purge_expired(self, max_age: float) -> int:
+        """Delete entries older than max_age.
+
+        Args:
+            max_age: Maximum entry age in seconds
+
+        Returns:
+            Number of deleted entries
+        """
+        with self.db_manager.get_connection() as conn:
+            cursor = conn.execute(
+                "DELETE FROM video_info_cache WHERE fetched_at < ?",
+                (time.time() - max_age,)
+            )
+            conn.commit()
+            return cursor.rowcount
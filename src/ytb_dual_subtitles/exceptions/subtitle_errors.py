@@ -37,6 +37,12 @@ class TranslationError(SubtitleError):
     pass
 
 
+class TranslationRateLimitError(TranslationError):
+    """Exception raised when a translation provider keeps rejecting requests for rate limiting."""
+
+    pass
+
+
 class SubtitleExtractionError(SubtitleError):
     """Exception raised when subtitle extraction fails."""
 
@@ -10,8 +10,11 @@ from .response import (
 )
 from .video import (
     Base,
+    ContentVersion,
     DownloadTask,
     DownloadTaskStatus,
+    DualSubtitleSegment,
+    PackedSubtitleTrack,
     Subtitle,
     SubtitleSegment,
     SubtitleSourceType,
@@ -27,6 +30,9 @@ __all__ = [
     "Subtitle",
     "SubtitleSegment",
     "SubtitleSourceType",
+    "DualSubtitleSegment",
+    "PackedSubtitleTrack",
+    "ContentVersion",
     "DownloadTask",
     "DownloadTaskStatus",
     # Response models
@@ -1,7 +1,8 @@
 """Database models for YouTube dual-subtitles system.
 
 This module defines SQLAlchemy 2.0 models for videos, subtitles, download tasks,
-and subtitle segments.
+subtitle segments (as rows or packed tracks), the aligned dual-language
+segments and the content version counters behind HTTP ETags.
 """
 
 from __future__ import annotations
@@ -12,7 +13,9 @@ from enum import Enum
 from sqlalchemy import (
     DateTime,
     ForeignKey,
+    Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
@@ -89,6 +92,12 @@ class Video(Base):
         back_populates="video",
         cascade="all, delete-orphan"
     )
+    dual_segments: Mapped[list[DualSubtitleSegment]] = relationship(
+        "DualSubtitleSegment",
+        back_populates="video",
+        cascade="all, delete-orphan",
+        order_by="DualSubtitleSegment.sequence"
+    )
 
     def __repr__(self) -> str:
         return f"<Video(id={self.id}, youtube_id='{self.youtube_id}', title='{self.title[:50]}...')>"
@@ -123,6 +132,12 @@ class Subtitle(Base):
         cascade="all, delete-orphan",
         order_by="SubtitleSegment.sequence"
     )
+    packed_track: Mapped[PackedSubtitleTrack | None] = relationship(
+        "PackedSubtitleTrack",
+        back_populates="subtitle",
+        cascade="all, delete-orphan",
+        uselist=False
+    )
 
     __table_args__ = (
         UniqueConstraint('video_id', 'language', 'source_type', name='_video_lang_source_uc'),
@@ -139,8 +154,7 @@ class SubtitleSegment(Base):
 
     id: Mapped[int] = mapped_column(primary_key=True)
     subtitle_id: Mapped[int] = mapped_column(
-        ForeignKey("subtitles.id", ondelete="CASCADE"),
-        index=True
+        ForeignKey("subtitles.id", ondelete="CASCADE")
     )
     sequence: Mapped[int] = mapped_column(Integer, nullable=False)
     start_time: Mapped[float] = mapped_column(nullable=False)  # Start time in seconds
@@ -152,6 +166,8 @@ class SubtitleSegment(Base):
 
     __table_args__ = (
         UniqueConstraint('subtitle_id', 'sequence', name='_subtitle_sequence_uc'),
+        # Time-range reads within a track; also covers lookups by subtitle_id alone
+        Index('ix_subtitle_segments_subtitle_start', 'subtitle_id', 'start_time'),
     )
 
     def __repr__(self) -> str:
@@ -163,6 +179,86 @@ class SubtitleSegment(Base):
         return self.end_time - self.start_time
 
 
+class PackedSubtitleTrack(Base):
+    """A whole subtitle track in the packed columnar format.
+
+    Alternative to SubtitleSegment rows (see utils.packed_track): a subtitle
+    has either segment rows or one packed track. Packed cues are identified
+    by their sequence number.
+    """
+
+    __tablename__ = "packed_subtitle_tracks"
+
+    subtitle_id: Mapped[int] = mapped_column(
+        ForeignKey("subtitles.id", ondelete="CASCADE"),
+        primary_key=True
+    )
+    cue_count: Mapped[int] = mapped_column(Integer, nullable=False)
+    start_times: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)  # float32 LE
+    end_times: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)    # float32 LE
+    text_offsets: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)  # uint32 LE, n + 1
+    text_blob: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)    # zlib UTF-8
+
+    # Relationships
+    subtitle: Mapped[Subtitle] = relationship("Subtitle", back_populates="packed_track")
+
+    def __repr__(self) -> str:
+        return f"<PackedSubtitleTrack(subtitle_id={self.subtitle_id}, cues={self.cue_count})>"
+
+
+class DualSubtitleSegment(Base):
+    """English cue paired with its time-aligned Chinese text.
+
+    Built once when a video's subtitle tracks are imported or translated,
+    so the dual subtitle view is a single range read by video.
+    """
+
+    __tablename__ = "dual_subtitle_segments"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    video_id: Mapped[int] = mapped_column(
+        ForeignKey("videos.id", ondelete="CASCADE")
+    )
+    # English SubtitleSegment.id; NULL when the English track is stored packed
+    segment_id: Mapped[int | None] = mapped_column(Integer)
+    sequence: Mapped[int] = mapped_column(Integer, nullable=False)
+    start_time: Mapped[float] = mapped_column(nullable=False)  # Start time in seconds
+    end_time: Mapped[float] = mapped_column(nullable=False)    # End time in seconds
+    text_english: Mapped[str] = mapped_column(Text, nullable=False)
+    text_chinese: Mapped[str | None] = mapped_column(Text)
+
+    # Relationships
+    video: Mapped[Video] = relationship("Video", back_populates="dual_segments")
+
+    __table_args__ = (
+        # Also serves as the (video_id, sequence) index for range reads
+        UniqueConstraint('video_id', 'sequence', name='_dual_video_sequence_uc'),
+        # Time-windowed reads of the dual track
+        Index('ix_dual_subtitle_segments_video_start', 'video_id', 'start_time'),
+    )
+
+    def __repr__(self) -> str:
+        return f"<DualSubtitleSegment(id={self.id}, video_id={self.video_id}, sequence={self.sequence})>"
+
+
+class ContentVersion(Base):
+    """Change counter for a piece of API-visible content.
+
+    Bumped in the same transaction as the change it tracks and used to
+    build HTTP ETags (see core.http_cache). A counter rather than
+    ``updated_at``, whose one-second resolution would let two changes in
+    the same second share an ETag.
+    """
+
+    __tablename__ = "content_versions"
+
+    name: Mapped[str] = mapped_column(String(100), primary_key=True)  # e.g. "videos", "subtitles:42"
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+    def __repr__(self) -> str:
+        return f"<ContentVersion(name='{self.name}', version={self.version})>"
+
+
 class DownloadTask(Base):
     """Download task model for tracking video download progress."""
 
@@ -0,0 +1,283 @@
+"""Browser cookie provider for yt-dlp.
+
+Resolves which browser (and profile) cookies can be read from once, exports
+them to a Netscape cookie file and hands that file to yt-dlp via
+``cookiefile``. The browser cookie store is only decrypted again when the
+source cookie database changes or when YouTube rejects the cookies.
+"""
+
+from __future__ import annotations
+
+import glob
+import logging
+import os
+import re
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+import yt_dlp
+
+from ytb_dual_subtitles.core.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# Fallback browsers tried (without profile) after the configured one
+FALLBACK_BROWSERS = ['chrome', 'firefox', 'safari', 'edge']
+
+# Re-export interval when the source cookie database cannot be located
+COOKIE_MAX_AGE_SECONDS = 6 * 3600
+
+# Delay before trying all browsers again after every attempt failed
+RESOLVE_RETRY_SECONDS = 10 * 60
+
+
+def _newest_mtime(paths: list[str]) -> float | None:
+    """Get the newest modification time among existing paths."""
+    mtimes = []
+    for path in paths:
+        try:
+            mtimes.append(os.path.getmtime(path))
+        except OSError:
+            continue
+    return max(mtimes) if mtimes else None
+
+
+def get_cookie_source_mtime(browser: str, profile: str | None) -> float | None:
+    """Get the modification time of a browser's cookie database.
+
+    Uses yt-dlp's own browser directory lookup so the same file that
+    ``cookiesfrombrowser`` would read is checked.
+
+    Args:
+        browser: Browser name
+        profile: Browser profile name or None for the default search
+
+    Returns:
+        Newest mtime of the matching cookie databases, or None if unknown
+    """
+    try:
+        from yt_dlp import cookies as ytdlp_cookies
+
+        if browser in ytdlp_cookies.CHROMIUM_BASED_BROWSERS:
+            browser_dir = ytdlp_cookies._get_chromium_based_browser_settings(browser)['browser_dir']
+            root = os.path.join(browser_dir, profile) if profile else browser_dir
+            patterns = ['Cookies', 'Network/Cookies']
+            if not profile:
+                patterns += ['*/Cookies', '*/Network/Cookies']
+            candidates = [p for pattern in patterns for p in glob.glob(os.path.join(root, pattern))]
+        elif browser == 'firefox':
+            roots = list(ytdlp_cookies._firefox_browser_dirs())
+            if profile:
+                roots = [os.path.join(root, profile) for root in roots]
+            candidates = list(ytdlp_cookies._firefox_cookie_dbs(roots))
+        elif browser == 'safari' and sys.platform == 'darwin':
+            candidates = [
+                os.path.expanduser('~/Library/Cookies/Cookies.binarycookies'),
+                os.path.expanduser(
+                    '~/Library/Containers/com.apple.Safari/Data/Library/Cookies/Cookies.binarycookies'
+                ),
+            ]
+        else:
+            return None
+    except Exception as e:
+        logger.debug(f"Could not locate cookie database for {browser}: {e}")
+        return None
+
+    return _newest_mtime(candidates)
+
+
+class _YtDlpLogger:
+    """Route yt-dlp messages from cookie extraction attempts to debug logging."""
+
+    def debug(self, msg: str) -> None:
+        logger.debug(msg)
+
+    def info(self, msg: str) -> None:
+        logger.debug(msg)
+
+    def warning(self, msg: str) -> None:
+        logger.debug(msg)
+
+    def error(self, msg: str) -> None:
+        logger.debug(msg)
+
+
+class CookieProvider:
+    """Export browser cookies once and reuse them as a yt-dlp cookie file."""
+
+    def __init__(self, browser: str, profile: str | None, cookie_dir: Path) -> None:
+        """Initialize cookie provider.
+
+        Args:
+            browser: Preferred browser to read cookies from
+            profile: Browser profile name (e.g., 'Default'). If None, uses default profile.
+            cookie_dir: Directory for exported cookie files
+        """
+        self.browser = browser
+        self.profile = profile
+        self.cookie_dir = cookie_dir
+
+        self._lock = threading.Lock()
+        # (browser, profile) spec the current cookie file was exported from
+        self._source: tuple[str, str | None] | None = None
+        self._source_mtime: float | None = None
+        self._cookie_file: Path | None = None
+        self._exported_at = 0.0
+        self._failed_at: float | None = None
+        self._stale = False
+
+    def get_ydl_opts(self) -> dict[str, Any]:
+        """Get yt-dlp cookie options, exporting cookies first if needed.
+
+        Returns:
+            ``{'cookiefile': path}`` or an empty dict if no browser cookies are available
+        """
+        with self._lock:
+            if self._needs_refresh():
+                self._refresh()
+            if self._cookie_file is None:
+                return {}
+            return {'cookiefile': str(self._cookie_file)}
+
+    def invalidate(self) -> None:
+        """Force cookies to be exported again on next use.
+
+        Call this when YouTube rejects the current cookies.
+        """
+        with self._lock:
+            if self._cookie_file is not None or self._failed_at is not None:
+                logger.info("Browser cookies invalidated; they will be re-exported on next use")
+            self._stale = True
+            self._failed_at = None
+
+    def _needs_refresh(self) -> bool:
+        """Check whether the exported cookie file has to be rebuilt."""
+        if self._stale:
+            return True
+
+        if self._cookie_file is None:
+            # Nothing resolved yet, or the last attempt failed
+            return self._failed_at is None or time.time() - self._failed_at >= RESOLVE_RETRY_SECONDS
+
+        if not self._cookie_file.exists():
+            return True
+
+        browser, profile = self._source
+        mtime = get_cookie_source_mtime(browser, profile)
+        if mtime is None:
+            return time.time() - self._exported_at >= COOKIE_MAX_AGE_SECONDS
+        return mtime != self._source_mtime
+
+    def _refresh(self) -> None:
+        """Resolve a working browser and export its cookies."""
+        self._stale = False
+
+        # Try the last working source first so a refresh does not switch browsers
+        candidates: list[tuple[str, str | None]] = []
+        if self._source is not None:
+            candidates.append(self._source)
+        if self.profile:
+            candidates.append((self.browser, self.profile))
+        for browser in [self.browser, *FALLBACK_BROWSERS]:
+            candidates.append((browser, None))
+        candidates = list(dict.fromkeys(candidates))
+
+        for browser, profile in candidates:
+            label = f"{browser}:{profile}" if profile else browser
+            # Read the mtime before exporting so a concurrent browser write triggers another refresh
+            mtime = get_cookie_source_mtime(browser, profile)
+            try:
+                count = self._export(browser, profile)
+            except Exception as e:
+                logger.debug(f"Failed to extract cookies from {label}: {type(e).__name__}: {e}")
+                continue
+
+            if count == 0:
+                logger.debug(f"No cookies found in {label}")
+                continue
+
+            self._source = (browser, profile)
+            self._source_mtime = mtime
+            self._exported_at = time.time()
+            self._failed_at = None
+            logger.info(f"✅ Exported {count} cookies from {label} to {self._cookie_file}")
+            return
+
+        self._source = None
+        self._cookie_file = None
+        self._failed_at = time.time()
+
+        logger.error("=" * 80)
+        logger.error("❌ CRITICAL: Could not extract cookies from any browser!")
+        logger.error("=" * 80)
+        logger.error("This may cause subtitle downloads to fail due to YouTube's anti-bot protection.")
+        logger.error("Tried browsers: %s", ', '.join(dict.fromkeys(b for b, _ in candidates)))
+        logger.error("")
+        logger.error("To fix this issue:")
+        logger.error("1. Ensure at least one of these browsers is installed: Chrome, Firefox, Safari, Edge")
+        logger.error("2. Log in to YouTube in your browser")
+        logger.error("3. Close and restart the browser to ensure cookies are saved")
+        logger.error("4. If using Chrome, check your profile name at chrome://version/")
+        logger.error("   and update YTB_BROWSER_PROFILE in .env if needed")
+        logger.error("=" * 80)
+
+    def _export(self, browser: str, profile: str | None) -> int:
+        """Export cookies from a browser into the cookie file.
+
+        Args:
+            browser: Browser name
+            profile: Browser profile name or None
+
+        Returns:
+            Number of exported cookies
+        """
+        spec = (browser, profile) if profile else (browser,)
+        ydl_opts = {
+            'cookiesfrombrowser': spec,
+            'quiet': True,
+            'no_warnings': True,
+            'logger': _YtDlpLogger(),
+        }
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            jar = ydl.cookiejar
+            count = len(jar)
+            if count == 0:
+                return 0
+
+            self.cookie_dir.mkdir(parents=True, exist_ok=True)
+            safe_name = re.sub(r'[^A-Za-z0-9_.-]+', '_', f"{browser}-{profile or 'default'}")
+            target = self.cookie_dir / f"{safe_name}.txt"
+
+            # Write to a temp file and rename so readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.cookie_dir, prefix=f".{safe_name}.", suffix='.tmp')
+            os.close(fd)
+            try:
+                jar.save(tmp_path)
+                os.chmod(tmp_path, 0o600)
+                os.replace(tmp_path, target)
+            except BaseException:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+
+        self._cookie_file = target
+        return count
+
+
+# Providers shared by all YouTubeService instances, keyed by (browser, profile)
+_providers: dict[tuple[str, str | None], CookieProvider] = {}
+_providers_lock = threading.Lock()
+
+
+def get_cookie_provider(browser: str, profile: str | None = None) -> CookieProvider:
+    """Get the shared cookie provider for a browser and profile."""
+    key = (browser, profile)
+    with _providers_lock:
+        provider = _providers.get(key)
+        if provider is None:
+            provider = CookieProvider(browser, profile, get_settings().data_path / "cookies")
+            _providers[key] = provider
+        return provider
@@ -306,6 +306,7 @@ class FileService:
 
         from sqlalchemy import select
         from ytb_dual_subtitles.models.video import Video
+        from ytb_dual_subtitles.services.subtitle_index_cache import get_subtitle_index_cache
 
         # Find videos in database
         stmt = select(Video).where(Video.id.in_(video_ids))
@@ -330,6 +331,9 @@ class FileService:
 
         if deleted_count > 0:
             await self.db_session.commit()
+            cache = get_subtitle_index_cache()
+            for video in videos:
+                cache.invalidate(video.id, video.youtube_id)
 
         return deleted_count
 
@@ -6,25 +6,135 @@ Task 5: 字幕数据处理服务 (AC: 8)
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import os
+import tempfile
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, NamedTuple, Optional
 
-from sqlalchemy import text
+from sqlalchemy import delete, func, insert, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ytb_dual_subtitles.core.http_cache import (
+    bump_content_version,
+    subtitles_version_key,
+)
+from ytb_dual_subtitles.core.settings import get_settings
 from ytb_dual_subtitles.exceptions.subtitle_errors import SubtitleDataError
-from ytb_dual_subtitles.models.video import Subtitle, SubtitleSegment
+from ytb_dual_subtitles.models.video import (
+    DualSubtitleSegment,
+    PackedSubtitleTrack,
+    Subtitle,
+    SubtitleSegment,
+    Video,
+)
+from ytb_dual_subtitles.utils.packed_track import PackedTrack, duration_sum
+from ytb_dual_subtitles.utils.subtitle_align import align_cues
+from ytb_dual_subtitles.utils.subtitle_utils import SubtitleUtils
+
+# 双语视图使用的中文字幕语言代码（按优先级）
+CHINESE_LANGUAGES = ('zh-CN', 'zh-Hans', 'zh')
+
+# 双语对齐的时间容差（秒）
+DUAL_ALIGN_TOLERANCE = 0.1
+
+
+class TrackSegment(NamedTuple):
+    """字幕轨道中的一条片段（打包轨道没有 subtitle_segments 行，ID 为 None）"""
+
+    id: Optional[int]
+    sequence: int
+    start_time: float
+    end_time: float
+    text: str
+
+
+# 双语 VTT 文件的内容哈希 ETag: 路径 -> (mtime_ns, size, etag)
+_dual_vtt_etags: Dict[str, tuple[int, int, str]] = {}
+
+
+def dual_vtt_path(video_id: int, youtube_id: str) -> Path:
+    """双语 VTT 文件路径（subtitle_path/{video_id}/{youtube_id}_dual.vtt）"""
+    return get_settings().subtitle_path / str(video_id) / f"{youtube_id}_dual.vtt"
+
+
+def dual_vtt_etag(path: Path) -> Optional[str]:
+    """获取双语 VTT 文件的内容哈希 ETag
+
+    生成文件时已记录 ETag；文件在进程外被修改（或服务重启）后才重新计算。
+
+    Args:
+        path: VTT 文件路径
+
+    Returns:
+        带引号的 ETag，文件不存在时返回 None
+    """
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+
+    cached = _dual_vtt_etags.get(str(path))
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+
+    etag = f'"{hashlib.sha256(path.read_bytes()).hexdigest()[:32]}"'
+    _dual_vtt_etags[str(path)] = (stat.st_mtime_ns, stat.st_size, etag)
+    return etag
+
+
+def render_dual_vtt(rows: List[Dict[str, Any]]) -> str:
+    """把双语片段渲染为 WebVTT（中文在上，英文在下）"""
+    blocks = ["WEBVTT\n"]
+    for row in rows:
+        start = SubtitleUtils.format_time_to_vtt(row["start_time"])
+        end = SubtitleUtils.format_time_to_vtt(row["end_time"])
+        if row["text_chinese"] and row["text_chinese"] != row["text_english"]:
+            text = f"{row['text_chinese']}\n{row['text_english']}"
+        else:
+            text = row["text_english"]
+        blocks.append(f"{row['sequence']}\n{start} --> {end}\n{text}\n")
+    return "\n".join(blocks)
+
+
+def _write_dual_vtt(path: Path, rows: List[Dict[str, Any]]) -> None:
+    """原子写入双语 VTT 文件（临时文件 + rename），并记录其 ETag"""
+    if not rows:
+        # 没有英文字幕时不保留过期文件
+        path.unlink(missing_ok=True)
+        _dual_vtt_etags.pop(str(path), None)
+        return
+
+    data = render_dual_vtt(rows).encode("utf-8")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+    stat = path.stat()
+    etag = f'"{hashlib.sha256(data).hexdigest()[:32]}"'
+    _dual_vtt_etags[str(path)] = (stat.st_mtime_ns, stat.st_size, etag)
 
 
 class SubtitleDataService:
     """字幕数据处理服务 - 处理字幕数据库操作、文件同步和数据分析"""
 
-    def __init__(self, db_session: Optional[AsyncSession] = None, batch_size: int = 100):
-        """初始化服务"""
+    def __init__(self, db_session: Optional[AsyncSession] = None, batch_size: int = 5000):
+        """初始化服务
+
+        Args:
+            db_session: 数据库会话
+            batch_size: 每次 executemany 的行数（同一事务内分块，限制内存占用）
+        """
         self.db_session = db_session
         self.batch_size = batch_size
 
@@ -33,40 +143,44 @@ class SubtitleDataService:
         subtitle_id: int,
         segments_data: List[Dict[str, Any]]
     ) -> Dict[str, Any]:
-        """批量插入字幕片段，优化数据库操作"""
+        """批量插入字幕片段
+
+        使用 Core insert 的 executemany，不创建 ORM 对象，所有片段在一个事务中
+        提交（包括调用方在同一会话中尚未提交的字幕记录）。
+
+        Args:
+            subtitle_id: 字幕 ID
+            segments_data: 片段列表，包含 sequence、start_time、end_time、text
+
+        Returns:
+            插入结果统计
+        """
         if not self.db_session:
             raise SubtitleDataError("Database session is required")
 
+        rows = [
+            {
+                "subtitle_id": subtitle_id,
+                "sequence": segment_data.get('sequence', index),
+                "start_time": segment_data.get('start_time', 0.0),
+                "end_time": segment_data.get('end_time', 0.0),
+                "text": segment_data.get('text', ''),
+            }
+            for index, segment_data in enumerate(segments_data, start=1)
+        ]
+
         try:
-            inserted_count = 0
-            failed_count = 0
-            total_batches = (len(segments_data) + self.batch_size - 1) // self.batch_size
-
-            # 分批处理
-            for i in range(0, len(segments_data), self.batch_size):
-                batch = segments_data[i:i + self.batch_size]
-                
-                # 构建批量插入的字幕片段对象
-                segments = []
-                for segment_data in batch:
-                    segment = SubtitleSegment(
-                        subtitle_id=subtitle_id,
-                        sequence=segment_data.get('sequence', 1),
-                        start_time=segment_data.get('start_time', 0.0),
-                        end_time=segment_data.get('end_time', 0.0),
-                        text=segment_data.get('text', '')
-                    )
-                    segments.append(segment)
-
-                # 批量添加到会话
-                self.db_session.add_all(segments)
-                await self.db_session.commit()
-                
-                inserted_count += len(batch)
+            insert_stmt = insert(SubtitleSegment.__table__)
+            total_batches = 0
+            for i in range(0, len(rows), self.batch_size):
+                await self.db_session.execute(insert_stmt, rows[i:i + self.batch_size])
+                total_batches += 1
+
+            await self.db_session.commit()
 
             return {
-                "inserted_count": inserted_count,
-                "failed_count": failed_count,
+                "inserted_count": len(rows),
+                "failed_count": 0,
                 "total_batches": total_batches,
                 "success": True
             }
@@ -75,6 +189,286 @@ class SubtitleDataService:
             await self.db_session.rollback()
             raise SubtitleDataError(f"Batch insert failed: {str(e)}") from e
 
+    async def save_track(
+        self,
+        subtitle_id: int,
+        segments_data: List[Dict[str, Any]],
+        storage: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """按配置的存储格式保存一条字幕轨道
+
+        Args:
+            subtitle_id: 字幕 ID
+            segments_data: 按 sequence 排序的片段列表
+            storage: 'rows' 或 'packed'，默认取 settings.subtitle_storage
+
+        Returns:
+            插入结果统计
+        """
+        if (storage or get_settings().subtitle_storage) == "packed":
+            return await self.save_packed_track(subtitle_id, segments_data)
+        return await self.batch_insert_subtitle_segments(subtitle_id, segments_data)
+
+    async def save_packed_track(
+        self,
+        subtitle_id: int,
+        segments_data: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """以打包列式格式保存一条字幕轨道（整条轨道一行）
+
+        Args:
+            subtitle_id: 字幕 ID
+            segments_data: 按 sequence 排序的片段列表，包含 start_time、end_time、text
+
+        Returns:
+            插入结果统计
+        """
+        if not self.db_session:
+            raise SubtitleDataError("Database session is required")
+
+        track = PackedTrack.pack(
+            (
+                segment_data.get('start_time', 0.0),
+                segment_data.get('end_time', 0.0),
+                segment_data.get('text', ''),
+            )
+            for segment_data in segments_data
+        )
+
+        try:
+            packed_bytes = await self._insert_packed_track(subtitle_id, track)
+            await self.db_session.commit()
+
+            return {
+                "inserted_count": len(track),
+                "failed_count": 0,
+                "packed_bytes": packed_bytes,
+                "success": True
+            }
+
+        except SQLAlchemyError as e:
+            await self.db_session.rollback()
+            raise SubtitleDataError(f"Packed track insert failed: {str(e)}") from e
+
+    async def _insert_packed_track(self, subtitle_id: int, track: PackedTrack) -> int:
+        """插入打包轨道（不提交），返回存储字节数"""
+        start_times, end_times, text_offsets, text_blob = track.to_blobs()
+        await self.db_session.execute(
+            insert(PackedSubtitleTrack.__table__),
+            {
+                "subtitle_id": subtitle_id,
+                "cue_count": len(track),
+                "start_times": start_times,
+                "end_times": end_times,
+                "text_offsets": text_offsets,
+                "text_blob": text_blob,
+            }
+        )
+        return len(start_times) + len(end_times) + len(text_offsets) + len(text_blob)
+
+    async def load_packed_track(self, subtitle_id: int) -> Optional[PackedTrack]:
+        """读取打包格式的字幕轨道
+
+        Args:
+            subtitle_id: 字幕 ID
+
+        Returns:
+            打包轨道；该字幕以逐行格式存储时返回 None
+        """
+        result = await self.db_session.execute(
+            select(
+                PackedSubtitleTrack.start_times,
+                PackedSubtitleTrack.end_times,
+                PackedSubtitleTrack.text_offsets,
+                PackedSubtitleTrack.text_blob,
+            ).where(PackedSubtitleTrack.subtitle_id == subtitle_id)
+        )
+        row = result.first()
+        return PackedTrack.from_blobs(*row) if row else None
+
+    async def pack_subtitle_track(self, subtitle_id: int) -> bool:
+        """把逐行存储的字幕轨道迁移为打包格式
+
+        片段按 sequence 重新编号为 1..n。之后应重建该视频的双语片段，
+        因为打包片段以 sequence 作为 ID。
+
+        Args:
+            subtitle_id: 字幕 ID
+
+        Returns:
+            是否进行了迁移（已是打包格式或没有片段时为 False）
+        """
+        if not self.db_session:
+            raise SubtitleDataError("Database session is required")
+
+        if await self.db_session.get(PackedSubtitleTrack, subtitle_id) is not None:
+            return False
+
+        rows = (await self.db_session.execute(
+            select(SubtitleSegment.start_time, SubtitleSegment.end_time, SubtitleSegment.text)
+            .where(SubtitleSegment.subtitle_id == subtitle_id)
+            .order_by(SubtitleSegment.sequence)
+        )).all()
+        if not rows:
+            return False
+
+        track = PackedTrack.pack((row.start_time, row.end_time, row.text) for row in rows)
+
+        try:
+            await self._insert_packed_track(subtitle_id, track)
+            await self.db_session.execute(
+                delete(SubtitleSegment).where(SubtitleSegment.subtitle_id == subtitle_id)
+            )
+            await self.db_session.commit()
+            return True
+
+        except SQLAlchemyError as e:
+            await self.db_session.rollback()
+            raise SubtitleDataError(f"Packing track {subtitle_id} failed: {str(e)}") from e
+
+    async def unpack_subtitle_track(self, subtitle_id: int) -> bool:
+        """把打包格式的字幕轨道迁移回逐行存储
+
+        Args:
+            subtitle_id: 字幕 ID
+
+        Returns:
+            是否进行了迁移
+        """
+        if not self.db_session:
+            raise SubtitleDataError("Database session is required")
+
+        track = await self.load_packed_track(subtitle_id)
+        if track is None:
+            return False
+
+        try:
+            await self.db_session.execute(
+                delete(PackedSubtitleTrack).where(PackedSubtitleTrack.subtitle_id == subtitle_id)
+            )
+        except SQLAlchemyError as e:
+            await self.db_session.rollback()
+            raise SubtitleDataError(f"Unpacking track {subtitle_id} failed: {str(e)}") from e
+
+        # 删除与插入在同一事务中提交
+        await self.batch_insert_subtitle_segments(
+            subtitle_id,
+            [
+                {'sequence': i, 'start_time': start, 'end_time': end, 'text': text}
+                for i, (start, end, text) in enumerate(track, start=1)
+            ]
+        )
+        return True
+
+    async def rebuild_dual_segments(self, video_id: int) -> int:
+        """重建视频的双语对齐片段
+
+        按时间轴（而不是 sequence）把中文字幕对齐到每条英文字幕，结果写入
+        dual_subtitle_segments，替换该视频已有的对齐结果，并重新生成供
+        播放器 <track> 使用的双语 VTT 文件。字幕导入或翻译完成后调用。
+
+        Args:
+            video_id: 视频数据库 ID
+
+        Returns:
+            写入的双语片段数量（没有英文字幕时为 0，此时若也没有旧的对齐
+            结果则不做任何写入）
+        """
+        if not self.db_session:
+            raise SubtitleDataError("Database session is required")
+
+        try:
+            youtube_id = await self.db_session.scalar(
+                select(Video.youtube_id).where(Video.id == video_id)
+            )
+            result = await self.db_session.execute(
+                select(Subtitle.id, Subtitle.language).where(Subtitle.video_id == video_id)
+            )
+            tracks = {language: subtitle_id for subtitle_id, language in result.all()}
+
+            english_id = tracks.get('en')
+            chinese_id = next(
+                (tracks[language] for language in CHINESE_LANGUAGES if language in tracks),
+                None
+            )
+
+            english = await self._load_track(english_id) if english_id else []
+            chinese = await self._load_track(chinese_id) if chinese_id else []
+
+            matches = align_cues(
+                [(row.start_time, row.end_time) for row in english],
+                [(row.start_time, row.end_time) for row in chinese],
+                tolerance=DUAL_ALIGN_TOLERANCE
+            )
+
+            rows = [
+                {
+                    "video_id": video_id,
+                    "segment_id": row.id,
+                    "sequence": row.sequence,
+                    "start_time": row.start_time,
+                    "end_time": row.end_time,
+                    "text_english": row.text,
+                    "text_chinese": chinese[match].text if match is not None else None,
+                }
+                for row, match in zip(english, matches, strict=True)
+            ]
+
+            if not rows:
+                existing = await self.db_session.scalar(
+                    select(DualSubtitleSegment.id)
+                    .where(DualSubtitleSegment.video_id == video_id)
+                    .limit(1)
+                )
+                if existing is None:
+                    # 没有可对齐的英文字幕且无旧结果：不写库、不改版本，读接口可安全重复调用
+                    return 0
+
+            await self.db_session.execute(
+                delete(DualSubtitleSegment).where(DualSubtitleSegment.video_id == video_id)
+            )
+            insert_stmt = insert(DualSubtitleSegment.__table__)
+            for i in range(0, len(rows), self.batch_size):
+                await self.db_session.execute(insert_stmt, rows[i:i + self.batch_size])
+
+            # 使 /subtitles/{id} 的 ETag 失效
+            await bump_content_version(self.db_session, subtitles_version_key(video_id))
+            await self.db_session.commit()
+
+        except SQLAlchemyError as e:
+            await self.db_session.rollback()
+            raise SubtitleDataError(f"Dual segment rebuild failed: {str(e)}") from e
+
+        if youtube_id:
+            try:
+                await asyncio.to_thread(_write_dual_vtt, dual_vtt_path(video_id, youtube_id), rows)
+            except OSError as e:
+                raise SubtitleDataError(f"Dual VTT write failed: {str(e)}") from e
+
+        return len(rows)
+
+    async def _load_track(self, subtitle_id: int) -> List[Any]:
+        """按 sequence 顺序读取一条字幕轨道（逐行或打包格式，只取需要的列）"""
+        packed = await self.load_packed_track(subtitle_id)
+        if packed is not None:
+            return [
+                TrackSegment(None, i, start, end, text)
+                for i, (start, end, text) in enumerate(packed, start=1)
+            ]
+
+        result = await self.db_session.execute(
+            select(
+                SubtitleSegment.id,
+                SubtitleSegment.sequence,
+                SubtitleSegment.start_time,
+                SubtitleSegment.end_time,
+                SubtitleSegment.text,
+            )
+            .where(SubtitleSegment.subtitle_id == subtitle_id)
+            .order_by(SubtitleSegment.sequence)
+        )
+        return result.all()
+
     async def analyze_subtitle_statistics(self, video_id: str) -> Dict[str, Any]:
         """分析字幕统计信息"""
         if not self.db_session:
@@ -88,29 +482,36 @@ class SubtitleDataService:
             }
 
         try:
-            # 查询字幕统计信息
-            query = text("""
-                SELECT 
-                    COUNT(*) as total_segments,
-                    SUM(ss.end_time - ss.start_time) as total_duration,
-                    AVG(ss.end_time - ss.start_time) as average_segment_duration
-                FROM subtitle_segments ss
-                JOIN subtitles s ON ss.subtitle_id = s.id
-                JOIN videos v ON s.video_id = v.id
-                WHERE v.youtube_id = :video_id
-            """)
-            
-            result = await self.db_session.execute(query, {"video_id": video_id})
-            row = result.first()
-
-            if row:
-                total_segments = row.total_segments or 0
-                total_duration = float(row.total_duration or 0.0)
-                avg_duration = float(row.average_segment_duration or 0.0)
-            else:
-                total_segments = 0
-                total_duration = 0.0
-                avg_duration = 0.0
+            # 逐行存储的轨道在 SQL 中聚合
+            result = await self.db_session.execute(
+                select(
+                    func.count(SubtitleSegment.id),
+                    func.sum(SubtitleSegment.end_time - SubtitleSegment.start_time),
+                )
+                .join(Subtitle, SubtitleSegment.subtitle_id == Subtitle.id)
+                .join(Video, Subtitle.video_id == Video.id)
+                .where(Video.youtube_id == video_id)
+            )
+            row_count, row_duration = result.one()
+            total_segments = row_count or 0
+            total_duration = float(row_duration or 0.0)
+
+            # 打包轨道取 cue_count，时长只读取时间列求和，不解码文本
+            packed = await self.db_session.execute(
+                select(
+                    PackedSubtitleTrack.cue_count,
+                    PackedSubtitleTrack.start_times,
+                    PackedSubtitleTrack.end_times,
+                )
+                .join(Subtitle, PackedSubtitleTrack.subtitle_id == Subtitle.id)
+                .join(Video, Subtitle.video_id == Video.id)
+                .where(Video.youtube_id == video_id)
+            )
+            for cue_count, start_times, end_times in packed.all():
+                total_segments += cue_count
+                total_duration += duration_sum(start_times, end_times)
+
+            avg_duration = total_duration / total_segments if total_segments else 0.0
 
             return {
                 "video_id": video_id,
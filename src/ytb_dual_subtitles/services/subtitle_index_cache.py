@@ -0,0 +1,221 @@
+"""Per-video subtitle time index cache.
+
+The player asks "which cues are on screen at time t" many times per video.
+The first lookup for a video loads all of its subtitle segments (rows and
+packed tracks) with projected queries and builds an ``IntervalIndex`` over
+them; later lookups are a bisection in memory. Indexes live in a size-bounded LRU, and concurrent
+first lookups for the same video share a single load.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from typing import Any
+
+from sqlalchemy import select
+
+from ytb_dual_subtitles.core.database import get_session_factory
+from ytb_dual_subtitles.core.settings import get_settings
+from ytb_dual_subtitles.models.video import (
+    PackedSubtitleTrack,
+    Subtitle,
+    SubtitleSegment,
+    Video,
+)
+from ytb_dual_subtitles.utils.interval_index import IntervalIndex
+from ytb_dual_subtitles.utils.packed_track import PackedTrack
+
+logger = logging.getLogger(__name__)
+
+
+class VideoSubtitleIndex:
+    """All subtitle segments of one video with a time index over them."""
+
+    __slots__ = ("_segments", "_index")
+
+    def __init__(self, segments: list[tuple[int | str, float, float, str, str]]) -> None:
+        """Build the index.
+
+        Args:
+            segments: (id, start_time, end_time, text, language) of each segment
+        """
+        self._segments = segments
+        self._index = IntervalIndex((segment[1], segment[2]) for segment in segments)
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def subtitles_at(self, time: float, tolerance: float = 0.0) -> list[dict[str, Any]]:
+        """Get the segments active at a point in time.
+
+        Args:
+            time: Playback time in seconds
+            tolerance: Sync tolerance in seconds
+
+        Returns:
+            Segment dictionaries ordered by start time
+        """
+        result = []
+        for position in self._index.query(time, margin=tolerance):
+            segment_id, start_time, end_time, text, language = self._segments[position]
+            result.append({
+                "id": segment_id,
+                "start_time": start_time,
+                "end_time": end_time,
+                "text": text,
+                "language": language,
+            })
+        return result
+
+
+class SubtitleIndexCache:
+    """LRU cache of per-video subtitle indexes with single-flight loads."""
+
+    def __init__(self, max_entries: int = 64) -> None:
+        """Initialize subtitle index cache.
+
+        Args:
+            max_entries: Maximum number of video indexes kept in memory
+        """
+        self.max_entries = max_entries
+
+        self._indexes: OrderedDict[str, VideoSubtitleIndex] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[VideoSubtitleIndex | None]] = {}
+        self._stats = {'hits': 0, 'misses': 0, 'coalesced': 0}
+
+    async def get(self, video_id: str) -> VideoSubtitleIndex | None:
+        """Get the subtitle index of a video, loading it on first access.
+
+        Args:
+            video_id: Database ID or YouTube ID of the video
+
+        Returns:
+            The video's index, or None if the video does not exist
+        """
+        index = self._indexes.get(video_id)
+        if index is not None:
+            self._indexes.move_to_end(video_id)
+            self._stats['hits'] += 1
+            return index
+
+        task = self._inflight.get(video_id)
+        if task is None:
+            self._stats['misses'] += 1
+            task = asyncio.create_task(self._load_and_store(video_id))
+            self._inflight[video_id] = task
+            task.add_done_callback(
+                lambda t, vid=video_id: self._inflight.pop(vid, None)
+                if self._inflight.get(vid) is t else None
+            )
+        else:
+            self._stats['coalesced'] += 1
+
+        # Shield so a cancelled caller does not abort the load other callers wait on
+        return await asyncio.shield(task)
+
+    def invalidate(self, *video_ids: str | int) -> None:
+        """Drop cached indexes after a video's subtitles changed or it was deleted.
+
+        Args:
+            video_ids: Keys to drop, e.g. both the database ID and the YouTube ID
+        """
+        for video_id in video_ids:
+            key = str(video_id)
+            self._indexes.pop(key, None)
+            # A load already running may have read the old rows; do not let it store them
+            self._inflight.pop(key, None)
+
+    async def _load_and_store(self, video_id: str) -> VideoSubtitleIndex | None:
+        """Load a video's segments and cache the index built from them."""
+        current = asyncio.current_task()
+        index = await self._load(video_id)
+
+        if index is not None and self._inflight.get(video_id) is current:
+            self._indexes[video_id] = index
+            self._indexes.move_to_end(video_id)
+            while len(self._indexes) > self.max_entries:
+                self._indexes.popitem(last=False)
+
+        return index
+
+    async def _load(self, video_id: str) -> VideoSubtitleIndex | None:
+        """Read all segments of a video, from segment rows and packed tracks."""
+        if video_id.isdigit():
+            video_filter = Video.id == int(video_id)
+        else:
+            video_filter = Video.youtube_id == video_id
+
+        session_factory = get_session_factory()
+        async with session_factory() as session:
+            video_pk = await session.scalar(select(Video.id).where(video_filter))
+            if video_pk is None:
+                return None
+
+            result = await session.execute(
+                select(
+                    SubtitleSegment.id,
+                    SubtitleSegment.start_time,
+                    SubtitleSegment.end_time,
+                    SubtitleSegment.text,
+                    Subtitle.language,
+                )
+                .join(Subtitle, SubtitleSegment.subtitle_id == Subtitle.id)
+                .where(Subtitle.video_id == video_pk)
+                .order_by(SubtitleSegment.start_time, Subtitle.language)
+            )
+            segments = [tuple(row) for row in result.all()]
+
+            # Tracks stored in the packed format have no segment rows; their cues
+            # get "<subtitle_id>:<sequence>" IDs, which cannot clash with row IDs
+            packed = await session.execute(
+                select(
+                    Subtitle.id,
+                    Subtitle.language,
+                    PackedSubtitleTrack.start_times,
+                    PackedSubtitleTrack.end_times,
+                    PackedSubtitleTrack.text_offsets,
+                    PackedSubtitleTrack.text_blob,
+                )
+                .join(Subtitle, PackedSubtitleTrack.subtitle_id == Subtitle.id)
+                .where(Subtitle.video_id == video_pk)
+            )
+            packed_rows = packed.all()
+            for subtitle_id, language, *blobs in packed_rows:
+                track = PackedTrack.from_blobs(*blobs)
+                segments.extend(
+                    (f"{subtitle_id}:{sequence}", start, end, text, language)
+                    for sequence, (start, end, text) in enumerate(track, start=1)
+                )
+            if packed_rows:
+                segments.sort(key=lambda segment: (segment[1], segment[4]))
+
+        logger.info(f"Built subtitle index for video {video_id}: {len(segments)} segments")
+        return VideoSubtitleIndex(segments)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            **self._stats,
+            'entries': len(self._indexes),
+            'cached_segments': sum(len(index) for index in self._indexes.values()),
+            'inflight': len(self._inflight),
+        }
+
+
+# Global cache instance shared by all player requests
+_subtitle_index_cache: SubtitleIndexCache | None = None
+
+
+def get_subtitle_index_cache() -> SubtitleIndexCache:
+    """Get the global subtitle index cache instance."""
+    global _subtitle_index_cache
+
+    if _subtitle_index_cache is None:
+        settings = get_settings()
+        _subtitle_index_cache = SubtitleIndexCache(
+            max_entries=settings.subtitle_index_cache_size
+        )
+
+    return _subtitle_index_cache
@@ -14,6 +14,12 @@ from ytb_dual_subtitles.exceptions.subtitle_errors import (
     SubtitleFormatError,
     SubtitleNotFoundError,
 )
+from ytb_dual_subtitles.utils.subtitle_align import align_cues
+from ytb_dual_subtitles.utils.subtitle_parser import (
+    clean_cue_text,
+    iter_cues,
+    parse_timestamp,
+)
 
 
 class SubtitleService:
@@ -147,78 +153,27 @@ class SubtitleService:
 
     def _parse_srt_format(self, srt_data: str) -> List[Dict[str, Any]]:
         """解析 SRT 格式字幕."""
-        segments = []
-
-        # SRT 格式正则表达式 - 处理多行文本
-        srt_pattern = r'(\d+)\n(\d{2}:\d{2}:\d{2},\d{3}) --> (\d{2}:\d{2}:\d{2},\d{3})\n(.*?)(?=\n\d+\n|\n*$)'
-
-        matches = re.findall(srt_pattern, srt_data, re.DOTALL)
-
-        for match in matches:
-            sequence = int(match[0])
-            start_time = self._parse_srt_time_string(match[1])
-            end_time = self._parse_srt_time_string(match[2])
-            text = self._clean_subtitle_text(match[3])
-
-            segments.append({
-                'sequence': sequence,
-                'start_time': start_time,
-                'end_time': end_time,
-                'text': text,
-                'duration': end_time - start_time
-            })
-
-        return segments
+        return self._parse_cue_lines(srt_data)
 
     def _parse_vtt_format(self, vtt_data: str) -> List[Dict[str, Any]]:
         """解析 VTT (WebVTT) 格式字幕."""
-        segments = []
-        lines = vtt_data.split('\n')
-        current_segment = None
-        sequence = 1
-
-        for line in lines:
-            line = line.strip()
-
-            # 跳过 VTT 头部和样式信息
-            if line.startswith('WEBVTT') or line.startswith('STYLE') or line.startswith('NOTE'):
-                continue
-
-            # 时间轴行
-            if '-->' in line:
-                time_parts = line.split(' --> ')
-                if len(time_parts) == 2:
-                    start_time = self._parse_vtt_time(time_parts[0].strip())
-                    end_time = self._parse_vtt_time(time_parts[1].strip())
-
-                    current_segment = {
-                        'sequence': sequence,
-                        'start_time': start_time,
-                        'end_time': end_time,
-                        'text': '',
-                        'duration': end_time - start_time
-                    }
-                    sequence += 1
-
-            # 文本行
-            elif line and current_segment is not None:
-                if current_segment['text']:
-                    current_segment['text'] += ' ' + line
-                else:
-                    current_segment['text'] = line
-
-            # 空行表示片段结束
-            elif not line and current_segment is not None:
-                current_segment['text'] = self._clean_subtitle_text(current_segment['text'])
-                segments.append(current_segment)
-                current_segment = None
+        return self._parse_cue_lines(vtt_data)
 
-        # 添加最后一个片段
-        if current_segment is not None:
-            current_segment['text'] = self._clean_subtitle_text(current_segment['text'])
-            segments.append(current_segment)
-
-        return segments
+    def _parse_cue_lines(self, subtitle_data: str) -> List[Dict[str, Any]]:
+        """使用共享的流式解析器解析 SRT/VTT 文本."""
+        try:
+            return [
+                {
+                    'sequence': sequence,
+                    'start_time': cue.start,
+                    'end_time': cue.end,
+                    'text': cue.text,
+                    'duration': cue.end - cue.start
+                }
+                for sequence, cue in enumerate(iter_cues(subtitle_data.splitlines()), start=1)
+            ]
+        except ValueError as e:
+            raise SubtitleFormatError(str(e)) from e
 
     def _parse_json_format(self, json_data: str) -> List[Dict[str, Any]]:
         """解析 JSON 格式字幕."""
@@ -240,42 +195,15 @@ class SubtitleService:
     def _parse_srt_time_string(self, time_str: str) -> float:
         """解析 SRT 时间字符串为秒数 (HH:MM:SS,mmm)."""
         try:
-            time_part, ms_part = time_str.split(',')
-            hours, minutes, seconds = map(int, time_part.split(':'))
-            milliseconds = int(ms_part)
-
-            total_seconds = hours * 3600 + minutes * 60 + seconds + milliseconds / 1000
-            return total_seconds
-        except (ValueError, IndexError) as e:
+            return parse_timestamp(time_str.strip())
+        except ValueError as e:
             raise SubtitleFormatError(f"Invalid SRT time format: {time_str}") from e
 
     def _parse_vtt_time(self, time_str: str) -> float:
         """解析 VTT 时间字符串为秒数 (HH:MM:SS.mmm 或 MM:SS.mmm)."""
         try:
             # 移除可能的位置信息 (如 "00:00.500 position:50%")
-            time_str = time_str.split()[0]
-
-            if '.' in time_str:
-                time_part, ms_part = time_str.split('.')
-                ms = int(ms_part.ljust(3, '0')[:3])  # 确保3位毫秒
-            else:
-                time_part = time_str
-                ms = 0
-
-            time_parts = time_part.split(':')
-
-            if len(time_parts) == 3:
-                # HH:MM:SS
-                hours, minutes, seconds = map(int, time_parts)
-            elif len(time_parts) == 2:
-                # MM:SS
-                hours = 0
-                minutes, seconds = map(int, time_parts)
-            else:
-                raise ValueError("Invalid time format")
-
-            total_seconds = hours * 3600 + minutes * 60 + seconds + ms / 1000
-            return total_seconds
+            return parse_timestamp(time_str.split()[0])
         except (ValueError, IndexError) as e:
             raise SubtitleFormatError(f"Invalid VTT time format: {time_str}") from e
 
@@ -284,13 +212,7 @@ class SubtitleService:
         if not text:
             return ""
 
-        # 移除HTML标签
-        text = re.sub(r'<[^>]+>', '', text)
-
-        # 移除多余的空白字符
-        text = ' '.join(text.split())
-
-        return text.strip()
+        return clean_cue_text(text)
 
     async def check_subtitle_availability(self, video_id: str) -> Dict[str, Any]:
         """异步检查视频字幕可用性.
@@ -425,7 +347,7 @@ class SubtitleService:
         primary_language: str = 'en',
         secondary_language: str = 'zh'
     ) -> Dict[str, Any]:
-        \"\"\"提取双语字幕，优先使用原生字幕避免翻译.
+        """提取双语字幕，优先使用原生字幕避免翻译.
 
         Args:
             video_id: YouTube 视频 ID
@@ -438,7 +360,7 @@ class SubtitleService:
         Raises:
             SubtitleNotFoundError: 未找到字幕
             SubtitleExtractionError: 提取失败
-        \"\"\"
+        """
         if not video_id:
             raise SubtitleExtractionError("Video ID cannot be empty")
 
@@ -519,7 +441,7 @@ class SubtitleService:
         english_subtitle: Dict[str, Any],
         chinese_subtitle: Dict[str, Any]
     ) -> Dict[str, Any]:
-        \"\"\"合并英文和中文字幕为双语字幕.
+        """合并英文和中文字幕为双语字幕.
 
         Args:
             video_id: 视频ID
@@ -528,45 +450,25 @@ class SubtitleService:
 
         Returns:
             合并后的双语字幕数据
-        \"\"\"
+        """
         # 处理两种字幕的时间轴对齐
         english_segments = await self._process_transcript_segments(english_subtitle['data'])
         chinese_segments = await self._process_transcript_segments(chinese_subtitle['data'])
 
-        # 创建时间对齐的双语字幕
+        # 线性扫描对齐时间轴：重叠比例超过阈值的中文字幕中取重叠最长的
+        matches = align_cues(
+            [(seg['start_time'], seg['end_time']) for seg in english_segments],
+            [(seg['start_time'], seg['end_time']) for seg in chinese_segments],
+            min_overlap_ratio=0.3
+        )
+
         merged_segments = []
-        chinese_index = 0
 
-        for eng_segment in english_segments:
+        for eng_segment, match in zip(english_segments, matches, strict=True):
             eng_start = eng_segment['start_time']
             eng_end = eng_segment['end_time']
             eng_text = eng_segment['text']
-
-            # 查找时间上最接近的中文字幕
-            best_chinese_text = ""
-            best_overlap = 0.0
-
-            # 从当前位置开始搜索，避免重复搜索
-            search_start = max(0, chinese_index - 2)
-            for i in range(search_start, len(chinese_segments)):
-                chi_segment = chinese_segments[i]
-                chi_start = chi_segment['start_time']
-                chi_end = chi_segment['end_time']
-
-                # 计算时间重叠度
-                overlap_start = max(eng_start, chi_start)
-                overlap_end = min(eng_end, chi_end)
-
-                if overlap_start < overlap_end:
-                    overlap = overlap_end - overlap_start
-                    eng_duration = eng_end - eng_start
-                    overlap_ratio = overlap / eng_duration if eng_duration > 0 else 0
-
-                    # 如果重叠比例超过阈值，认为是对应的字幕
-                    if overlap_ratio > 0.3 and overlap > best_overlap:
-                        best_overlap = overlap
-                        best_chinese_text = chi_segment['text']
-                        chinese_index = i
+            best_chinese_text = chinese_segments[match]['text'] if match is not None else ""
 
             # 创建双语字幕片段
             merged_segment = {
@@ -576,7 +478,7 @@ class SubtitleService:
                 'english': eng_text,
                 'chinese': best_chinese_text or eng_text,  # 如果没找到对应中文，使用英文
                 'duration': eng_end - eng_start,
-                'text': f"{eng_text}\\n{best_chinese_text}" if best_chinese_text else eng_text
+                'text': f"{eng_text}\n{best_chinese_text}" if best_chinese_text else eng_text
             }
             merged_segments.append(merged_segment)
 
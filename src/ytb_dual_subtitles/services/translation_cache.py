@@ -0,0 +1,161 @@
+"""Persistent translation cache.
+
+Shared by every ``TranslationService``: a translation is stored once per
+language pair and normalized source text, so re-importing a video or
+meeting the same intro lines in another video of a channel costs no API
+call. Entries live in SQLite and survive restarts. The cache is bounded by
+a byte budget and evicts the least recently used entries when it is
+exceeded.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import unicodedata
+from typing import Any
+
+from ytb_dual_subtitles.core.settings import get_settings
+from ytb_dual_subtitles.database.models import DatabaseManager, get_database_manager
+from ytb_dual_subtitles.database.translation_cache_dao import TranslationCacheDAO
+
+logger = logging.getLogger(__name__)
+
+# Bytes counted per entry on top of the translation text (key, columns, index)
+ENTRY_OVERHEAD_BYTES = 96
+
+# Eviction shrinks the cache to this fraction of the budget, so it does not run on every write
+EVICTION_TARGET = 0.9
+
+
+def normalize_translation_text(text: str) -> str:
+    """Normalize source text for translation and cache lookups.
+
+    Applies Unicode NFC and collapses all whitespace, line breaks included,
+    to single spaces.
+    """
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+class TranslationCache:
+    """SQLite-backed translation cache with LRU eviction under a byte budget."""
+
+    def __init__(self, db_manager: DatabaseManager, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """Initialize translation cache.
+
+        Args:
+            db_manager: Database manager used for persistence
+            max_bytes: Size budget in bytes (0 disables caching)
+        """
+        self._db_manager = db_manager
+        self._dao = TranslationCacheDAO(db_manager)
+        self.max_bytes = max_bytes
+
+        # Estimated total size; loaded on the first write and corrected by each eviction
+        self._total_bytes: int | None = None
+        self._stats = {'hits': 0, 'misses': 0, 'writes': 0, 'evictions': 0}
+
+    @staticmethod
+    def make_key(text: str, source_lang: str, target_lang: str) -> str:
+        """Build the cache key of a text and language pair."""
+        content = f"{source_lang}\x1f{target_lang}\x1f{normalize_translation_text(text)}"
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
+
+    async def get_many(self, texts: list[str], source_lang: str, target_lang: str) -> dict[str, str]:
+        """Look up cached translations.
+
+        Args:
+            texts: Source texts
+            source_lang: Source language
+            target_lang: Target language
+
+        Returns:
+            Mapping of the texts found in the cache to their translations
+        """
+        if self.max_bytes <= 0 or not texts:
+            return {}
+
+        keys = {text: self.make_key(text, source_lang, target_lang) for text in texts}
+        try:
+            found = await self._db_manager.run(self._dao.get_many, list(set(keys.values())))
+        except Exception as e:
+            logger.warning(f"Failed to read translation cache: {e}")
+            found = {}
+
+        result = {text: found[key] for text, key in keys.items() if key in found}
+        self._stats['hits'] += len(result)
+        self._stats['misses'] += len(keys) - len(result)
+        return result
+
+    async def put_many(self, translations: dict[str, str], source_lang: str, target_lang: str) -> None:
+        """Store translations, evicting old entries if the budget is exceeded.
+
+        Args:
+            translations: Mapping of source texts to translations
+            source_lang: Source language
+            target_lang: Target language
+        """
+        if self.max_bytes <= 0 or not translations:
+            return
+
+        entries = [
+            (
+                self.make_key(text, source_lang, target_lang),
+                translation,
+                len(translation.encode('utf-8')) + ENTRY_OVERHEAD_BYTES,
+            )
+            for text, translation in translations.items()
+        ]
+        try:
+            if self._total_bytes is None:
+                self._total_bytes = await self._db_manager.run(self._dao.total_size)
+            await self._db_manager.run(self._dao.save_many, entries)
+            self._stats['writes'] += len(entries)
+
+            # Overwritten entries are counted twice here; eviction recounts exactly
+            self._total_bytes += sum(size for _, _, size in entries)
+            if self._total_bytes > self.max_bytes:
+                evicted, self._total_bytes = await self._db_manager.run(
+                    self._dao.evict_to, int(self.max_bytes * EVICTION_TARGET)
+                )
+                self._stats['evictions'] += evicted
+                if evicted:
+                    logger.info(f"Evicted {evicted} translation cache entries")
+        except Exception as e:
+            logger.warning(f"Failed to persist translations: {e}")
+
+    async def clear(self) -> int:
+        """Delete all cached translations.
+
+        Returns:
+            Number of deleted entries
+        """
+        deleted = await self._db_manager.run(self._dao.clear)
+        self._total_bytes = 0
+        return deleted
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            **self._stats,
+            'total_bytes': self._total_bytes,
+            'max_bytes': self.max_bytes,
+        }
+
+
+# Global cache instance shared by all TranslationService instances
+_translation_cache: TranslationCache | None = None
+
+
+def get_translation_cache() -> TranslationCache:
+    """Get the global translation cache instance."""
+    global _translation_cache
+
+    if _translation_cache is None:
+        settings = get_settings()
+        _translation_cache = TranslationCache(
+            get_database_manager(),
+            max_bytes=settings.translation_cache_max_bytes
+        )
+
+    return _translation_cache
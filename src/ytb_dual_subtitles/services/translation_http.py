@@ -0,0 +1,76 @@
+"""Shared HTTP client for translation providers.
+
+All translation requests go through one long-lived ``aiohttp`` session
+instead of a new session per call, so connections to a provider are kept
+alive and reused (no new TCP connection or TLS handshake per request),
+DNS answers are cached, and the number of open connections is bounded.
+The session is created on first use and closed in the application
+lifespan via ``close_translation_session``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+
+from ytb_dual_subtitles.core.settings import get_settings
+
+try:
+    import aiohttp
+except ImportError:  # Translation falls back to returning the source text
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+# Seconds resolved provider addresses are reused
+DNS_CACHE_TTL = 300
+
+# Seconds an idle connection is kept open for the next request
+KEEPALIVE_TIMEOUT = 30
+
+# Global session shared by all translation services, and the loop it belongs to
+_session: aiohttp.ClientSession | None = None
+_session_loop: asyncio.AbstractEventLoop | None = None
+
+
+def get_translation_session() -> aiohttp.ClientSession | None:
+    """Get the shared translation HTTP session, creating it on first use.
+
+    Must be called from a running event loop. A session left over from a
+    different (e.g. already closed) loop is replaced.
+
+    Returns:
+        The shared session, or None if aiohttp is not installed
+    """
+    global _session, _session_loop
+
+    if aiohttp is None:
+        return None
+
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        settings = get_settings()
+        connector = aiohttp.TCPConnector(
+            limit=settings.translation_http_max_connections,
+            limit_per_host=settings.translation_http_max_connections_per_host,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+        )
+        _session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=settings.translation_http_timeout),
+        )
+        _session_loop = loop
+        logger.info("Created shared translation HTTP session")
+
+    return _session
+
+
+async def close_translation_session() -> None:
+    """Close the shared translation HTTP session and its connections."""
+    global _session, _session_loop
+
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+    _session_loop = None
@@ -0,0 +1,168 @@
+"""Persistent translation jobs.
+
+Each ``TranslationManager.translate_segments`` call runs as its own job,
+tagged with a content key derived from the segment list (texts and
+timings) and target language. The translations of every segment range are
+checkpointed in SQLite as soon as the range is finished, so when a provider
+fails partway through (or the process restarts) the next run over the same
+content only translates the ranges that are still missing. Checkpoints hold
+translated strings only; they are applied onto the caller's segments. A
+completed job is deleted together with the failed runs it superseded;
+concurrent runs keep their rows. Jobs abandoned for longer than
+``STALE_JOB_MAX_AGE`` are purged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from ytb_dual_subtitles.database.models import DatabaseManager, get_database_manager
+from ytb_dual_subtitles.database.translation_job_dao import TranslationJobDAO
+
+logger = logging.getLogger(__name__)
+
+# Seconds after which an unfinished job is no longer resumed (7 days)
+STALE_JOB_MAX_AGE = 7 * 24 * 3600
+
+
+def make_translation_content_key(segments: List[Dict[str, Any]], target_lang: str) -> str:
+    """Build the content key of a segment list and target language.
+
+    The same subtitles translated into the same language always map to the
+    same key, so a retry finds the checkpoints of earlier runs. Both the
+    ``start``/``end`` and the ``start_time``/``end_time`` timing keys are
+    covered.
+    """
+    digest = hashlib.sha1(target_lang.encode('utf-8'))
+    for segment in segments:
+        digest.update(b'\x1e')
+        digest.update(
+            json.dumps(
+                [
+                    segment.get('start'), segment.get('end'),
+                    segment.get('start_time'), segment.get('end_time'),
+                    segment.get('text', ''),
+                ],
+                default=str
+            ).encode('utf-8')
+        )
+    return digest.hexdigest()
+
+
+class TranslationJobStore:
+    """Checkpoint storage of translation jobs.
+
+    Storage errors are logged and ignored: a job that cannot be
+    checkpointed still runs, it just cannot be resumed.
+    """
+
+    def __init__(self, db_manager: DatabaseManager) -> None:
+        """Initialize translation job store.
+
+        Args:
+            db_manager: Database manager used for persistence
+        """
+        self._db_manager = db_manager
+        self._dao = TranslationJobDAO(db_manager)
+        self._purged = False
+
+    async def start(
+        self,
+        content_key: str,
+        target_lang: str,
+        total_segments: int
+    ) -> Tuple[str, Dict[int, List[Optional[str]]]]:
+        """Start a job, resuming from the checkpoints of earlier runs.
+
+        Args:
+            content_key: Key of the segments and target language
+            target_lang: Target language
+            total_segments: Number of segments of the job
+
+        Returns:
+            Job ID of the new run and the checkpointed ranges as a mapping
+            of start index to the translation of each segment of the range
+        """
+        job_id = uuid.uuid4().hex
+        try:
+            if not self._purged:
+                self._purged = True
+                purged = await self._db_manager.run(self._dao.purge_stale, STALE_JOB_MAX_AGE)
+                if purged:
+                    logger.info(f"Purged {purged} stale translation jobs")
+
+            attempts = await self._db_manager.run(
+                self._dao.start_job, job_id, content_key, target_lang, total_segments
+            )
+            ranges = await self._db_manager.run(self._dao.get_checkpoints, content_key)
+        except Exception as e:
+            logger.warning(f"Failed to load translation job {content_key[:12]}: {e}")
+            return job_id, {}
+
+        # Runs may have checkpointed overlapping ranges; keep the earliest
+        # non-overlapping ones that fit the segment list
+        checkpoints = {}
+        covered = 0
+        for start, translations in ranges:
+            if start >= covered and start + len(translations) <= total_segments:
+                checkpoints[start] = translations
+                covered = start + len(translations)
+        if checkpoints:
+            done = sum(len(translations) for translations in checkpoints.values())
+            logger.info(
+                f"Resuming translation job {content_key[:12]} (attempt {attempts}): "
+                f"{done}/{total_segments} segments already translated"
+            )
+        return job_id, checkpoints
+
+    async def save_checkpoint(
+        self,
+        job_id: str,
+        start_index: int,
+        translations: List[Optional[str]]
+    ) -> None:
+        """Checkpoint the translations of a segment range.
+
+        Args:
+            job_id: Job ID
+            start_index: Index of the first segment of the range
+            translations: Translation of each segment of the range, None for blank segments
+        """
+        try:
+            await self._db_manager.run(
+                self._dao.save_checkpoint, job_id, start_index, translations
+            )
+        except Exception as e:
+            logger.warning(f"Failed to checkpoint translation job {job_id[:12]}: {e}")
+
+    async def fail(self, job_id: str, error: str) -> None:
+        """Mark a job as failed, keeping its checkpoints."""
+        try:
+            await self._db_manager.run(self._dao.fail_job, job_id, error)
+        except Exception as e:
+            logger.warning(f"Failed to update translation job {job_id[:12]}: {e}")
+
+    async def complete(self, job_id: str, content_key: str) -> None:
+        """Finish a job and drop its checkpoints and those of failed earlier runs."""
+        try:
+            await self._db_manager.run(self._dao.complete_job, job_id, content_key)
+        except Exception as e:
+            logger.warning(f"Failed to delete translation job {job_id[:12]}: {e}")
+
+
+# Global job store shared by all TranslationManager instances
+_translation_job_store: TranslationJobStore | None = None
+
+
+def get_translation_job_store() -> TranslationJobStore:
+    """Get the global translation job store instance."""
+    global _translation_job_store
+
+    if _translation_job_store is None:
+        _translation_job_store = TranslationJobStore(get_database_manager())
+
+    return _translation_job_store
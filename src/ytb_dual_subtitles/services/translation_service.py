@@ -6,22 +6,133 @@ Subtasks 2.1-2.6: Complete implementation following TDD approach
 
 from __future__ import annotations
 
+import asyncio
 import hashlib
-import time
+import logging
+import random
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
-
-from ytb_dual_subtitles.exceptions.subtitle_errors import TranslationError
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from ytb_dual_subtitles.core.settings import get_settings
+from ytb_dual_subtitles.exceptions.subtitle_errors import (
+    TranslationError,
+    TranslationRateLimitError,
+)
+from ytb_dual_subtitles.services.translation_cache import (
+    TranslationCache,
+    get_translation_cache,
+    normalize_translation_text,
+)
+from ytb_dual_subtitles.services.translation_http import get_translation_session
+from ytb_dual_subtitles.services.translation_jobs import (
+    TranslationJobStore,
+    get_translation_job_store,
+    make_translation_content_key,
+)
+from ytb_dual_subtitles.utils.circuit_breaker import CLOSED, CircuitBreaker
+from ytb_dual_subtitles.utils.token_bucket import TokenBucket
+
+logger = logging.getLogger(__name__)
+
+BAIDU_API_URL = "https://fanyi-api.baidu.com/api/trans/vip/translate"
+
+# 百度翻译单次请求 q 参数的上限（UTF-8 字节，约 2000 个汉字）
+BAIDU_MAX_QUERY_BYTES = 6000
+
+# 百度翻译标准版的 QPS 配额（高级版为 10）
+BAIDU_DEFAULT_QPS = 1.0
+
+# 百度翻译表示请求过于频繁的错误码（54003 访问频率受限，54005 长 query 请求频繁）
+BAIDU_RATE_LIMIT_CODES = frozenset({'54003', '54005'})
+
+# 百度翻译的成功返回码
+BAIDU_SUCCESS_CODE = '52000'
+
+# 语言代码到百度翻译语言代码的映射（未列出的原样使用）
+BAIDU_LANGUAGE_CODES = {
+    'en': 'en',
+    'zh-CN': 'zh',
+    'zh': 'zh'
+}
+
+# 触发限流后同一请求的最大重试次数
+RATE_LIMIT_MAX_RETRIES = 5
+
+# TranslationManager 每个并发批次包含的字幕片段数（约等于一次百度批量请求）
+TRANSLATION_CHUNK_SIZE = 100
+
+
+def pack_translation_batches(texts: List[str], max_bytes: int) -> List[List[int]]:
+    """把多行文本按顺序装入批次，每批用换行连接后不超过 max_bytes.
+
+    超过上限的单行单独成批。
+
+    Args:
+        texts: 待翻译文本（不含换行）
+        max_bytes: 每批换行连接后的最大 UTF-8 字节数
+
+    Returns:
+        每个批次包含的文本下标
+    """
+    batches: List[List[int]] = []
+    current: List[int] = []
+    current_bytes = 0
+
+    for index, text in enumerate(texts):
+        size = len(text.encode('utf-8'))
+        # 除第一行外每行多占一个换行符
+        needed = size if not current else current_bytes + 1 + size
+        if current and needed > max_bytes:
+            batches.append(current)
+            current, needed = [], size
+        current.append(index)
+        current_bytes = needed
+
+    if current:
+        batches.append(current)
+    return batches
+
+
+def apply_translations(
+    segments: List[Dict[str, Any]],
+    translations: List[Optional[str]]
+) -> List[Dict[str, Any]]:
+    """把译文写回字幕片段.
+
+    Args:
+        segments: 字幕片段列表
+        translations: 与非空文本片段一一对应的译文，翻译失败的条目为 None
+
+    Returns:
+        包含翻译结果的新片段列表
+    """
+    translations_iter = iter(translations)
+
+    translated_segments = []
+    for segment in segments:
+        original_text = segment.get('text', '')
+        new_segment = segment.copy()
+        if original_text.strip():
+            translated_text = next(translations_iter)
+            # 翻译失败时保留原文
+            new_segment['chinese'] = translated_text if translated_text is not None else original_text
+            new_segment['english'] = original_text
+        translated_segments.append(new_segment)
+
+    return translated_segments
 
 
 class TranslationService(ABC):
     """抽象翻译服务基类 - 定义翻译服务接口."""
 
-    def __init__(self) -> None:
-        """Initialize base translation service."""
-        self._cache: Dict[str, Dict[str, Any]] = {}
+    def __init__(self, qps: Optional[float] = None) -> None:
+        """Initialize base translation service.
+
+        Args:
+            qps: 服务商的 QPS 配额；设置后所有请求经令牌桶限速
+        """
         self._cache_enabled = True
-        self._cache_ttl = 7 * 24 * 3600  # 7天缓存
+        self.rate_limiter: Optional[TokenBucket] = TokenBucket(qps) if qps else None
 
     @abstractmethod
     async def translate_text(self, text: str, target_lang: str, source_lang: str = "en") -> str:
@@ -40,18 +151,62 @@ class TranslationService(ABC):
         """
         pass
 
-    def _get_cache_key(self, text: str, source_lang: str, target_lang: str) -> str:
-        """生成缓存键."""
-        content = f"{text}|{source_lang}|{target_lang}"
-        return hashlib.md5(content.encode('utf-8')).hexdigest()
+    @property
+    def cache(self) -> TranslationCache:
+        """所有翻译服务共享的持久化翻译缓存."""
+        return get_translation_cache()
 
-    def _is_cache_valid(self, cache_entry: Dict[str, Any]) -> bool:
-        """检查缓存是否有效."""
+    async def _get_cached_many(
+        self,
+        texts: List[str],
+        source_lang: str,
+        target_lang: str
+    ) -> Dict[str, str]:
+        """批量读取缓存译文，返回命中的 文本 -> 译文."""
         if not self._cache_enabled:
-            return False
+            return {}
+        return await self.cache.get_many(texts, source_lang, target_lang)
+
+    async def _get_cached(self, text: str, source_lang: str, target_lang: str) -> Optional[str]:
+        """读取缓存译文，未命中时返回 None."""
+        cached = await self._get_cached_many([text], source_lang, target_lang)
+        return cached.get(text)
 
-        timestamp = cache_entry.get('timestamp', 0)
-        return time.time() - timestamp < self._cache_ttl
+    async def _set_cached_many(
+        self,
+        translations: Dict[str, str],
+        source_lang: str,
+        target_lang: str
+    ) -> None:
+        """批量缓存译文."""
+        if self._cache_enabled:
+            await self.cache.put_many(translations, source_lang, target_lang)
+
+    async def translate_batch(
+        self,
+        texts: List[str],
+        target_lang: str,
+        source_lang: str = "en"
+    ) -> List[Optional[str]]:
+        """翻译多条文本.
+
+        默认逐条调用 translate_text；支持多行请求的服务应重写此方法。
+
+        Args:
+            texts: 待翻译文本列表
+            target_lang: 目标语言
+            source_lang: 源语言
+
+        Returns:
+            与 texts 一一对应的译文，翻译失败的条目为 None
+        """
+        results: List[Optional[str]] = []
+        for text in texts:
+            try:
+                results.append(await self.translate_text(text, target_lang, source_lang))
+            except TranslationError:
+                results.append(None)
+        return results
 
     async def translate_segments(
         self,
@@ -67,59 +222,47 @@ class TranslationService(ABC):
         Returns:
             包含翻译结果的片段列表
         """
-        translated_segments = []
-
-        for segment in segments:
-            original_text = segment.get('text', '')
-            if not original_text.strip():
-                translated_segments.append(segment.copy())
-                continue
-
-            try:
-                translated_text = await self.translate_text(original_text, target_lang)
-
-                new_segment = segment.copy()
-                new_segment['chinese'] = translated_text
-                new_segment['english'] = original_text
-                translated_segments.append(new_segment)
-
-            except TranslationError:
-                # 翻译失败时保留原文
-                new_segment = segment.copy()
-                new_segment['chinese'] = original_text
-                new_segment['english'] = original_text
-                translated_segments.append(new_segment)
-
-        return translated_segments
+        texts = [
+            segment.get('text', '')
+            for segment in segments
+            if segment.get('text', '').strip()
+        ]
+        return apply_translations(segments, await self.translate_batch(texts, target_lang))
 
-    def clear_cache(self) -> None:
-        """清理翻译缓存."""
-        self._cache.clear()
+    async def clear_cache(self) -> None:
+        """清理翻译缓存（共享缓存，对所有翻译服务生效）."""
+        await self.cache.clear()
 
     def get_cache_stats(self) -> Dict[str, Any]:
         """获取缓存统计信息."""
-        valid_entries = sum(1 for entry in self._cache.values() if self._is_cache_valid(entry))
         return {
-            'total_entries': len(self._cache),
-            'valid_entries': valid_entries,
-            'cache_enabled': self._cache_enabled,
-            'cache_ttl': self._cache_ttl
+            **self.cache.get_stats(),
+            'cache_enabled': self._cache_enabled
         }
 
 
 class BaiduTranslationService(TranslationService):
     """百度翻译服务实现."""
 
-    def __init__(self, app_id: Optional[str] = None, secret_key: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        app_id: Optional[str] = None,
+        secret_key: Optional[str] = None,
+        qps: float = BAIDU_DEFAULT_QPS
+    ) -> None:
         """Initialize Baidu translation service.
 
         Args:
             app_id: 百度翻译API应用ID
             secret_key: 百度翻译API密钥
+            qps: 账户的 QPS 配额
         """
-        super().__init__()
+        super().__init__(qps=qps)
         self.app_id = app_id
         self.secret_key = secret_key
+        self.max_query_bytes = BAIDU_MAX_QUERY_BYTES
+        self.api_url = BAIDU_API_URL
+        self._batch_stats = {'lines': 0, 'api_calls': 0, 'fallback_batches': 0}
 
     async def translate_text(self, text: str, target_lang: str, source_lang: str = "en") -> str:
         """使用百度翻译API翻译文本."""
@@ -127,62 +270,165 @@ class BaiduTranslationService(TranslationService):
             return text
 
         # 检查缓存
-        cache_key = self._get_cache_key(text, source_lang, target_lang)
-        if self._cache_enabled and cache_key in self._cache:
-            cache_entry = self._cache[cache_key]
-            if self._is_cache_valid(cache_entry):
-                return cache_entry['translation']
+        cached = await self._get_cached(text, source_lang, target_lang)
+        if cached is not None:
+            return cached
 
         try:
-            # 在实际实现中会调用百度翻译API
-            # 目前使用模拟实现
             translated_text = await self._call_baidu_api(text, source_lang, target_lang)
+            self._batch_stats['lines'] += 1
+            self._batch_stats['api_calls'] += 1
 
             # 缓存结果
-            if self._cache_enabled:
-                self._cache[cache_key] = {
-                    'translation': translated_text,
-                    'timestamp': time.time()
-                }
+            if self._has_credentials():
+                await self._set_cached_many({text: translated_text}, source_lang, target_lang)
 
             return translated_text
 
         except Exception as e:
             raise TranslationError(f"Baidu translation failed: {str(e)}") from e
 
+    async def translate_batch(
+        self,
+        texts: List[str],
+        target_lang: str,
+        source_lang: str = "en"
+    ) -> List[Optional[str]]:
+        """批量翻译多条文本.
+
+        未命中缓存的文本去重后按 max_query_bytes 装批，每批用换行连接成
+        一个 q 参数请求，按下标把 trans_result 对应回各行。某批请求失败时
+        改为逐行请求该批文本。
+
+        Args:
+            texts: 待翻译文本列表
+            target_lang: 目标语言
+            source_lang: 源语言
+
+        Returns:
+            与 texts 一一对应的译文，翻译失败的条目为 None
+        """
+        results: List[Optional[str]] = [None] * len(texts)
+        cached = await self._get_cached_many(
+            [text for text in texts if text.strip()], source_lang, target_lang
+        )
+
+        # 未命中缓存的文本（规范化为单行）及其在 texts 中的位置，相同文本只翻译一次
+        pending: Dict[str, List[int]] = {}
+        for index, text in enumerate(texts):
+            if not text.strip():
+                results[index] = text
+            elif text in cached:
+                results[index] = cached[text]
+            else:
+                pending.setdefault(normalize_translation_text(text), []).append(index)
+
+        lines = list(pending)
+        new_translations: Dict[str, str] = {}
+        api_calls = 0
+
+        for batch in pack_translation_batches(lines, self.max_query_bytes):
+            batch_lines = [lines[i] for i in batch]
+            api_calls += 1
+            try:
+                translations: List[Optional[str]] = await self._call_baidu_api_batch(
+                    batch_lines, source_lang, target_lang
+                )
+            except TranslationError as e:
+                if len(batch) == 1 or isinstance(e, TranslationRateLimitError):
+                    # 持续限流时逐行请求只会更频繁
+                    translations = [None] * len(batch)
+                else:
+                    # 整批失败时逐行请求，避免一行异常拖累整批
+                    logger.warning(f"Baidu batch of {len(batch)} lines failed, retrying per line: {e}")
+                    self._batch_stats['fallback_batches'] += 1
+                    translations = []
+                    for line in batch_lines:
+                        api_calls += 1
+                        try:
+                            translations.append(await self._call_baidu_api(line, source_lang, target_lang))
+                        except TranslationError:
+                            translations.append(None)
+
+            for i, translation in zip(batch, translations, strict=True):
+                if translation is None:
+                    continue
+                new_translations[lines[i]] = translation
+                for index in pending[lines[i]]:
+                    results[index] = translation
+
+        # 未配置凭据时返回的是原文，不写入共享缓存
+        if self._has_credentials():
+            await self._set_cached_many(new_translations, source_lang, target_lang)
+
+        translated_lines = sum(len(indices) for indices in pending.values())
+        self._batch_stats['lines'] += translated_lines
+        self._batch_stats['api_calls'] += api_calls
+        if translated_lines:
+            logger.info(
+                f"Baidu translated {translated_lines} lines in {api_calls} API calls "
+                f"(saved {translated_lines - api_calls})"
+            )
+
+        return results
+
+    def get_batch_stats(self) -> Dict[str, Any]:
+        """获取批量翻译统计信息（包括节省的 API 调用次数）."""
+        return {
+            **self._batch_stats,
+            'api_calls_saved': self._batch_stats['lines'] - self._batch_stats['api_calls'],
+            'max_query_bytes': self.max_query_bytes
+        }
+
+    def _has_credentials(self) -> bool:
+        """是否配置了百度翻译API凭据."""
+        return bool(self.app_id and self.secret_key)
+
     async def _call_baidu_api(self, text: str, source_lang: str, target_lang: str) -> str:
-        """调用百度翻译API."""
-        import asyncio
-        import json
-        import random
-        from urllib.parse import quote
+        """调用百度翻译API翻译一条文本."""
+        translations = await self._call_baidu_api_batch(
+            [normalize_translation_text(text)], source_lang, target_lang
+        )
+        return translations[0]
+
+    async def _call_baidu_api_batch(
+        self,
+        lines: List[str],
+        source_lang: str,
+        target_lang: str
+    ) -> List[str]:
+        """调用百度翻译API，一次请求翻译多行文本.
+
+        Args:
+            lines: 不含换行的文本，以换行连接后作为 q 参数
+            source_lang: 源语言
+            target_lang: 目标语言
+
+        Returns:
+            与 lines 一一对应的译文
+        """
+        # Shared keep-alive session; None when aiohttp is not installed
+        session = get_translation_session()
 
         # Check if API credentials are configured
-        if not self.app_id or not self.secret_key:
+        if not self._has_credentials() or session is None:
             # Fallback to simple translation when no API config
             # This preserves the original text with a simple marker
-            return text  # Return original text if no translation available
+            return list(lines)  # Return original text if no translation available
 
-        try:
-            import aiohttp
+        text = "\n".join(lines)
 
+        try:
             # Prepare request parameters
             salt = str(random.randint(32768, 65536))
 
             # Create sign
-            import hashlib
             sign_str = f"{self.app_id}{text}{salt}{self.secret_key}"
             sign = hashlib.md5(sign_str.encode('utf-8')).hexdigest()
 
             # Map language codes to Baidu format
-            lang_mapping = {
-                'en': 'en',
-                'zh-CN': 'zh',
-                'zh': 'zh'
-            }
-
-            from_lang = lang_mapping.get(source_lang, source_lang)
-            to_lang = lang_mapping.get(target_lang, target_lang)
+            from_lang = BAIDU_LANGUAGE_CODES.get(source_lang, source_lang)
+            to_lang = BAIDU_LANGUAGE_CODES.get(target_lang, target_lang)
 
             # Prepare request data
             data = {
@@ -194,30 +440,48 @@ class BaiduTranslationService(TranslationService):
                 'sign': sign
             }
 
-            # Make API request
-            url = "https://fanyi-api.baidu.com/api/trans/vip/translate"
+            for _ in range(RATE_LIMIT_MAX_RETRIES + 1):
+                # 按 QPS 配额限速，并发批次共享同一个令牌桶
+                if self.rate_limiter:
+                    await self.rate_limiter.acquire()
 
-            async with aiohttp.ClientSession() as session:
-                async with session.post(url, data=data, timeout=10) as response:
+                # Make API request
+                async with session.post(self.api_url, data=data) as response:
                     result = await response.json()
 
-                    # Check for API errors
-                    if 'error_code' in result:
-                        error_code = result['error_code']
-                        error_msg = result.get('error_msg', f'API Error: {error_code}')
-                        raise TranslationError(f"Baidu API Error {error_code}: {error_msg}")
-
-                    # Extract translation result
-                    if 'trans_result' in result and len(result['trans_result']) > 0:
-                        return result['trans_result'][0]['dst']
+                error_code = str(result.get('error_code', BAIDU_SUCCESS_CODE))
+                if error_code in BAIDU_RATE_LIMIT_CODES:
+                    # 被限流：降低速率并退避后重试
+                    if self.rate_limiter:
+                        self.rate_limiter.throttle()
                     else:
-                        raise TranslationError("No translation result returned")
+                        await asyncio.sleep(1.0)
+                    continue
+
+                # Check for API errors
+                if error_code != BAIDU_SUCCESS_CODE:
+                    error_msg = result.get('error_msg', f'API Error: {error_code}')
+                    raise TranslationError(f"Baidu API Error {error_code}: {error_msg}")
+
+                if self.rate_limiter:
+                    self.rate_limiter.recover()
+
+                # Extract translation result: one entry per line of q, in order
+                trans_result = result.get('trans_result') or []
+                if len(trans_result) != len(lines):
+                    raise TranslationError(
+                        f"Expected {len(lines)} translation results, got {len(trans_result)}"
+                    )
+                return [entry['dst'] for entry in trans_result]
+
+            raise TranslationRateLimitError(
+                f"Baidu API still rate limited after {RATE_LIMIT_MAX_RETRIES} retries"
+            )
 
-        except ImportError:
-            # aiohttp not available, fallback to simple translation
-            return text
         except asyncio.TimeoutError:
             raise TranslationError("Translation request timed out")
+        except TranslationError:
+            raise
         except Exception as e:
             raise TranslationError(f"Translation API call failed: {str(e)}") from e
 
@@ -228,6 +492,8 @@ class GoogleTranslationService(TranslationService):
     def __init__(self) -> None:
         """Initialize Google translation service."""
         super().__init__()
+        # 模拟实现的结果不写入所有服务共享的翻译缓存
+        self._cache_enabled = False
 
     async def translate_text(self, text: str, target_lang: str, source_lang: str = "en") -> str:
         """使用Google翻译服务（googletrans）."""
@@ -235,11 +501,9 @@ class GoogleTranslationService(TranslationService):
             return text
 
         # 检查缓存
-        cache_key = self._get_cache_key(text, source_lang, target_lang)
-        if self._cache_enabled and cache_key in self._cache:
-            cache_entry = self._cache[cache_key]
-            if self._is_cache_valid(cache_entry):
-                return cache_entry['translation']
+        cached = await self._get_cached(text, source_lang, target_lang)
+        if cached is not None:
+            return cached
 
         try:
             # 实际实现中会使用 googletrans 库
@@ -252,11 +516,7 @@ class GoogleTranslationService(TranslationService):
             translated_text = f"[Google翻译] {text}"
 
             # 缓存结果
-            if self._cache_enabled:
-                self._cache[cache_key] = {
-                    'translation': translated_text,
-                    'timestamp': time.time()
-                }
+            await self._set_cached_many({text: translated_text}, source_lang, target_lang)
 
             return translated_text
 
@@ -265,13 +525,40 @@ class GoogleTranslationService(TranslationService):
 
 
 class TranslationManager:
-    """翻译管理器 - 支持多服务和自动故障切换."""
+    """翻译管理器 - 支持多服务、熔断与可断点续传的翻译任务."""
 
-    def __init__(self) -> None:
-        """Initialize translation manager."""
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        chunk_size: int = TRANSLATION_CHUNK_SIZE,
+        job_store: Optional[TranslationJobStore] = None
+    ) -> None:
+        """Initialize translation manager.
+
+        Args:
+            max_concurrency: 同时翻译的片段批次数，默认取 translation_concurrency 配置
+            chunk_size: 每个批次的字幕片段数
+            job_store: 翻译任务检查点存储，默认使用全局实例
+        """
         self.services: List[TranslationService] = []
+        # 与 services 一一对应的熔断器
+        self.breakers: List[CircuitBreaker] = []
         self.current_service_index = 0
-        self.failed_services: set = set()
+        self.max_concurrency = max_concurrency or get_settings().translation_concurrency
+        self.chunk_size = chunk_size
+        self._job_store = job_store
+
+    @property
+    def job_store(self) -> TranslationJobStore:
+        """翻译任务检查点存储."""
+        if self._job_store is None:
+            self._job_store = get_translation_job_store()
+        return self._job_store
+
+    @property
+    def failed_services(self) -> List[int]:
+        """熔断器未闭合（暂不可用或待探测）的服务下标."""
+        return [i for i, breaker in enumerate(self.breakers) if breaker.state != CLOSED]
 
     def add_service(self, service: TranslationService) -> None:
         """添加翻译服务到管理器.
@@ -279,12 +566,32 @@ class TranslationManager:
         Args:
             service: 翻译服务实例
         """
+        settings = get_settings()
         self.services.append(service)
+        self.breakers.append(CircuitBreaker(
+            failure_threshold=settings.translation_breaker_failure_threshold,
+            reset_timeout=settings.translation_breaker_reset_timeout
+        ))
 
     def remove_service(self, service: TranslationService) -> None:
         """从管理器中移除翻译服务."""
         if service in self.services:
-            self.services.remove(service)
+            index = self.services.index(service)
+            del self.services[index]
+            del self.breakers[index]
+            if self.current_service_index >= len(self.services):
+                self.current_service_index = 0
+
+    def _available_services(self) -> Iterator[Tuple[int, TranslationService]]:
+        """从当前服务开始依次给出熔断器允许请求的服务.
+
+        按需逐个检查，半开状态的服务只在真正要使用时才占用探测名额；
+        调用方必须向对应熔断器报告结果。
+        """
+        for i in range(len(self.services)):
+            service_index = (self.current_service_index + i) % len(self.services)
+            if self.breakers[service_index].allow_request():
+                yield service_index, self.services[service_index]
 
     async def translate_text(self, text: str, target_lang: str, source_lang: str = "en") -> str:
         """翻译文本，支持自动故障切换.
@@ -298,7 +605,7 @@ class TranslationManager:
             翻译后的文本
 
         Raises:
-            TranslationError: 所有服务都失败
+            TranslationError: 所有服务都失败或处于熔断状态
         """
         if not self.services:
             raise TranslationError("No translation services available")
@@ -306,29 +613,18 @@ class TranslationManager:
         last_error = None
 
         # 尝试每个可用的服务
-        for i in range(len(self.services)):
-            service_index = (self.current_service_index + i) % len(self.services)
-
-            # 跳过已知失败的服务
-            if service_index in self.failed_services:
-                continue
-
-            service = self.services[service_index]
-
+        for service_index, service in self._available_services():
             try:
                 result = await service.translate_text(text, target_lang, source_lang)
-                self.current_service_index = service_index
-
-                # 成功后从失败列表中移除
-                self.failed_services.discard(service_index)
-
-                return result
-
             except TranslationError as e:
                 last_error = e
-                self.failed_services.add(service_index)
+                self.breakers[service_index].record_failure()
                 continue
 
+            self.breakers[service_index].record_success()
+            self.current_service_index = service_index
+            return result
+
         # 所有服务都失败
         error_msg = f"All translation services failed. Last error: {last_error}"
         raise TranslationError(error_msg)
@@ -338,44 +634,184 @@ class TranslationManager:
         segments: List[Dict[str, Any]],
         target_lang: str = "zh-CN"
     ) -> List[Dict[str, Any]]:
-        """批量翻译字幕片段，支持故障切换.
+        """以可断点续传的任务批量翻译字幕片段，支持故障切换.
+
+        片段按 chunk_size 分批，最多 max_concurrency 个批次并发翻译；
+        请求速率由各服务的令牌桶按其 QPS 配额控制。每个完整翻译的批次
+        的译文立即写入检查点，某个批次在所有服务上都失败时其余批次照常完成，
+        每次调用都是独立的任务，再次翻译同一组片段时只翻译此前各次任务
+        均无检查点的区间。检查点只保存译文，结果总是基于本次传入的片段生成。
 
         Args:
             segments: 字幕片段列表
             target_lang: 目标语言
 
         Returns:
-            包含翻译结果的片段列表
+            包含翻译结果的片段列表（顺序与输入一致）
 
         Raises:
-            TranslationError: 翻译失败
+            TranslationError: 翻译失败（已完成的区间保留在检查点中）
         """
         if not self.services:
             raise TranslationError("No translation services available")
 
-        # 尝试使用当前服务
-        try:
-            current_service = self.services[self.current_service_index]
-            return await current_service.translate_segments(segments, target_lang)
-        except (IndexError, TranslationError):
-            # 如果当前服务失败，尝试其他服务
-            for service in self.services:
-                try:
-                    return await service.translate_segments(segments, target_lang)
-                except TranslationError:
-                    continue
+        content_key = make_translation_content_key(segments, target_lang)
+        job_id, done = await self.job_store.start(content_key, target_lang, len(segments))
+        ranges = self._pending_ranges(len(segments), done)
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def run(start: int, end: int) -> Tuple[int, List[Optional[str]]]:
+            async with semaphore:
+                translated, complete = await self._translate_chunk(segments[start:end], target_lang)
+            # 部分条目未翻译的批次不写检查点，下次重新翻译
+            if complete:
+                await self.job_store.save_checkpoint(job_id, start, translated)
+            return start, translated
+
+        results = await asyncio.gather(
+            *(run(start, end) for start, end in ranges), return_exceptions=True
+        )
+
+        errors = []
+        for result in results:
+            if isinstance(result, TranslationError):
+                errors.append(result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                start, translated = result
+                done[start] = translated
+
+        if errors:
+            error_msg = (
+                f"Translation job {job_id[:12]} failed for {len(errors)} of {len(ranges)} "
+                f"segment ranges (finished ranges are checkpointed): {errors[0]}"
+            )
+            await self.job_store.fail(job_id, str(errors[0]))
+            raise TranslationError(error_msg) from errors[0]
+
+        await self.job_store.complete(job_id, content_key)
+        translations = [translation for start in sorted(done) for translation in done[start]]
+        return apply_translations(segments, [
+            translation
+            for segment, translation in zip(segments, translations, strict=True)
+            if segment.get('text', '').strip()
+        ])
+
+    def _pending_ranges(
+        self,
+        total: int,
+        done: Dict[int, List[Optional[str]]]
+    ) -> List[Tuple[int, int]]:
+        """计算尚无检查点的片段区间，按 chunk_size 切分."""
+        gaps = []
+        position = 0
+        for start in sorted(done):
+            if start > position:
+                gaps.append((position, start))
+            position = max(position, start + len(done[start]))
+        if position < total:
+            gaps.append((position, total))
+
+        return [
+            (chunk_start, min(chunk_start + self.chunk_size, gap_end))
+            for gap_start, gap_end in gaps
+            for chunk_start in range(gap_start, gap_end, self.chunk_size)
+        ]
+
+    async def _translate_chunk(
+        self,
+        segments: List[Dict[str, Any]],
+        target_lang: str
+    ) -> Tuple[List[Optional[str]], bool]:
+        """翻译一个批次的字幕片段.
+
+        从当前服务开始，未翻译成功的条目依次交给下一个可用服务。
 
-            raise TranslationError("All translation services failed for segment translation")
+        Returns:
+            (每个片段的译文, 是否所有条目都已翻译)；空白片段和未翻译的条目为 None
+
+        Raises:
+            TranslationError: 没有任何条目翻译成功
+        """
+        texts = [
+            segment.get('text', '')
+            for segment in segments
+            if segment.get('text', '').strip()
+        ]
+        translations: List[Optional[str]] = [None] * len(texts)
+        if not texts:
+            return [None] * len(segments), True
+
+        pending = list(range(len(texts)))
+        last_error: Optional[Exception] = None
+
+        for service_index, service in self._available_services():
+            breaker = self.breakers[service_index]
+            try:
+                results = await service.translate_batch([texts[i] for i in pending], target_lang)
+            except TranslationError as e:
+                last_error = e
+                breaker.record_failure()
+                continue
+
+            if len(results) != len(pending):
+                # 结果条数不符时无法确定对应关系，整批作废并记为失败
+                last_error = TranslationError(
+                    f"{type(service).__name__} returned {len(results)} results for {len(pending)} lines"
+                )
+                breaker.record_failure()
+                continue
+
+            for i, result in zip(pending, results, strict=True):
+                translations[i] = result
+            remaining = [i for i in pending if translations[i] is None]
+
+            # 只要译出了内容就视为服务可用；一条都没译出记为失败
+            if len(remaining) < len(pending):
+                breaker.record_success()
+                self.current_service_index = service_index
+            else:
+                breaker.record_failure()
+                last_error = TranslationError(
+                    f"{type(service).__name__} translated none of {len(pending)} lines"
+                )
+
+            pending = remaining
+            if not pending:
+                break
+
+        if pending and len(pending) == len(texts):
+            raise TranslationError(
+                f"All translation services failed for segment translation. Last error: {last_error}"
+            )
+        if pending:
+            logger.warning(f"{len(pending)} of {len(texts)} lines could not be translated")
+
+        translations_iter = iter(translations)
+        segment_translations = [
+            next(translations_iter) if segment.get('text', '').strip() else None
+            for segment in segments
+        ]
+        return segment_translations, not pending
 
     def get_service_status(self) -> Dict[str, Any]:
         """获取服务状态信息."""
+        failed_services = self.failed_services
         return {
             'total_services': len(self.services),
             'current_service_index': self.current_service_index,
-            'failed_services': list(self.failed_services),
-            'available_services': len(self.services) - len(self.failed_services)
+            'failed_services': failed_services,
+            'available_services': len(self.services) - len(failed_services),
+            'max_concurrency': self.max_concurrency,
+            'circuit_breakers': [breaker.get_stats() for breaker in self.breakers],
+            'rate_limiters': [
+                service.rate_limiter.get_stats() if service.rate_limiter else None
+                for service in self.services
+            ]
         }
 
     def reset_failed_services(self) -> None:
-        """重置失败服务列表（用于重试）."""
-        self.failed_services.clear()
\ No newline at end of file
+        """重置所有熔断器（用于立即重试）."""
+        for breaker in self.breakers:
+            breaker.reset()
@@ -0,0 +1,193 @@
+"""Shared video information cache.
+
+Caches the result of ``YouTubeService.get_video_info`` keyed by YouTube video
+ID. Entries live in memory and in SQLite so they survive restarts, and
+concurrent lookups for the same ID share a single in-flight probe.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from ytb_dual_subtitles.core.settings import get_settings
+from ytb_dual_subtitles.database.models import DatabaseManager, get_database_manager
+from ytb_dual_subtitles.database.video_info_dao import VideoInfoDAO
+
+logger = logging.getLogger(__name__)
+
+
+class VideoInfoCache:
+    """TTL cache for video information with single-flight lookups."""
+
+    def __init__(
+        self,
+        db_manager: DatabaseManager,
+        ttl: float = 24 * 3600,
+        max_memory_entries: int = 1024
+    ) -> None:
+        """Initialize video info cache.
+
+        Args:
+            db_manager: Database manager used for persistence
+            ttl: Entry time-to-live in seconds (0 disables caching)
+            max_memory_entries: Maximum number of entries kept in memory
+        """
+        self._db_manager = db_manager
+        self._dao = VideoInfoDAO(db_manager)
+        self.ttl = ttl
+        self.max_memory_entries = max_memory_entries
+
+        self._memory: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[dict[str, Any]]] = {}
+        self._stats = {'memory_hits': 0, 'db_hits': 0, 'misses': 0, 'coalesced': 0}
+
+    async def get(self, video_id: str) -> dict[str, Any] | None:
+        """Get cached video info from memory or SQLite.
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            Copy of the cached info or None if missing or expired
+        """
+        if self.ttl <= 0:
+            return None
+
+        now = time.time()
+        entry = self._memory.get(video_id)
+        if entry is not None:
+            fetched_at, info = entry
+            if now - fetched_at < self.ttl:
+                self._memory.move_to_end(video_id)
+                self._stats['memory_hits'] += 1
+                return dict(info)
+            del self._memory[video_id]
+
+        try:
+            stored = await self._db_manager.run(self._dao.get_info, video_id, self.ttl)
+        except Exception as e:
+            logger.warning(f"Failed to read video info cache for {video_id}: {e}")
+            stored = None
+
+        if stored is None:
+            return None
+
+        fetched_at, info = stored
+        self._remember(video_id, fetched_at, info)
+        self._stats['db_hits'] += 1
+        return dict(info)
+
+    async def put(self, video_id: str, info: dict[str, Any]) -> None:
+        """Store video info in memory and SQLite.
+
+        Args:
+            video_id: YouTube video ID
+            info: Video info dictionary
+        """
+        if self.ttl <= 0:
+            return
+
+        fetched_at = time.time()
+        self._remember(video_id, fetched_at, dict(info))
+        try:
+            await self._db_manager.run(self._dao.save_info, video_id, info, fetched_at)
+        except Exception as e:
+            logger.warning(f"Failed to persist video info for {video_id}: {e}")
+
+    async def invalidate(self, video_id: str) -> None:
+        """Drop a cached entry.
+
+        Args:
+            video_id: YouTube video ID
+        """
+        self._memory.pop(video_id, None)
+        try:
+            await self._db_manager.run(self._dao.delete_info, video_id)
+        except Exception as e:
+            logger.warning(f"Failed to invalidate video info for {video_id}: {e}")
+
+    async def get_or_fetch(
+        self,
+        video_id: str,
+        fetch: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> dict[str, Any]:
+        """Get cached video info, fetching it at most once per video ID.
+
+        Concurrent callers asking for the same uncached ID wait on the same
+        in-flight fetch instead of starting their own.
+
+        Args:
+            video_id: YouTube video ID
+            fetch: Coroutine factory performing the actual probe
+
+        Returns:
+            Copy of the video info dictionary
+
+        Raises:
+            Exception: Whatever the fetch raised (errors are not cached)
+        """
+        cached = await self.get(video_id)
+        if cached is not None:
+            return cached
+
+        task = self._inflight.get(video_id)
+        if task is None:
+            self._stats['misses'] += 1
+            task = asyncio.create_task(self._fetch_and_store(video_id, fetch))
+            self._inflight[video_id] = task
+            task.add_done_callback(lambda _t, vid=video_id: self._inflight.pop(vid, None))
+        else:
+            self._stats['coalesced'] += 1
+
+        # Shield so a cancelled caller does not abort the probe other callers wait on
+        info = await asyncio.shield(task)
+        return dict(info)
+
+    async def _fetch_and_store(
+        self,
+        video_id: str,
+        fetch: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> dict[str, Any]:
+        """Run the fetch and cache its result."""
+        info = await fetch()
+        await self.put(video_id, info)
+        return info
+
+    def _remember(self, video_id: str, fetched_at: float, info: dict[str, Any]) -> None:
+        """Insert an entry into the in-memory LRU."""
+        self._memory[video_id] = (fetched_at, info)
+        self._memory.move_to_end(video_id)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            **self._stats,
+            'memory_entries': len(self._memory),
+            'inflight': len(self._inflight),
+            'ttl': self.ttl,
+        }
+
+
+# Global cache instance shared by all YouTubeService instances
+_video_info_cache: VideoInfoCache | None = None
+
+
+def get_video_info_cache() -> VideoInfoCache:
+    """Get the global video info cache instance."""
+    global _video_info_cache
+
+    if _video_info_cache is None:
+        settings = get_settings()
+        _video_info_cache = VideoInfoCache(
+            get_database_manager(),
+            ttl=settings.video_info_cache_ttl
+        )
+
+    return _video_info_cache
@@ -9,111 +9,148 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+import threading
+import time
+from collections import OrderedDict
 from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from urllib.parse import parse_qs, urlparse
 
 import yt_dlp
 
 from ytb_dual_subtitles.exceptions.download_errors import VideoNotFoundError
+from ytb_dual_subtitles.services.cookie_provider import get_cookie_provider
+from ytb_dual_subtitles.services.video_info_cache import VideoInfoCache, get_video_info_cache
 
 logger = logging.getLogger(__name__)
 
+# Raw probe results are only reused for a short time: format URLs expire
+PROBE_REUSE_SECONDS = 30 * 60
+PROBE_REUSE_MAX_ENTRIES = 32
+
+# YouTube video IDs are 11 URL-safe base64 characters
+VIDEO_ID_PATTERN = re.compile(r"^[a-zA-Z0-9_-]{11}$")
+
+# yt-dlp error fragments meaning YouTube did not accept our cookies
+AUTH_ERROR_MARKERS = (
+    'sign in to confirm',
+    'not a bot',
+    'login required',
+    'cookies are no longer valid',
+    'use --cookies',
+)
+
+
+class _RecentProbes:
+    """Small bounded store of raw yt-dlp probe results awaiting download."""
+
+    def __init__(self, max_age: float, max_entries: int) -> None:
+        self.max_age = max_age
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def put(self, video_id: str, info: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[video_id] = (time.monotonic(), info)
+            self._entries.move_to_end(video_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def take(self, video_id: str) -> dict[str, Any] | None:
+        """Remove and return a probe result if it is still fresh."""
+        with self._lock:
+            entry = self._entries.pop(video_id, None)
+        if entry is None or time.monotonic() - entry[0] > self.max_age:
+            return None
+        return entry[1]
+
+
+_recent_probes = _RecentProbes(PROBE_REUSE_SECONDS, PROBE_REUSE_MAX_ENTRIES)
+
+# Dedicated executor so metadata probes have their own concurrency limit
+_probe_executor: ThreadPoolExecutor | None = None
+
+
+def _get_probe_executor() -> ThreadPoolExecutor:
+    """Get the bounded executor used for yt-dlp metadata probes."""
+    global _probe_executor
+
+    if _probe_executor is None:
+        from ytb_dual_subtitles.core.settings import get_settings
+
+        _probe_executor = ThreadPoolExecutor(
+            max_workers=get_settings().yt_dlp_probe_concurrency,
+            thread_name_prefix="yt-dlp-probe",
+        )
+
+    return _probe_executor
+
 
 class YouTubeService:
     """Service for YouTube video operations."""
 
-    def __init__(self, browser_for_cookies: str = "chrome", browser_profile: str | None = None) -> None:
+    def __init__(
+        self,
+        browser_for_cookies: str = "chrome",
+        browser_profile: str | None = None,
+        video_info_cache: VideoInfoCache | None = None
+    ) -> None:
         """Initialize YouTube service.
 
         Args:
             browser_for_cookies: Browser to extract cookies from (chrome, firefox, safari, edge)
             browser_profile: Browser profile name (e.g., 'Default', 'Profile 1'). If None, uses default profile.
+            video_info_cache: Cache for video info probes. If None, uses the shared global cache.
         """
         # YouTube URL patterns
         self._youtube_patterns = [
             re.compile(r"^https?://(www\.|m\.)?youtube\.com/watch\?v=([a-zA-Z0-9_-]+)"),
             re.compile(r"^https?://(www\.)?youtu\.be/([a-zA-Z0-9_-]+)"),
         ]
+        # Playlist and channel URL patterns (expanded into their videos)
+        self._playlist_pattern = re.compile(
+            r"^https?://(www\.|m\.)?youtube\.com/playlist\?(.*&)?list=[a-zA-Z0-9_-]+"
+        )
+        self._channel_pattern = re.compile(
+            r"^https?://(www\.|m\.)?youtube\.com/(@[^/?#]+|channel/[^/?#]+|c/[^/?#]+|user/[^/?#]+)(/[^?#]*)?"
+        )
 
         self.browser_for_cookies = browser_for_cookies
         self.browser_profile = browser_profile
+        self._video_info_cache = video_info_cache or get_video_info_cache()
+        self._cookie_provider = get_cookie_provider(browser_for_cookies, browser_profile)
 
     def _get_cookies_config(self) -> dict[str, Any]:
-        """Get cookies configuration, trying multiple browsers if needed.
+        """Get cookies configuration from the shared cookie provider.
+
+        Browser cookies are resolved and exported once; later calls reuse the
+        exported cookie file until the browser's cookie store changes.
 
         Returns:
-            Dictionary with cookies configuration. Returns empty dict if all attempts fail.
+            Dictionary with cookies configuration. Returns empty dict if no cookies are available.
         """
-        logger.info("Attempting to extract cookies from browser for YouTube authentication...")
-
-        # If browser profile is specified, use it directly
-        if self.browser_profile:
-            # Format: browser:profile (e.g., "chrome:Default")
-            browser_spec = (self.browser_for_cookies, self.browser_profile)
-            logger.info(f"Trying to extract cookies from {self.browser_for_cookies} with profile '{self.browser_profile}'...")
-
-            try:
-                # Test if cookies can be extracted with this profile
-                test_opts = {
-                    'cookiesfrombrowser': browser_spec,
-                    'quiet': True,
-                    'no_warnings': True,
-                    'extract_flat': True,
-                }
-                with yt_dlp.YoutubeDL(test_opts) as ydl:
-                    # If no exception is raised, we can use this browser profile
-                    logger.info(f"✅ Successfully loaded cookies from {self.browser_for_cookies}:{self.browser_profile}")
-                    return {'cookiesfrombrowser': browser_spec}
-            except Exception as e:
-                logger.warning(f"Failed to load cookies from {self.browser_for_cookies}:{self.browser_profile}: {type(e).__name__}: {str(e)}")
-
-        # Try different browsers in order of preference (without profile)
-        browsers_to_try = [self.browser_for_cookies, 'chrome', 'firefox', 'safari', 'edge']
-        # Remove duplicates while preserving order
-        seen = set()
-        browsers_to_try = [x for x in browsers_to_try if not (x in seen or seen.add(x))]
-
-        logger.info(f"Trying to extract cookies from browsers: {', '.join(browsers_to_try)}")
-
-        for browser in browsers_to_try:
-            try:
-                logger.debug(f"  Attempting to extract cookies from {browser}...")
-                # Test if cookies can be extracted from this browser
-                test_opts = {
-                    'cookiesfrombrowser': (browser,),
-                    'quiet': True,
-                    'no_warnings': True,
-                    'extract_flat': True,
-                }
-                with yt_dlp.YoutubeDL(test_opts) as ydl:
-                    # If no exception is raised, we can use this browser
-                    logger.info(f"✅ Successfully loaded cookies from {browser}")
-                    return {'cookiesfrombrowser': (browser,)}
-            except Exception as e:
-                logger.debug(f"  ❌ Failed to extract cookies from {browser}: {type(e).__name__}: {str(e)}")
-                continue
+        return self._cookie_provider.get_ydl_opts()
 
-        # Fallback: no cookies available
-        logger.error("=" * 80)
-        logger.error("❌ CRITICAL: Could not extract cookies from any browser!")
-        logger.error("=" * 80)
-        logger.error("This may cause subtitle downloads to fail due to YouTube's anti-bot protection.")
-        logger.error("Tried browsers: %s", ', '.join(browsers_to_try))
-        logger.error("")
-        logger.error("To fix this issue:")
-        logger.error("1. Ensure at least one of these browsers is installed: Chrome, Firefox, Safari, Edge")
-        logger.error("2. Log in to YouTube in your browser")
-        logger.error("3. Close and restart the browser to ensure cookies are saved")
-        logger.error("4. If using Chrome, check your profile name at chrome://version/")
-        logger.error("   and update YTB_BROWSER_PROFILE in .env if needed")
-        logger.error("=" * 80)
-
-        return {}
+    def _check_auth_error(self, message: str) -> None:
+        """Invalidate exported cookies if an error indicates rejected authentication.
+
+        Args:
+            message: yt-dlp error message
+        """
+        message = message.lower()
+        if any(marker in message for marker in AUTH_ERROR_MARKERS):
+            logger.warning("YouTube rejected the current cookies, re-exporting them on next request")
+            self._cookie_provider.invalidate()
 
     def _get_base_ydl_opts(self) -> dict[str, Any]:
         """Get base yt-dlp options with anti-detection settings.
 
+        Blocking: the cookie provider may export and decrypt browser cookies,
+        so only call this from worker threads (probe, flat extraction and
+        download functions), never on the event loop.
+
         Returns:
             Dictionary of yt-dlp options
         """
@@ -171,6 +208,98 @@ class YouTubeService:
 
         return False
 
+    def is_collection_url(self, url: str) -> bool:
+        """Check if the URL is a YouTube playlist or channel URL.
+
+        Args:
+            url: The URL to check
+
+        Returns:
+            True if URL points to a playlist or channel, False otherwise
+        """
+        if not url or not isinstance(url, str):
+            return False
+
+        url = url.strip()
+        return bool(self._playlist_pattern.match(url) or self._channel_pattern.match(url))
+
+    async def extract_collection_video_ids(self, url: str) -> list[str]:
+        """List the video IDs of a playlist or channel.
+
+        Uses a single flat yt-dlp extraction on the probe executor, so the
+        individual videos are not probed. Channel URLs without a tab are
+        expanded to their videos tab.
+
+        Args:
+            url: YouTube playlist or channel URL
+
+        Returns:
+            Video IDs in playlist order, without duplicates
+
+        Raises:
+            ValueError: If URL is not a playlist or channel URL
+            VideoNotFoundError: If the playlist or channel cannot be extracted
+        """
+        if not self.is_collection_url(url):
+            raise ValueError("Invalid YouTube playlist or channel URL")
+
+        url = url.strip()
+        channel_match = self._channel_pattern.match(url)
+        if channel_match and not (channel_match.group(3) or '').strip('/'):
+            url = f"{channel_match.group(0).rstrip('/')}/videos"
+
+        loop = asyncio.get_running_loop()
+        try:
+            info = await loop.run_in_executor(_get_probe_executor(), self._extract_flat_sync, url)
+        except yt_dlp.DownloadError as e:
+            self._check_auth_error(str(e))
+            raise VideoNotFoundError(f"Playlist {url} not found: {e}") from e
+        except Exception as e:
+            raise VideoNotFoundError(f"Failed to list videos of {url}: {e}") from e
+
+        if not info:
+            raise VideoNotFoundError(f"Failed to list videos of {url}: empty result")
+
+        video_ids: dict[str, None] = {}
+        self._collect_entry_ids(info, video_ids)
+        return list(video_ids)
+
+    def _extract_flat_sync(self, url: str) -> dict[str, Any]:
+        """Extract playlist entries without resolving them (runs in the probe executor).
+
+        Args:
+            url: YouTube playlist or channel URL
+
+        Returns:
+            yt-dlp playlist info dictionary with flat entries
+        """
+        ydl_opts = self._get_base_ydl_opts()
+        ydl_opts.update({
+            "extract_flat": "in_playlist",
+            "noplaylist": False,
+            "ignoreerrors": True,
+        })
+
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            return ydl.extract_info(url, download=False)
+
+    def _collect_entry_ids(self, info: dict[str, Any], video_ids: dict[str, None]) -> None:
+        """Collect video IDs from flat playlist entries, including nested playlists.
+
+        Args:
+            info: yt-dlp playlist or entry info
+            video_ids: Ordered set receiving the video IDs
+        """
+        for entry in info.get("entries") or []:
+            if not entry:
+                continue
+            if entry.get("entries"):
+                self._collect_entry_ids(entry, video_ids)
+                continue
+            video_id = entry.get("id")
+            if entry.get("ie_key", "Youtube") == "Youtube" and video_id and VIDEO_ID_PATTERN.match(video_id):
+                video_ids[video_id] = None
+
     def extract_video_id(self, url: str) -> str:
         """Extract video ID from YouTube URL.
 
@@ -246,43 +375,112 @@ class YouTubeService:
     async def get_video_info(self, video_id: str) -> dict[str, Any]:
         """Get video information from YouTube.
 
+        Results are served from the shared video info cache; concurrent calls
+        for the same uncached video share one yt-dlp probe.
+
+        Args:
+            video_id: YouTube video ID
+
+        Returns:
+            Dictionary containing video information
+
+        Raises:
+            VideoNotFoundError: If video is not found or unavailable
+        """
+        return await self._video_info_cache.get_or_fetch(
+            video_id, lambda: self._fetch_video_info(video_id)
+        )
+
+    async def _fetch_video_info(self, video_id: str) -> dict[str, Any]:
+        """Probe YouTube for video information with yt-dlp.
+
         Args:
             video_id: YouTube video ID
 
         Returns:
             Dictionary containing video information
 
+        Raises:
+            VideoNotFoundError: If video is not found or unavailable
+        """
+        info = await self.probe_video(video_id)
+        return self._summarize_video_info(info, video_id)
+
+    async def probe_video(self, video_id: str, keep_for_download: bool = True) -> dict[str, Any]:
+        """Run a yt-dlp metadata probe on the bounded probe executor.
+
+        The probe runs the extractor without format selection. The raw info
+        dict is kept for a short time so that a following download can be
+        processed from it instead of extracting the video again.
+
+        Args:
+            video_id: YouTube video ID
+            keep_for_download: Keep the raw info for reuse by download_video
+
+        Returns:
+            Raw (unprocessed) yt-dlp info dictionary
+
         Raises:
             VideoNotFoundError: If video is not found or unavailable
         """
         url = f"https://www.youtube.com/watch?v={video_id}"
+        loop = asyncio.get_running_loop()
 
         try:
-            # Configure yt-dlp for info extraction only
-            ydl_opts = self._get_base_ydl_opts()
-            ydl_opts.update({
-                "extract_flat": False,
-            })
-
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-
-                # Extract relevant information
-                return {
-                    "id": info.get("id", video_id),
-                    "title": info.get("title", "Unknown Title"),
-                    "duration": info.get("duration", 0),
-                    "uploader": info.get("uploader", "Unknown"),
-                    "upload_date": info.get("upload_date"),
-                    "view_count": info.get("view_count", 0),
-                    "description": info.get("description", ""),
-                }
-
+            info = await loop.run_in_executor(_get_probe_executor(), self._probe_sync, url)
         except yt_dlp.DownloadError as e:
+            self._check_auth_error(str(e))
             raise VideoNotFoundError(f"Video {video_id} not found: {e}") from e
         except Exception as e:
             raise VideoNotFoundError(f"Failed to get video info for {video_id}: {e}") from e
 
+        if not info:
+            raise VideoNotFoundError(f"Failed to get video info for {video_id}: empty result")
+
+        if keep_for_download:
+            _recent_probes.put(video_id, info)
+        return info
+
+    def _probe_sync(self, url: str) -> dict[str, Any]:
+        """Extract raw video info synchronously (runs in the probe executor).
+
+        Args:
+            url: YouTube video URL
+
+        Returns:
+            Raw yt-dlp info dictionary
+        """
+        ydl_opts = self._get_base_ydl_opts()
+        ydl_opts.update({
+            "extract_flat": False,
+            "noplaylist": True,
+        })
+
+        with yt_dlp.YoutubeDL(ydl_opts) as ydl:
+            # process=False skips format selection; the download step does it
+            # with its own options when it processes this info dict
+            return ydl.extract_info(url, download=False, process=False)
+
+    def _summarize_video_info(self, info: dict[str, Any], video_id: str) -> dict[str, Any]:
+        """Extract the relevant fields from a yt-dlp info dictionary.
+
+        Args:
+            info: yt-dlp info dictionary
+            video_id: YouTube video ID used as fallback
+
+        Returns:
+            Dictionary containing video information
+        """
+        return {
+            "id": info.get("id", video_id),
+            "title": info.get("title", "Unknown Title"),
+            "duration": info.get("duration", 0),
+            "uploader": info.get("uploader", "Unknown"),
+            "upload_date": info.get("upload_date"),
+            "view_count": info.get("view_count", 0),
+            "description": info.get("description", ""),
+        }
+
     def sanitize_filename(self, title: str, max_length: int = 200) -> str:
         """Sanitize video title for safe filename use.
 
@@ -390,47 +588,36 @@ class YouTubeService:
 
         return status_mapping.get(yt_dlp_status, 'unknown')
 
-    async def download_video(self, url: str, task_id: str, output_path: str | None = None) -> str:
-        """Download video using yt-dlp.
+    def _build_download_opts(
+        self,
+        output_template: str,
+        task_id: str,
+        progress_callback: Callable[[dict[str, Any]], None] | None
+    ) -> dict[str, Any]:
+        """Build the yt-dlp options of a video download.
+
+        Blocking (cookies may be exported from the browser), so it runs in
+        the download worker thread, not on the event loop.
 
         Args:
-            url: YouTube video URL
+            output_template: Output path without extension
             task_id: Task identifier for progress tracking
-            output_path: Optional custom output path
+            progress_callback: Optional progress callback
 
         Returns:
-            Path to downloaded video file
+            Dictionary of yt-dlp options
         """
-        if not self.validate_youtube_url(url):
-            raise ValueError("Invalid YouTube URL")
-
-        # Import here to avoid circular imports
         from ytb_dual_subtitles.core.settings import get_settings
 
-        settings = get_settings()
-
-        # Generate output filename
-        if output_path:
-            output_file = output_path
-        else:
-            filename = self.generate_filename_from_url(url)
-            output_file = str(settings.download_path / filename)
-
-        # For yt-dlp to correctly name subtitle files, we need to provide
-        # the output template without extension, so it can add .en.vtt, .zh-CN.vtt, etc.
-        from pathlib import Path
-        output_path_obj = Path(output_file)
-        output_template = str(output_path_obj.parent / output_path_obj.stem)
-
         # Configure yt-dlp options from settings
-        yt_dlp_opts = settings.get_yt_dlp_opts()
+        yt_dlp_opts = get_settings().get_yt_dlp_opts()
 
         # Configure yt-dlp options
         ydl_opts = self._get_base_ydl_opts()
 
         # Log cookie configuration status
-        if 'cookiesfrombrowser' in ydl_opts:
-            logger.info(f"✅ Cookie配置已加载: {ydl_opts['cookiesfrombrowser']}")
+        if 'cookiefile' in ydl_opts:
+            logger.info(f"✅ Cookie配置已加载: {ydl_opts['cookiefile']}")
         else:
             logger.warning("⚠️ 没有cookie配置！字幕下载可能会失败")
 
@@ -461,20 +648,71 @@ class YouTubeService:
         if 'format' in yt_dlp_opts and yt_dlp_opts['format']:
             ydl_opts['format'] = yt_dlp_opts['format']
 
+        if progress_callback is not None:
+            ydl_opts['progress_hooks'] = [self.create_progress_hook(task_id, progress_callback)]
+
         # Log subtitle configuration
         logger.info(f"字幕下载配置: writesubtitles={ydl_opts.get('writesubtitles')}, "
                    f"writeautomaticsub={ydl_opts.get('writeautomaticsub')}, "
                    f"subtitleslangs={ydl_opts.get('subtitleslangs')}")
 
+        return ydl_opts
+
+    async def download_video(
+        self,
+        url: str,
+        task_id: str,
+        output_path: str | None = None,
+        progress_callback: Callable[[dict[str, Any]], None] | None = None
+    ) -> str:
+        """Download video using yt-dlp.
+
+        Args:
+            url: YouTube video URL
+            task_id: Task identifier for progress tracking
+            output_path: Optional custom output path
+            progress_callback: Optional callback receiving progress updates from
+                the yt-dlp worker thread (see create_progress_hook)
+
+        Returns:
+            Path to downloaded video file
+        """
+        if not self.validate_youtube_url(url):
+            raise ValueError("Invalid YouTube URL")
+
+        # Import here to avoid circular imports
+        from ytb_dual_subtitles.core.settings import get_settings
+
+        settings = get_settings()
+
+        # Generate output filename
+        if output_path:
+            output_file = output_path
+        else:
+            filename = self.generate_filename_from_url(url)
+            output_file = str(settings.download_path / filename)
+
+        # For yt-dlp to correctly name subtitle files, we need to provide
+        # the output template without extension, so it can add .en.vtt, .zh-CN.vtt, etc.
+        from pathlib import Path
+        output_path_obj = Path(output_file)
+        output_template = str(output_path_obj.parent / output_path_obj.stem)
+
         try:
+            # Reuse the info dict from a recent probe (e.g. the one made when the
+            # task was created); only probe again if it is missing or stale
+            video_id = self.extract_video_id(url)
+            info = _recent_probes.take(video_id)
+            if info is None:
+                info = await self.probe_video(video_id, keep_for_download=False)
+                await self._video_info_cache.put(video_id, self._summarize_video_info(info, video_id))
+
             # Use asyncio to run yt-dlp in a thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
 
             def download_sync():
+                ydl_opts = self._build_download_opts(output_template, task_id, progress_callback)
                 with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                    # First, check if video has any downloadable formats
-                    info = ydl.extract_info(url, download=False)
-
                     # Check if there are any actual video formats available
                     formats = info.get('formats', [])
                     video_formats = [f for f in formats if f.get('vcodec') != 'none' and f.get('vcodec') != 'images']
@@ -482,6 +720,7 @@ class YouTubeService:
                     if not video_formats:
                         error_msg = "No video formats available for this video. "
                         if info.get('availability') == 'needs_auth':
+                            self._cookie_provider.invalidate()
                             error_msg += "This video requires authentication (login). Please make sure you're logged into YouTube in your browser."
                         elif info.get('live_status') == 'is_upcoming':
                             error_msg += "This is an upcoming live stream that hasn't started yet."
@@ -493,8 +732,8 @@ class YouTubeService:
                             error_msg += "The video may be region-locked, private, or deleted."
                         raise VideoNotFoundError(error_msg)
 
-                    # Proceed with download
-                    ydl.download([url])
+                    # Proceed with download, selecting formats from the probed info
+                    ydl.process_ie_result(info, download=True)
 
                     # FORCE subtitle download if not downloaded
                     from pathlib import Path
@@ -514,7 +753,7 @@ class YouTubeService:
                             'subtitlesformat': 'vtt',
                             'convert_subs': 'vtt',
                             'outtmpl': output_template,
-                            'cookiesfrombrowser': ydl_opts.get('cookiesfrombrowser'),
+                            'cookiefile': ydl_opts.get('cookiefile'),
                             'quiet': False,
                         }
 
@@ -558,6 +797,7 @@ class YouTubeService:
             # Re-raise our custom errors with clear messages
             raise
         except yt_dlp.DownloadError as e:
+            self._check_auth_error(str(e))
             error_str = str(e).lower()
             if 'requested format is not available' in error_str:
                 raise VideoNotFoundError(
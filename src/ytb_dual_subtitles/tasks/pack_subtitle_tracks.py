@@ -0,0 +1,94 @@
+"""Migrate subtitle tracks between row storage and the packed format.
+
+Usage:
+    python -m ytb_dual_subtitles.tasks.pack_subtitle_tracks [--unpack] [--video-id ID]
+
+Packing replaces a track's subtitle_segments rows with one
+packed_subtitle_tracks row; --unpack reverses it. Each track is migrated in
+its own transaction, and the dual track of every affected video is rebuilt
+afterwards because packed cues are identified by sequence instead of row ID.
+The rebuild bumps the videos' content versions, so HTTP caches revalidate.
+
+This runs in its own process and cannot reach a running server's in-memory
+player index (services.subtitle_index_cache). Packing does not change cue
+times or text, so the server keeps answering correctly; restart it to make
+the player report the new segment IDs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+
+from sqlalchemy import select
+
+from ytb_dual_subtitles.core.database import (
+    close_database,
+    get_session_factory,
+    init_database,
+)
+from ytb_dual_subtitles.database.models import get_database_manager
+from ytb_dual_subtitles.models.video import Subtitle
+from ytb_dual_subtitles.services.subtitle_data_service import SubtitleDataService
+
+logger = logging.getLogger(__name__)
+
+
+async def migrate_subtitle_tracks(unpack: bool = False, video_id: int | None = None) -> dict[str, int]:
+    """Pack (or unpack) subtitle tracks.
+
+    Args:
+        unpack: Move packed tracks back to segment rows instead
+        video_id: Only migrate the tracks of this video
+
+    Returns:
+        Number of tracks migrated and of videos whose dual track was rebuilt
+    """
+    session_factory = get_session_factory()
+    async with session_factory() as session:
+        query = select(Subtitle.id, Subtitle.video_id).order_by(Subtitle.id)
+        if video_id is not None:
+            query = query.where(Subtitle.video_id == video_id)
+        tracks = (await session.execute(query)).all()
+
+        service = SubtitleDataService(session)
+        migrate = service.unpack_subtitle_track if unpack else service.pack_subtitle_track
+
+        changed_videos: set[int] = set()
+        migrated = 0
+        for subtitle_id, track_video_id in tracks:
+            if await migrate(subtitle_id):
+                migrated += 1
+                changed_videos.add(track_video_id)
+
+        for changed_video_id in sorted(changed_videos):
+            await service.rebuild_dual_segments(changed_video_id)
+
+    logger.info(
+        f"{'Unpacked' if unpack else 'Packed'} {migrated} of {len(tracks)} subtitle tracks, "
+        f"rebuilt {len(changed_videos)} dual tracks"
+    )
+    return {"tracks": migrated, "videos": len(changed_videos)}
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--unpack", action="store_true", help="move packed tracks back to rows")
+    parser.add_argument("--video-id", type=int, help="only migrate this video's tracks")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    # Create the task store first so download_tasks keeps its own schema
+    get_database_manager()
+    await init_database()
+    try:
+        result = await migrate_subtitle_tracks(unpack=args.unpack, video_id=args.video_id)
+        print(f"Migrated {result['tracks']} subtitle tracks across {result['videos']} videos")
+    finally:
+        await close_database()
+        get_database_manager().close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,122 @@
+"""Circuit breaker for flaky external providers.
+
+Tracks the health of one provider. After ``failure_threshold`` consecutive
+failures the circuit opens and callers skip the provider instead of
+waiting on it. Once ``reset_timeout`` has passed the circuit is half-open:
+a single probe request is let through, and its outcome either closes the
+circuit again or re-opens it with a doubled timeout (up to
+``MAX_RESET_TIMEOUT``), so a provider that is down for a long time is
+probed less and less often, while a transient error no longer disables a
+provider for good.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any
+
+# Circuit states
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+# Longest time an open circuit waits before probing, in seconds
+MAX_RESET_TIMEOUT = 600.0
+
+
+class CircuitBreaker:
+    """Health state of one provider."""
+
+    def __init__(self, failure_threshold: int = 3, reset_timeout: float = 30.0) -> None:
+        """Initialize circuit breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            reset_timeout: Seconds an open circuit waits before the first probe
+        """
+        if failure_threshold < 1:
+            raise ValueError("failure_threshold must be at least 1")
+
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self._state = CLOSED
+        self._failures = 0
+        self._open_timeout = reset_timeout
+        self._opened_until = 0.0
+        self._probe_started: float | None = None
+        self._stats = {'opened': 0, 'probes': 0, 'rejected': 0}
+
+    @property
+    def state(self) -> str:
+        """Current state; an open circuit turns half-open once its timeout has passed."""
+        if self._state == OPEN and time.monotonic() >= self._opened_until:
+            self._state = HALF_OPEN
+            self._probe_started = None
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent to the provider now.
+
+        In the half-open state only one probe is allowed at a time; a probe
+        that never reported back (e.g. it was cancelled) is replaced after
+        ``reset_timeout``.
+
+        Returns:
+            True if the caller may use the provider; it must then report the
+            outcome with record_success or record_failure
+        """
+        state = self.state
+        if state == CLOSED:
+            return True
+
+        now = time.monotonic()
+        if state == HALF_OPEN and (
+            self._probe_started is None or now - self._probe_started >= self.reset_timeout
+        ):
+            self._probe_started = now
+            self._stats['probes'] += 1
+            return True
+
+        self._stats['rejected'] += 1
+        return False
+
+    def record_success(self) -> None:
+        """Report a successful request; closes the circuit."""
+        self._state = CLOSED
+        self._failures = 0
+        self._open_timeout = self.reset_timeout
+        self._probe_started = None
+
+    def record_failure(self) -> None:
+        """Report a failed request; opens the circuit when the provider looks down."""
+        self._failures += 1
+        state = self.state
+
+        if state == HALF_OPEN:
+            # The probe failed: stay away for longer before the next one
+            self._open_timeout = min(MAX_RESET_TIMEOUT, self._open_timeout * 2)
+            self._open()
+        elif state == CLOSED and self._failures >= self.failure_threshold:
+            self._open()
+
+    def reset(self) -> None:
+        """Close the circuit and forget past failures."""
+        self.record_success()
+
+    def _open(self) -> None:
+        """Open the circuit for the current timeout."""
+        self._state = OPEN
+        self._opened_until = time.monotonic() + self._open_timeout
+        self._probe_started = None
+        self._stats['opened'] += 1
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get circuit breaker statistics."""
+        state = self.state
+        return {
+            **self._stats,
+            'state': state,
+            'consecutive_failures': self._failures,
+            'retry_in': max(0.0, self._opened_until - time.monotonic()) if state == OPEN else 0.0,
+        }
@@ -0,0 +1,118 @@
+"""Time interval index for subtitle lookup.
+
+Answers "which cues are on screen at time t" without scanning every cue.
+Cues are sorted by start time, and their (tolerance-widened) start and end
+offsets are kept in flat ``array('d')`` buffers together with a running
+maximum of the end offsets:
+
+- a point query bisects the starts for the last cue that has begun and the
+  max-end prefix for the first cue that can still be running, so only that
+  narrow slice is checked: O(log n) plus the cues returned;
+- the cursor mode (``advance``) keeps both slice bounds between calls and
+  only moves them forward, which costs amortized O(1) per call while the
+  time keeps increasing, as it does during normal playback. ``seek``
+  repositions the cursor with a bisection after a jump.
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+
+
+class IntervalIndex:
+    """Read-only index of closed time intervals."""
+
+    __slots__ = ("_starts", "_ends", "_max_ends", "_order", "_lo", "_hi", "_cursor_time")
+
+    def __init__(self, intervals: Iterable[tuple[float, float]], tolerance: float = 0.0) -> None:
+        """Build the index.
+
+        Args:
+            intervals: (start_time, end_time) of each cue in seconds
+            tolerance: Each interval is widened by this many seconds on both sides
+        """
+        widened = [
+            (start - tolerance, end + tolerance, position)
+            for position, (start, end) in enumerate(intervals)
+        ]
+        widened.sort()
+
+        self._starts = array('d', (item[0] for item in widened))
+        self._ends = array('d', (item[1] for item in widened))
+        self._order = array('q', (item[2] for item in widened))
+
+        # _max_ends[i] is the latest end among the first i + 1 intervals; it
+        # never decreases, so it can be bisected
+        self._max_ends = array('d', self._ends)
+        for i in range(1, len(self._max_ends)):
+            if self._max_ends[i] < self._max_ends[i - 1]:
+                self._max_ends[i] = self._max_ends[i - 1]
+
+        self._lo = 0
+        self._hi = 0
+        self._cursor_time = float("-inf")
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    def query(self, time: float, margin: float = 0.0) -> list[int]:
+        """Find the intervals containing a point in time.
+
+        Args:
+            time: Time in seconds
+            margin: Extra widening in seconds on top of the build tolerance,
+                for callers whose tolerance can change after the index is built
+
+        Returns:
+            Positions (in input order) of the matching intervals, ascending
+        """
+        lo = bisect_left(self._max_ends, time - margin)
+        hi = bisect_right(self._starts, time + margin)
+        return self._collect(lo, hi, time - margin)
+
+    def seek(self, time: float) -> None:
+        """Move the cursor to a point in time, e.g. after the user seeks.
+
+        Args:
+            time: Time in seconds
+        """
+        self._lo = bisect_left(self._max_ends, time)
+        self._hi = bisect_right(self._starts, time)
+        self._cursor_time = time
+
+    def advance(self, time: float) -> list[int]:
+        """Find the intervals containing ``time`` by moving the cursor forward.
+
+        Meant for monotonically increasing times during playback. A time
+        before the cursor falls back to ``seek``.
+
+        Args:
+            time: Time in seconds
+
+        Returns:
+            Positions (in input order) of the matching intervals, ascending
+        """
+        if time < self._cursor_time:
+            self.seek(time)
+        else:
+            lo, hi = self._lo, self._hi
+            max_ends, starts = self._max_ends, self._starts
+            count = len(starts)
+            while lo < count and max_ends[lo] < time:
+                lo += 1
+            while hi < count and starts[hi] <= time:
+                hi += 1
+            self._lo, self._hi = lo, hi
+            self._cursor_time = time
+
+        return self._collect(self._lo, self._hi, time)
+
+    def _collect(self, lo: int, hi: int, time: float) -> list[int]:
+        """Return input positions of intervals in [lo, hi) still running at ``time``."""
+        ends, order = self._ends, self._order
+        matches = [order[i] for i in range(lo, hi) if ends[i] >= time]
+        if len(matches) > 1:
+            matches.sort()
+        return matches
@@ -0,0 +1,122 @@
+"""Packed (columnar) subtitle track format.
+
+A whole track is stored in four blobs instead of one row per cue:
+
+- start times and end times as little-endian float32 arrays;
+- the cue texts as one zlib-compressed UTF-8 blob;
+- a uint32 array of n + 1 byte offsets into the decompressed text.
+
+Loading a track is a few ``array.frombytes`` calls and one decompression,
+with no per-cue Python objects; a cue's text is decoded only when it is
+accessed. float32 keeps millisecond precision for about the first 2.3
+hours of a video and stays within 4 ms beyond that, and times are rounded
+to milliseconds on access.
+"""
+
+from __future__ import annotations
+
+import sys
+import zlib
+from array import array
+from collections.abc import Iterable, Iterator
+
+# zlib level for the text blob (level 6 is the usual size/speed balance)
+TEXT_COMPRESSION_LEVEL = 6
+
+_BIG_ENDIAN = sys.byteorder == "big"
+
+
+def _to_bytes(values: array) -> bytes:
+    """Serialize an array in little-endian order."""
+    if _BIG_ENDIAN:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_bytes(typecode: str, data: bytes) -> array:
+    """Deserialize a little-endian array."""
+    values = array(typecode)
+    values.frombytes(data)
+    if _BIG_ENDIAN:
+        values.byteswap()
+    return values
+
+
+def duration_sum(starts: bytes, ends: bytes) -> float:
+    """Total cue duration in seconds of stored start and end time blobs.
+
+    Reads only the time columns, without loading the track's texts.
+    """
+    return sum(_from_bytes('f', ends)) - sum(_from_bytes('f', starts))
+
+
+class PackedTrack:
+    """An in-memory subtitle track held in flat arrays."""
+
+    __slots__ = ("starts", "ends", "offsets", "text_data")
+
+    def __init__(self, starts: array, ends: array, offsets: array, text_data: bytes) -> None:
+        """Wrap already packed columns.
+
+        Args:
+            starts: float32 start times in seconds
+            ends: float32 end times in seconds
+            offsets: uint32 byte offsets of each text in ``text_data`` (n + 1 entries)
+            text_data: Concatenated UTF-8 cue texts
+        """
+        self.starts = starts
+        self.ends = ends
+        self.offsets = offsets
+        self.text_data = text_data
+
+    @classmethod
+    def pack(cls, segments: Iterable[tuple[float, float, str]]) -> PackedTrack:
+        """Pack cues given as (start_time, end_time, text), in sequence order."""
+        starts, ends, offsets = array('f'), array('f'), array('I', [0])
+        texts = bytearray()
+        for start, end, text in segments:
+            starts.append(start)
+            ends.append(end)
+            texts += text.encode("utf-8")
+            offsets.append(len(texts))
+        return cls(starts, ends, offsets, bytes(texts))
+
+    @classmethod
+    def from_blobs(cls, starts: bytes, ends: bytes, offsets: bytes, text_blob: bytes) -> PackedTrack:
+        """Load a track from its stored blobs."""
+        return cls(
+            _from_bytes('f', starts),
+            _from_bytes('f', ends),
+            _from_bytes('I', offsets),
+            zlib.decompress(text_blob),
+        )
+
+    def to_blobs(self) -> tuple[bytes, bytes, bytes, bytes]:
+        """Serialize to (starts, ends, offsets, compressed text) blobs."""
+        return (
+            _to_bytes(self.starts),
+            _to_bytes(self.ends),
+            _to_bytes(self.offsets),
+            zlib.compress(self.text_data, TEXT_COMPRESSION_LEVEL),
+        )
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def start(self, i: int) -> float:
+        """Start time of cue ``i`` in seconds."""
+        return round(self.starts[i], 3)
+
+    def end(self, i: int) -> float:
+        """End time of cue ``i`` in seconds."""
+        return round(self.ends[i], 3)
+
+    def text(self, i: int) -> str:
+        """Text of cue ``i``."""
+        return self.text_data[self.offsets[i]:self.offsets[i + 1]].decode("utf-8")
+
+    def __iter__(self) -> Iterator[tuple[float, float, str]]:
+        """Iterate over (start_time, end_time, text) in sequence order."""
+        for i in range(len(self.starts)):
+            yield self.start(i), self.end(i), self.text(i)
@@ -0,0 +1,85 @@
+"""Timeline alignment of two subtitle tracks.
+
+Pairs every cue of a primary track (e.g. English) with the cue of a
+secondary track (e.g. Chinese) that overlaps it most. Both tracks are swept
+once in start-time order while keeping a small window of secondary cues that
+can still overlap, so aligning n and m cues costs O(n + m) for ordinary
+subtitles instead of scanning the secondary track for every primary cue.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+
+def align_cues(
+    primary: Sequence[tuple[float, float]],
+    secondary: Sequence[tuple[float, float]],
+    tolerance: float = 0.0,
+    min_overlap_ratio: float | None = None
+) -> list[int | None]:
+    """Find the best overlapping secondary cue for each primary cue.
+
+    Cues match when their time ranges overlap after widening them by
+    ``tolerance``. Among the matches the one with the largest overlap wins
+    (earlier cue on ties).
+
+    Args:
+        primary: (start_time, end_time) of the primary cues
+        secondary: (start_time, end_time) of the secondary cues
+        tolerance: Timing tolerance in seconds
+        min_overlap_ratio: If set, a match must really overlap and cover
+            more than this share of the primary cue's duration
+
+    Returns:
+        Index into ``secondary`` (or None) for each primary cue, in the
+        order of ``primary``
+    """
+    matches: list[int | None] = [None] * len(primary)
+    if not primary or not secondary:
+        return matches
+
+    # Already sorted input (the usual case) sorts in linear time
+    primary_order = sorted(range(len(primary)), key=lambda i: primary[i][0])
+    secondary_order = sorted(range(len(secondary)), key=lambda i: secondary[i][0])
+
+    window: list[int] = []
+    next_secondary = 0
+
+    for i in primary_order:
+        start, end = primary[i]
+
+        # Admit secondary cues starting before this cue ends
+        while (next_secondary < len(secondary_order)
+               and secondary[secondary_order[next_secondary]][0] - tolerance <= end):
+            window.append(secondary_order[next_secondary])
+            next_secondary += 1
+
+        # Drop cues that ended before this one starts; later primary cues
+        # start even later, so they can never match them either
+        if window and any(secondary[k][1] < start - tolerance for k in window):
+            window = [k for k in window if secondary[k][1] >= start - tolerance]
+
+        duration = end - start
+        best: int | None = None
+        best_overlap = 0.0
+
+        for k in window:
+            other_start, other_end = secondary[k]
+            if other_start - tolerance > end:
+                # Admitted for an earlier, longer primary cue
+                continue
+
+            overlap = min(end, other_end) - max(start, other_start)
+            if min_overlap_ratio is not None:
+                ratio = overlap / duration if duration > 0 else 0.0
+                if overlap <= 0 or ratio <= min_overlap_ratio:
+                    continue
+
+            if best is None or overlap > best_overlap:
+                best = k
+                best_overlap = overlap
+
+        matches[i] = best
+
+    return matches
@@ -0,0 +1,293 @@
+"""Streaming WebVTT/SRT parser.
+
+One line-oriented parser for both formats: it reads a file handle (or any
+iterable of lines) and yields cues as soon as their block ends, so a large
+auto-caption file never has to be held in memory as a whole. Patterns are
+compiled once at import time.
+
+``parse_subtitle_file_async`` parses files off the event loop; large files
+go to a worker process so parsing cannot stall the API.
+
+``collapse_rolling_duplicates`` normalizes YouTube auto-captions, where each
+line is repeated in two or three consecutive cues while the text scrolls.
+It must only be applied to tracks ``is_auto_caption_track`` recognizes
+(from the inline word timings of the raw cue text): on manual captions a
+short line followed by one that starts with it ("No." / "No. I don't think
+so.") would lose words.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import html
+import re
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+# Files at least this large are parsed in a worker process
+PROCESS_PARSE_MIN_BYTES = 1024 * 1024
+
+# Worker processes used for large subtitle files
+PARSER_PROCESSES = 2
+
+# "00:01:02.500 --> 00:01:04.000 align:start" (VTT) or "00:01:02,500 --> 00:01:04,000" (SRT)
+_TIMING_RE = re.compile(r"^\s*(\S+)\s+-->\s+(\S+)")
+# [[HH:]MM:]SS[.,mmm]
+_TIMESTAMP_RE = re.compile(r"^(?:(?:(\d+):)?(\d+):)?(\d+)(?:[.,](\d{1,3}))?$")
+# Markup such as <c>, </c>, <i>, <v Speaker> and inline <00:00:01.000> word timings
+_TAG_RE = re.compile(r"<[^>]*>")
+# Inline word timings and <c> spans, only written by YouTube auto-captions
+_AUTO_CAPTION_RE = re.compile(r"<(?:\d+:)?\d{2}:\d{2}\.\d{3}>|<c[.>]")
+
+# VTT blocks that carry no cues
+_SKIPPED_BLOCKS = ("WEBVTT", "NOTE", "STYLE", "REGION")
+
+# Largest gap (seconds) between a cue and the next one repeating its text
+ROLLING_MAX_GAP = 1.0
+
+
+@dataclass(slots=True)
+class SubtitleCue:
+    """A single subtitle cue."""
+
+    start: float
+    end: float
+    text: str
+    # Raw text carried auto-caption word timings (see is_auto_caption_track)
+    auto_caption: bool = False
+
+
+def parse_timestamp(value: str) -> float:
+    """Convert a VTT or SRT timestamp to seconds.
+
+    Args:
+        value: Timestamp such as "01:02:03.456", "02:03,456" or "03.456"
+
+    Returns:
+        Time in seconds
+
+    Raises:
+        ValueError: If the timestamp is malformed
+    """
+    match = _TIMESTAMP_RE.match(value)
+    if match is None:
+        raise ValueError(f"Invalid subtitle timestamp: {value}")
+
+    hours, minutes, seconds, fraction = match.groups()
+    total = int(seconds)
+    if minutes:
+        total += int(minutes) * 60
+    if hours:
+        total += int(hours) * 3600
+    if fraction:
+        # "5" means 500 ms, as in the original millisecond padding
+        return total + int(fraction.ljust(3, "0")) / 1000
+    return float(total)
+
+
+def clean_cue_text(text: str) -> str:
+    """Remove markup, decode entities and collapse whitespace in cue text.
+
+    Args:
+        text: Raw cue text
+
+    Returns:
+        Cleaned text
+    """
+    if "<" in text:
+        text = _TAG_RE.sub("", text)
+    if "&" in text:
+        text = html.unescape(text)
+    return " ".join(text.split())
+
+
+def iter_cues(lines: Iterable[str]) -> Iterator[SubtitleCue]:
+    """Parse WebVTT or SRT lines into cues.
+
+    Cue identifiers (including SRT sequence numbers), VTT header, NOTE,
+    STYLE and REGION blocks and cues without text are skipped.
+
+    Args:
+        lines: Subtitle lines, e.g. an open text file
+
+    Yields:
+        Cues in file order
+
+    Raises:
+        ValueError: If a timing line contains a malformed timestamp
+    """
+    start = end = 0.0
+    text_lines: list[str] = []
+    in_cue = False
+    skipping = False
+
+    for raw_line in lines:
+        line = raw_line.strip()
+
+        # YouTube auto-captions put a whitespace-only line before the cue text;
+        # only a truly empty line, or whitespace after the text, ends a cue
+        if not line and in_cue and not text_lines and raw_line.strip("\r\n"):
+            continue
+
+        if not line:
+            # A blank line ends the current block
+            if in_cue and text_lines:
+                cue = _make_cue(start, end, text_lines)
+                if cue is not None:
+                    yield cue
+            in_cue = skipping = False
+            text_lines = []
+            continue
+
+        if skipping:
+            continue
+
+        if "-->" in line:
+            # Tolerate a missing blank line between two cues
+            if in_cue and text_lines:
+                cue = _make_cue(start, end, text_lines)
+                if cue is not None:
+                    yield cue
+                text_lines = []
+            match = _TIMING_RE.match(line)
+            if match is None:
+                raise ValueError(f"Invalid subtitle timing line: {line}")
+            start = parse_timestamp(match.group(1))
+            end = parse_timestamp(match.group(2))
+            in_cue = True
+        elif in_cue:
+            text_lines.append(line)
+        elif line.lstrip("\ufeff").startswith(_SKIPPED_BLOCKS):
+            skipping = True
+        # Anything else before the timing line is a cue identifier
+
+    if in_cue and text_lines:
+        cue = _make_cue(start, end, text_lines)
+        if cue is not None:
+            yield cue
+
+
+def _make_cue(start: float, end: float, text_lines: list[str]) -> SubtitleCue | None:
+    """Build a cue from its raw text lines; None if no text remains after cleaning."""
+    raw = " ".join(text_lines)
+    text = clean_cue_text(raw)
+    if not text:
+        return None
+    return SubtitleCue(start, end, text, auto_caption=_AUTO_CAPTION_RE.search(raw) is not None)
+
+
+def is_auto_caption_track(cues: Iterable[SubtitleCue]) -> bool:
+    """Check whether cues come from a YouTube auto-caption track.
+
+    Auto-captions carry inline word timings (``<00:00:01.000><c> word</c>``)
+    in their raw cue text; manual captions never do.
+
+    Args:
+        cues: Parsed cues
+
+    Returns:
+        True if any cue had auto-caption markup
+    """
+    return any(cue.auto_caption for cue in cues)
+
+
+def collapse_rolling_duplicates(
+    cues: Iterable[SubtitleCue],
+    max_gap: float = ROLLING_MAX_GAP
+) -> list[SubtitleCue]:
+    """Merge rolling auto-caption repeats into clean, non-overlapping cues.
+
+    A cue whose text starts with the whole text of the previous kept cue
+    only contributes its new words; a cue repeating it exactly just extends
+    the previous cue. Other cues are kept unchanged. Only call this for
+    tracks where is_auto_caption_track is true; manual captions would lose
+    the repeated start of a line.
+
+    Args:
+        cues: Cues in time order
+        max_gap: Largest gap in seconds for a cue to count as a repeat
+
+    Returns:
+        Normalized cues
+    """
+    result: list[SubtitleCue] = []
+    last_words: list[str] = []
+
+    for cue in cues:
+        words = cue.text.split()
+        rolled = False
+
+        if result and cue.start - result[-1].end <= max_gap:
+            previous = result[-1]
+            kept = len(last_words)
+            if words[:kept] == last_words:
+                if len(words) == kept:
+                    previous.end = max(previous.end, cue.end)
+                    continue
+                words = words[kept:]
+                rolled = True
+                if previous.end > cue.start:
+                    previous.end = cue.start
+
+        result.append(SubtitleCue(
+            cue.start, cue.end, " ".join(words) if rolled else cue.text, cue.auto_caption
+        ))
+        last_words = words
+
+    return result
+
+
+def parse_subtitle_file(path: str | Path) -> list[SubtitleCue]:
+    """Parse a WebVTT or SRT file by streaming it line by line.
+
+    Args:
+        path: Path to the subtitle file
+
+    Returns:
+        Cues in file order
+    """
+    with open(path, encoding="utf-8-sig", errors="replace") as f:
+        return list(iter_cues(f))
+
+
+_parser_pool: ProcessPoolExecutor | None = None
+
+
+def _get_parser_pool() -> ProcessPoolExecutor:
+    """Get the worker process pool used for large subtitle files."""
+    global _parser_pool
+
+    if _parser_pool is None:
+        _parser_pool = ProcessPoolExecutor(max_workers=PARSER_PROCESSES)
+
+    return _parser_pool
+
+
+def shutdown_parser_pool() -> None:
+    """Stop the worker processes used for large subtitle files, if started."""
+    global _parser_pool
+
+    if _parser_pool is not None:
+        _parser_pool.shutdown(wait=True, cancel_futures=True)
+        _parser_pool = None
+
+
+async def parse_subtitle_file_async(path: str | Path) -> list[SubtitleCue]:
+    """Parse a subtitle file without blocking the event loop.
+
+    Files of PROCESS_PARSE_MIN_BYTES or more are parsed in a worker
+    process, smaller ones in a thread.
+
+    Args:
+        path: Path to the subtitle file
+
+    Returns:
+        Cues in file order
+    """
+    path = Path(path)
+    if path.stat().st_size >= PROCESS_PARSE_MIN_BYTES:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_parser_pool(), parse_subtitle_file, path)
+    return await asyncio.to_thread(parse_subtitle_file, path)
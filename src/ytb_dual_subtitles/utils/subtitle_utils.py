@@ -27,12 +27,29 @@ class SubtitleUtils:
             >>> SubtitleUtils.format_time_to_srt(3661.5)
             '01:01:01,500'
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = int(seconds % 60)
-        milliseconds = int((seconds % 1) * 1000)
+        # 先取整到毫秒，避免浮点误差（如 4.35 % 1 = 0.3499...）
+        total_ms = max(0, round(seconds * 1000))
+        hours, remainder = divmod(total_ms, 3_600_000)
+        minutes, remainder = divmod(remainder, 60_000)
+        secs, milliseconds = divmod(remainder, 1000)
         return f"{hours:02d}:{minutes:02d}:{secs:02d},{milliseconds:03d}"
 
+    @staticmethod
+    def format_time_to_vtt(seconds: float) -> str:
+        """将秒数转换为WebVTT时间格式 (HH:MM:SS.mmm)
+
+        Args:
+            seconds: 时间（秒）
+
+        Returns:
+            WebVTT格式时间字符串
+
+        Example:
+            >>> SubtitleUtils.format_time_to_vtt(3661.5)
+            '01:01:01.500'
+        """
+        return SubtitleUtils.format_time_to_srt(seconds).replace(',', '.')
+
     @staticmethod
     def parse_srt_time(time_str: str) -> float:
         """解析SRT时间格式为秒数
@@ -76,41 +93,53 @@ class SubtitleUtils:
         if not subtitle_data or 'segments' not in subtitle_data:
             return ""
 
-        srt_content = []
-        segments = subtitle_data['segments']
-
-        for i, segment in enumerate(segments, 1):
-            start_time = SubtitleUtils.format_time_to_srt(segment.get('start_time', 0))
-            end_time = SubtitleUtils.format_time_to_srt(segment.get('end_time', 0))
-
-            # 构建文本内容
-            if mode == 'bilingual':
-                english = segment.get('english', segment.get('text', ''))
-                chinese = segment.get('chinese', '')
-                text = f"{english}
-{chinese}" if chinese else english
-            elif mode == 'english':
-                text = segment.get('english', segment.get('text', ''))
-            elif mode == 'chinese':
-                text = segment.get('chinese', segment.get('text', ''))
-            else:
-                text = segment.get('text', '')
-
-            # 构建SRT块
-            if include_sequence:
-                srt_block = f"{i}
-{start_time} --> {end_time}
-{text}
-"
-            else:
-                srt_block = f"{start_time} --> {end_time}
-{text}
-"
+        return "\n".join(
+            SubtitleUtils.format_subtitle_block(i, segment, mode, "srt", include_sequence)
+            for i, segment in enumerate(subtitle_data['segments'], 1)
+        )
 
-            srt_content.append(srt_block)
+    @staticmethod
+    def format_subtitle_block(
+        index: int,
+        segment: Dict[str, Any],
+        mode: str = "bilingual",
+        format: str = "srt",
+        include_sequence: bool = True
+    ) -> str:
+        """格式化单条字幕块（不含块之间的空行），用于逐条流式导出
+
+        Args:
+            index: 字幕序号（从 1 开始）
+            segment: 字幕片段，包含 start_time、end_time 和 text 或 english/chinese
+            mode: 导出模式 ('bilingual', 'english', 'chinese')
+            format: 字幕格式 ('srt', 'vtt')
+            include_sequence: 是否包含序号
+
+        Returns:
+            以换行结尾的字幕块
+        """
+        format_time = (
+            SubtitleUtils.format_time_to_vtt if format == "vtt"
+            else SubtitleUtils.format_time_to_srt
+        )
+        start_time = format_time(segment.get('start_time', 0))
+        end_time = format_time(segment.get('end_time', 0))
+
+        # 构建文本内容
+        if mode == 'bilingual':
+            english = segment.get('english', segment.get('text', ''))
+            chinese = segment.get('chinese', '')
+            text = f"{english}\n{chinese}" if chinese else english
+        elif mode == 'english':
+            text = segment.get('english', segment.get('text', ''))
+        elif mode == 'chinese':
+            text = segment.get('chinese') or segment.get('text', '')
+        else:
+            text = segment.get('text', '')
 
-        return "
-".join(srt_content)
+        if include_sequence:
+            return f"{index}\n{start_time} --> {end_time}\n{text}\n"
+        return f"{start_time} --> {end_time}\n{text}\n"
 
     @staticmethod
     def clean_subtitle_text(text: str) -> str:
@@ -129,8 +158,7 @@ class SubtitleUtils:
         text = re.sub(r'<[^>]+>', '', text)
 
         # 移除特殊字符和控制字符
-        text = re.sub(r'[
-	]+', ' ', text)
+        text = re.sub(r'[\n\r\t]+', ' ', text)
 
         # 标准化空白字符
         text = ' '.join(text.split())
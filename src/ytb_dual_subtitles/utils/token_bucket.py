@@ -0,0 +1,107 @@
+"""Async token bucket with adaptive backoff.
+
+Paces calls to a rate-limited API across any number of concurrent tasks.
+Tokens refill continuously at ``rate`` per second up to ``capacity``; each
+call takes one token and waits until one is available. With the default
+capacity of one token calls are spaced at least ``1 / rate`` seconds
+apart, so a provider's QPS quota is never exceeded, even in bursts.
+
+When the provider still reports rate limiting (its quota may be shared
+with other clients), ``throttle`` halves the rate and pauses all callers
+with an exponentially growing backoff; each successful call through
+``recover`` then raises the rate back towards its configured maximum in
+small steps (additive increase, multiplicative decrease).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+# Lowest rate throttling can reach, as a fraction of the configured rate
+MIN_RATE_FRACTION = 0.1
+
+# Fraction of the configured rate restored by each successful call
+RECOVERY_STEP = 0.1
+
+# Longest pause after repeated rate-limit responses, in seconds
+MAX_BACKOFF = 30.0
+
+
+class TokenBucket:
+    """Rate limiter shared by all calls to one provider."""
+
+    def __init__(self, rate: float, capacity: float = 1.0) -> None:
+        """Initialize token bucket.
+
+        Args:
+            rate: Maximum calls per second (the provider's QPS quota)
+            capacity: Largest burst of calls allowed after an idle period
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.max_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._backoff = 1.0 / rate
+        self._lock = asyncio.Lock()
+        self._stats = {'acquired': 0, 'waited': 0.0, 'throttled': 0}
+
+    async def acquire(self) -> None:
+        """Wait for and take one token; waiting callers are served in order."""
+        async with self._lock:
+            started = time.monotonic()
+            while True:
+                now = time.monotonic()
+                if now < self._paused_until:
+                    await asyncio.sleep(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    break
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+            self._stats['acquired'] += 1
+            self._stats['waited'] += time.monotonic() - started
+
+    def throttle(self, retry_after: float | None = None) -> None:
+        """Slow down after the provider reported rate limiting.
+
+        Args:
+            retry_after: Pause requested by the provider, in seconds
+        """
+        now = time.monotonic()
+        self._refill(now)
+        self.rate = max(self.max_rate * MIN_RATE_FRACTION, self.rate / 2)
+        self._tokens = 0.0
+
+        pause = retry_after if retry_after is not None else self._backoff
+        self._paused_until = max(self._paused_until, now + pause)
+        self._backoff = min(MAX_BACKOFF, self._backoff * 2)
+        self._stats['throttled'] += 1
+
+    def recover(self) -> None:
+        """Speed back up after a successful call."""
+        self._refill(time.monotonic())
+        self.rate = min(self.max_rate, self.rate + self.max_rate * RECOVERY_STEP)
+        self._backoff = 1.0 / self.max_rate
+
+    def _refill(self, now: float) -> None:
+        """Add the tokens accumulated since the last update."""
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def get_stats(self) -> dict[str, float]:
+        """Get rate limiter statistics."""
+        return {
+            **self._stats,
+            'rate': self.rate,
+            'max_rate': self.max_rate,
+        }